@@ -0,0 +1,124 @@
+import asyncio
+import inspect
+import time
+import typing
+
+from zodchy.toolbox.di import Container
+
+RESOLVES = 20_000
+
+
+def node(name: str, dependencies: list[type]) -> type:
+    namespace: dict[str, typing.Any] = {f"D{index}": dependency for index, dependency in enumerate(dependencies)}
+    arguments = "".join(f", d{index}: D{index}" for index in range(len(dependencies)))
+    names = "".join(f"d{index}, " for index in range(len(dependencies)))
+    exec(f"class {name}:\n    def __init__(self{arguments}):\n        self.args = ({names})", namespace)
+    return typing.cast(type, namespace[name])
+
+
+def chain(depth: int) -> list[type]:
+    classes: list[type] = []
+    for level in range(depth):
+        classes.append(node(f"Node{level}", classes[-1:]))
+    return classes
+
+
+def diamond(width: int) -> list[type]:
+    leaves = [node(f"Leaf{index}", []) for index in range(width)]
+    return [*leaves, node("Root", leaves)]
+
+
+class Reflective:
+    # What resolving looks like when every call inspects signatures again.
+    def __init__(self, classes: list[type]):
+        self._classes = set(classes)
+
+    async def resolve(self, contract: type) -> typing.Any:
+        hints = typing.get_type_hints(contract.__init__)
+        kwargs = {}
+        for name in inspect.signature(contract).parameters:
+            if hints.get(name) in self._classes:
+                kwargs[name] = await self.resolve(hints[name])
+        return contract(**kwargs)
+
+
+async def measure(resolve: typing.Callable[[type], typing.Awaitable[typing.Any]], contract: type) -> float:
+    started = time.perf_counter()
+    for _ in range(RESOLVES):
+        await resolve(contract)
+    return RESOLVES / (time.perf_counter() - started)
+
+
+async def main() -> None:
+    print(f"{'graph':>12}{'reflective/s':>14}{'planned/s':>12}{'frozen/s':>12}{'speedup':>9}")
+    graphs = {f"chain {depth}": chain(depth) for depth in (1, 5, 20, 50)}
+    graphs.update({f"diamond {width}": diamond(width) for width in (10,)})
+    for label, classes in graphs.items():
+        container = Container()
+        for cls in classes:
+            container.register_dependency(cls)
+        reflective = await measure(Reflective(classes).resolve, classes[-1])
+        planned = await measure(container.get_resolver().resolve, classes[-1])
+        container.freeze()
+        frozen = await measure(container.get_resolver().resolve, classes[-1])
+        print(f"{label:>12}{reflective:>14,.0f}{planned:>12,.0f}{frozen:>12,.0f}{frozen / reflective:>9.1f}")
+    for freeze in (False, True):
+        container = Container()
+        classes = chain(20)
+        for cls in classes[:-1]:
+            container.register_dependency(cls, cache_scope="container")
+        container.register_dependency(classes[-1])
+        if freeze:
+            container.freeze()
+        cached = await measure(container.get_resolver().resolve, classes[-1])
+        print(f"chain 20, scoped deps{' (frozen)' if freeze else ''}: {cached:,.0f}/s")
+    for registered in (10, 100, 1000):
+        await per_request(registered)
+    for concurrent in (False, True):
+        await latency(concurrent, 8, 0.01)
+
+
+async def per_request(registered: int) -> None:
+    # A fresh resolver per request resolving one resolver-scoped contract on
+    # top of a shared container-scoped one, with many unrelated registrations.
+    container = Container()
+    for cls in (node(f"Other{index}", []) for index in range(registered)):
+        container.register_dependency(cls, cache_scope="resolver")
+    shared = node("Shared", [])
+    scoped = node("Scoped", [shared])
+    container.register_dependency(shared, cache_scope="container")
+    container.register_dependency(scoped, cache_scope="resolver")
+    container.freeze()
+    started = time.perf_counter()
+    for _ in range(RESOLVES):
+        resolver = container.get_resolver()
+        await resolver.resolve(scoped)
+        await resolver.resolve(scoped)
+    elapsed = time.perf_counter() - started
+    print(f"new resolver per request, {registered} contracts: {RESOLVES / elapsed:,.0f} requests/s")
+
+
+async def latency(concurrent: bool, width: int, delay: float) -> None:
+    # A cold resolve of a root over independent async factories that each
+    # wait on I/O, e.g. opening connections at startup.
+    container = Container(concurrent=concurrent)
+    leaves = [node(f"Client{index}", []) for index in range(width)]
+    for leaf in leaves:
+
+        async def connect(leaf: type = leaf) -> typing.Any:
+            await asyncio.sleep(delay)
+            return leaf()
+
+        container.register_dependency(connect, leaf, cache_scope="container")
+    root = node("Startup", leaves)
+    container.register_dependency(root)
+    container.freeze()
+    started = time.perf_counter()
+    await container.get_resolver().resolve(root)
+    elapsed = time.perf_counter() - started
+    mode = "concurrent" if concurrent else "sequential"
+    print(f"cold start, {width} async factories x {delay * 1000:.0f}ms, {mode}: {elapsed * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
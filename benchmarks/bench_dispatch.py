@@ -0,0 +1,61 @@
+import time
+import typing
+
+from zodchy.codex.cqea import Command, Error, Event, Message, Query, View
+from zodchy.toolbox.processing import Dispatcher
+
+MESSAGES = 500_000
+
+
+def deepen(base: type[Message], depth: int) -> type[Message]:
+    cls = base
+    for level in range(depth):
+        cls = type(f"{base.__name__}{level}", (cls,), {})
+    return cls
+
+
+def concrete(cls: type[Message]) -> type[Message]:
+    # Query and View declare abstract methods; stub them so leaves are instantiable.
+    return type(f"{cls.__name__}Leaf", (cls,), {"__iter__": lambda self: iter(()), "data": lambda self: None})
+
+
+def handle(message: Message) -> None:
+    pass
+
+
+def isinstance_chain(message: Message) -> None:
+    if isinstance(message, Command):
+        return handle(message)
+    if isinstance(message, Query):
+        return handle(message)
+    if isinstance(message, View):
+        return handle(message)
+    if isinstance(message, Event):
+        return handle(message)
+    if isinstance(message, Error):
+        return handle(message)
+    return None
+
+
+def measure(route: typing.Callable[[Message], None], messages: list[Message]) -> float:
+    started = time.perf_counter()
+    for message in messages:
+        route(message)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    dispatcher = Dispatcher()
+    for base in (Command, Query, View, Event, Error):
+        dispatcher.register(base, handle)
+    print(f"{'depth':>6}{'isinstance ns':>15}{'dispatch ns':>13}{'speedup':>9}")
+    for depth in (0, 4, 16, 64):
+        leaves = [concrete(deepen(base, depth)) for base in (Command, Query, View, Event, Error)]
+        messages = [leaves[index % len(leaves)]() for index in range(MESSAGES)]
+        chain = measure(isinstance_chain, messages)
+        table = measure(dispatcher, messages)
+        print(f"{depth:>6}{chain / MESSAGES * 1e9:>15.0f}{table / MESSAGES * 1e9:>13.0f}{chain / table:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import datetime
+import time
+import urllib.parse
+
+from zodchy.toolbox.notation import Parser
+
+TYPES_MAP = {
+    "id": int,
+    "name": str,
+    "status": str,
+    "age": int,
+    "score": float,
+    "active": bool,
+    "created": datetime.date,
+}
+
+QUERIES = {
+    "simple": "id=42",
+    "listing": "status__in=active,pending&order_by=-created,name&limit=20&offset=40",
+    "search": "name__ilike=%25john%25&active=true&age__range=18,65&limit=50",
+    "dashboard": (
+        "status__not_in=archived,blocked&score__ge=0.5&created__range=2024-01-01,2024-12-31"
+        "&age__gt=21&name__is=null&order_by=-score&limit=100&offset=0"
+    ),
+}
+
+ITERATIONS = 100_000
+
+
+def main() -> None:
+    parser = Parser()
+    print(f"{'query':<12}{'string, parses/s':>18}{'mapping, parses/s':>20}")
+    for title, query in QUERIES.items():
+        mapping = dict(urllib.parse.parse_qsl(query))
+        results = []
+        for payload in (query, mapping):
+            parser(payload, TYPES_MAP)
+            started = time.perf_counter()
+            for _ in range(ITERATIONS):
+                parser(payload, TYPES_MAP)
+            results.append(ITERATIONS / (time.perf_counter() - started))
+        print(f"{title:<12}{results[0]:>18,.0f}{results[1]:>20,.0f}")
+
+    batch = list(QUERIES.values()) * 125
+    started = time.perf_counter()
+    for _ in range(200):
+        [parser(query, TYPES_MAP) for query in batch]
+    single = time.perf_counter() - started
+    started = time.perf_counter()
+    for _ in range(200):
+        parser.batch(batch, TYPES_MAP)
+    batched = time.perf_counter() - started
+    print(f"batch of {len(batch)}: one by one {single / 200 * 1e3:.2f} ms, batch {batched / 200 * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
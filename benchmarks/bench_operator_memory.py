@@ -0,0 +1,46 @@
+import tracemalloc
+
+from zodchy.codex.operator import ASC, EQ, GT, LIKE, NOT, SET, ClauseBit, Limit
+
+N = 100_000
+
+
+def _unslotted(cls: type) -> type:
+    # A subclass without __slots__ gets an instance __dict__ again,
+    # which is what every bit carried before the hierarchy was slotted.
+    return type(f"Dict{cls.__name__}", (cls,), {})
+
+
+FACTORIES = {
+    "EQ": (lambda c: c(5), EQ),
+    "GT": (lambda c: c(5), GT),
+    "LIKE": (lambda c: c("abc%", True), LIKE),
+    "SET": (lambda c: c(1, 2, 3), SET),
+    "NOT": (lambda c: c(EQ(5)), NOT),
+    "Limit": (lambda c: c(10), Limit),
+    "ASC": (lambda c: c(1), ASC),
+}
+
+
+def measure(factory: object, cls: type) -> float:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    items = [factory(cls) for _ in range(N)]  # type: ignore[operator]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del items
+    return size / N
+
+
+def main() -> None:
+    print(f"{'bit':<8}{'dict, B':>10}{'slots, B':>10}{'saved':>8}")
+    for name, (factory, cls) in FACTORIES.items():
+        legacy = measure(factory, _unslotted(cls))
+        slotted = measure(factory, cls)
+        print(f"{name:<8}{legacy:>10.1f}{slotted:>10.1f}{1 - slotted / legacy:>8.0%}")
+    assert not hasattr(ClauseBit(), "__dict__")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+import random
+import time
+
+from zodchy.codex.operator import ASC, DESC, Limit, Offset
+from zodchy.codex.ordering import order
+
+ROWS = 1_000_000
+
+
+def main() -> None:
+    rng = random.Random(42)
+    rows = [
+        {"id": index, "score": rng.randint(0, 1000), "name": f"user{rng.randint(0, 10_000)}"} for index in range(ROWS)
+    ]
+    scenarios = {
+        "score DESC": [("score", DESC())],
+        "score DESC, name ASC": [("score", DESC()), ("name", ASC(1))],
+    }
+    for title, keys in scenarios.items():
+        print(title)
+        print(f"{'limit':>8}{'full sort, s':>14}{'top-k, s':>10}{'speedup':>9}")
+        for limit in (10, 100, 1_000, 10_000):
+            started = time.perf_counter()
+            expected = order(keys, rows)[20 : 20 + limit]
+            full = time.perf_counter() - started
+            started = time.perf_counter()
+            page = order([*keys, ("limit", Limit(limit)), ("offset", Offset(20))], rows)
+            partial = time.perf_counter() - started
+            assert page == expected
+            print(f"{limit:>8}{full:>14.3f}{partial:>10.3f}{full / partial:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator
+
+from zodchy.codex.cqea import Event, Message
+from zodchy.toolbox.processing import AsyncPipeline
+
+MESSAGES = 200_000
+
+
+class Tick(Event):
+    __slots__ = ("value",)
+
+    def __init__(self, value: int):
+        self.value = value
+
+
+async def passthrough(stream: AsyncIterator[Message], **kwargs: object) -> AsyncIterator[Message]:
+    async for message in stream:
+        yield message
+
+
+async def measure(stages: int, messages: list[Message]) -> float:
+    pipeline = AsyncPipeline(*([passthrough] * stages))
+    started = time.perf_counter()
+    async for _ in pipeline(*messages):
+        pass
+    return time.perf_counter() - started
+
+
+async def main() -> None:
+    messages: list[Message] = [Tick(index) for index in range(MESSAGES)]
+    baseline = await measure(0, messages)
+    print(f"{'stages':>6}{'msg/s':>14}{'ns/msg/stage':>14}")
+    print(f"{0:>6}{MESSAGES / baseline:>14,.0f}{'-':>14}")
+    for stages in (1, 2, 4, 8, 16):
+        elapsed = await measure(stages, messages)
+        overhead = (elapsed - baseline) / MESSAGES / stages * 1e9
+        print(f"{stages:>6}{MESSAGES / elapsed:>14,.0f}{overhead:>14.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
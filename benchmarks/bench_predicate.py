@@ -0,0 +1,87 @@
+import functools
+import random
+import time
+import typing
+
+from zodchy.codex.operator import EQ, GE, GT, IS, LE, LIKE, LT, NE, NOT, RANGE, SET, ClauseBit, ClauseStream
+from zodchy.codex.predicate import compile_predicate, like_pattern
+
+ROWS = 1_000_000
+
+STREAM: ClauseStream = [
+    ("status", SET("active", "pending")),
+    ("age", RANGE(GE(18), LT(65))),
+    ("name", LIKE("a%")),
+    ("deleted_at", IS(None)),
+    ("score", NOT(LE(10))),
+]
+
+
+def interpret(bit: ClauseBit, value: typing.Any) -> bool:
+    if isinstance(bit, NOT):
+        return not interpret(bit.value, value)
+    if isinstance(bit, RANGE):
+        return all(interpret(bound, value) for bound in bit.value if bound is not None)
+    if isinstance(bit, SET):
+        return value in bit.value
+    if isinstance(bit, LIKE):
+        return value is not None and _like(bit.value, bit.case_sensitive).fullmatch(value) is not None
+    if isinstance(bit, IS):
+        return value is bit.value
+    if isinstance(bit, EQ):
+        return bool(value == bit.value)
+    if isinstance(bit, NE):
+        return bool(value != bit.value)
+    if value is None:
+        return False
+    if isinstance(bit, LE):
+        return bool(value <= bit.value)
+    if isinstance(bit, GE):
+        return bool(value >= bit.value)
+    if isinstance(bit, LT):
+        return bool(value < bit.value)
+    if isinstance(bit, GT):
+        return bool(value > bit.value)
+    raise TypeError(type(bit).__name__)
+
+
+_like = functools.lru_cache(like_pattern)
+
+
+def naive(row: dict[str, typing.Any]) -> bool:
+    return all(interpret(bit, row.get(field)) for field, bit in STREAM)
+
+
+def make_rows() -> list[dict[str, typing.Any]]:
+    rng = random.Random(42)
+    statuses = ["active", "pending", "archived", "blocked"]
+    names = ["alice", "bob", "anna", "carl", "Alex"]
+    return [
+        {
+            "status": rng.choice(statuses),
+            "age": rng.randint(0, 90),
+            "name": rng.choice(names),
+            "deleted_at": None if rng.random() < 0.9 else 1,
+            "score": rng.randint(0, 100),
+        }
+        for _ in range(ROWS)
+    ]
+
+
+def measure(label: str, predicate: typing.Callable[[typing.Any], bool], rows: list[dict[str, typing.Any]]) -> float:
+    started = time.perf_counter()
+    matched = sum(1 for row in rows if predicate(row))
+    elapsed = time.perf_counter() - started
+    print(f"{label:<10}{elapsed:>8.3f}s{ROWS / elapsed / 1e6:>8.2f}M rows/s  matched={matched}")
+    return elapsed
+
+
+def main() -> None:
+    rows = make_rows()
+    naive_time = measure("naive", naive, rows)
+    compiled_time = measure("compiled", compile_predicate(STREAM), rows)
+    print(f"speedup   {naive_time / compiled_time:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import concurrent.futures
+import os
+import time
+from collections.abc import Iterable, Iterator
+
+from zodchy.codex.cqea import Event, Message
+from zodchy.toolbox.processing import ProcessPoolStage
+
+MESSAGES = 2_000
+ROUNDS = 2_000
+
+
+class Job(Event):
+    __slots__ = ("value",)
+
+    def __init__(self, value: int):
+        self.value = value
+
+
+def crunch(stream: Iterable[Message], **kwargs: object) -> Iterator[Message]:
+    for message in stream:
+        assert isinstance(message, Job)
+        value = message.value
+        for _ in range(ROUNDS):
+            value = (value * 1_103_515_245 + 12_345) % 2_147_483_648
+        yield Job(value)
+
+
+def measure(stream: Iterable[Message]) -> float:
+    started = time.perf_counter()
+    for _ in stream:
+        pass
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    messages: list[Message] = [Job(index) for index in range(MESSAGES)]
+    baseline = measure(crunch(iter(messages)))
+    print(f"cpus: {os.cpu_count()}")
+    print(f"{'workers':>8}{'chunk':>8}{'msg/s':>12}{'speedup':>10}")
+    print(f"{'inline':>8}{'-':>8}{MESSAGES / baseline:>12,.0f}{1.0:>10.2f}")
+    for workers in (1, 2, 4, 8):
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            executor.submit(os.getpid).result()
+            for chunksize in (16, 128):
+                stage = ProcessPoolStage(crunch, executor=executor, chunksize=chunksize)
+                elapsed = measure(stage(iter(messages)))
+                print(f"{workers:>8}{chunksize:>8}{MESSAGES / elapsed:>12,.0f}{baseline / elapsed:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
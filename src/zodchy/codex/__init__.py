@@ -1,7 +1,13 @@
-from . import cqea, operator, types
+from . import cqea, fingerprint, operator, ordering, predicate, shape, sql, streaming, types
 
 __all__ = [
     "cqea",
+    "fingerprint",
     "operator",
+    "ordering",
+    "predicate",
+    "shape",
+    "sql",
+    "streaming",
     "types",
 ]
@@ -0,0 +1,174 @@
+import collections.abc
+import operator
+import typing
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError as e:  # pragma: no cover
+    raise ImportError("zodchy.codex.columnar requires numpy, install it with `pip install zodchy[numpy]`") from e
+
+from .operator import (
+    EQ,
+    GE,
+    GT,
+    IS,
+    LE,
+    LIKE,
+    LT,
+    NE,
+    NOT,
+    RANGE,
+    SET,
+    ClauseBit,
+    ClauseStream,
+    FilterBit,
+)
+from .ordering import slice_bounds, sort_keys
+from .predicate import like_pattern
+
+Columns: typing.TypeAlias = collections.abc.Mapping[str, npt.NDArray[typing.Any]]
+Mask: typing.TypeAlias = npt.NDArray[np.bool_]
+Indices: typing.TypeAlias = npt.NDArray[np.intp]
+
+_COMPARISONS: dict[type[FilterBit], collections.abc.Callable[[typing.Any, typing.Any], typing.Any]] = {
+    EQ: operator.eq,
+    NE: operator.ne,
+    LE: operator.le,
+    GE: operator.ge,
+    LT: operator.lt,
+    GT: operator.gt,
+}
+
+
+def mask(stream: ClauseStream, columns: Columns) -> Mask:
+    result = np.ones(_length(columns), dtype=np.bool_)
+    for field, bit in stream:
+        if isinstance(bit, FilterBit):
+            result &= _mask(bit, columns[field])
+    return result
+
+
+def select(stream: ClauseStream, columns: Columns) -> Indices:
+    clauses = tuple(stream)
+    indices = np.flatnonzero(mask(clauses, columns))
+    keys = sort_keys(clauses)
+    if keys:
+        # np.lexsort treats the last key as primary.
+        lexsort_keys = []
+        for field, descending in reversed(keys):
+            lexsort_keys.extend(_sort_keys(columns[field][indices], descending))
+        indices = indices[np.lexsort(lexsort_keys)]
+    offset, limit = slice_bounds(clauses)
+    return indices[offset : None if limit is None else offset + limit]
+
+
+def apply(stream: ClauseStream, columns: Columns) -> dict[str, npt.NDArray[typing.Any]]:
+    indices = select(stream, columns)
+    return {name: column[indices] for name, column in columns.items()}
+
+
+def _length(columns: Columns) -> int:
+    lengths = {len(column) for column in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError("All columns must have the same length")
+    return lengths.pop() if lengths else 0
+
+
+def _sort_keys(column: npt.NDArray[typing.Any], descending: bool) -> list[npt.NDArray[typing.Any]]:
+    # Missing values sort last ascending and first descending, as in
+    # ordering.order; the presence key outranks the value key.
+    present = _present(column)
+    if present.all():
+        return [_sort_key(column, descending)]
+    values = np.zeros(len(column), dtype=np.intp)
+    values[present] = np.unique(column[present], return_inverse=True)[1].reshape(-1)
+    return [-values if descending else values, present if descending else ~present]
+
+
+def _sort_key(column: npt.NDArray[typing.Any], descending: bool) -> npt.NDArray[typing.Any]:
+    if not descending:
+        return column
+    # Bitwise inversion reverses integer order without overflowing at the minimum.
+    if column.dtype == np.bool_ or np.issubdtype(column.dtype, np.integer):
+        return ~column
+    if np.issubdtype(column.dtype, np.floating):
+        return -column
+    _, ranks = np.unique(column, return_inverse=True)
+    return -ranks.reshape(-1)
+
+
+def _present(column: npt.NDArray[typing.Any]) -> Mask:
+    if column.dtype == object:
+        return np.fromiter((item is not None for item in column), dtype=np.bool_, count=len(column))
+    if np.issubdtype(column.dtype, np.floating):
+        return np.asarray(~np.isnan(column), dtype=np.bool_)
+    return np.ones(len(column), dtype=np.bool_)
+
+
+def _mask(bit: ClauseBit, column: npt.NDArray[typing.Any]) -> Mask:
+    if isinstance(bit, NOT):
+        return ~_mask(bit.value, column)
+    if isinstance(bit, RANGE):
+        result = np.ones(len(column), dtype=np.bool_)
+        for bound in bit.value:
+            if bound is not None:
+                result &= _mask(bound, column)
+        return result
+    if isinstance(bit, SET):
+        return np.isin(column, list(bit.value))
+    if isinstance(bit, IS):
+        return _is(column, bit.value)
+    if isinstance(bit, LIKE):
+        return _like(column, bit.value, bit.case_sensitive)
+    for cls, compare in _COMPARISONS.items():
+        if isinstance(bit, cls):
+            return _compare(column, compare, bit.value)
+    raise TypeError(f"Unsupported clause bit: {type(bit).__name__}")
+
+
+def _compare(
+    column: npt.NDArray[typing.Any],
+    compare: collections.abc.Callable[[typing.Any, typing.Any], typing.Any],
+    value: typing.Any,
+) -> Mask:
+    if column.dtype != object:
+        return np.asarray(compare(column, value), dtype=np.bool_)
+    # Missing values follow codex.predicate: they compare with == and != like
+    # None does and are never ordered, as NaN behaves in float columns.
+    present = _present(column)
+    missing = compare in (operator.eq, operator.ne) and bool(compare(None, value))
+    result = np.full(len(column), missing, dtype=np.bool_)
+    result[present] = compare(column[present], value)
+    return result
+
+
+def _is(column: npt.NDArray[typing.Any], value: typing.Any) -> Mask:
+    if column.dtype == object:
+        return np.fromiter((item is value for item in column), dtype=np.bool_, count=len(column))
+    if value is None:
+        return ~_present(column)
+    return np.asarray(column == value, dtype=np.bool_)
+
+
+def _like(column: npt.NDArray[typing.Any], pattern: str, case_sensitive: bool) -> Mask:
+    present = _present(column)
+    values = column[present].astype(str)
+    if not case_sensitive:
+        values = np.char.lower(values)
+        pattern = pattern.lower()
+    body = pattern.strip("%")
+    if "_" in body or "%" in body:
+        fullmatch = like_pattern(pattern, case_sensitive).fullmatch
+        matched = np.fromiter((fullmatch(item) is not None for item in values), dtype=np.bool_, count=len(values))
+    elif pattern.startswith("%") and pattern.endswith("%") and len(pattern) > 1:
+        matched = np.char.find(values, body) >= 0
+    elif pattern.startswith("%"):
+        matched = np.char.endswith(values, body)
+    elif pattern.endswith("%"):
+        matched = np.char.startswith(values, body)
+    else:
+        matched = values == body
+    result = np.zeros(len(column), dtype=np.bool_)
+    result[present] = matched
+    return result
@@ -0,0 +1,51 @@
+import hashlib
+import typing
+
+from .operator import LIKE, ClauseBit, ClauseStream, FilterBit
+
+CanonicalStream: typing.TypeAlias = tuple[tuple[str, ClauseBit], ...]
+
+
+def encode(bit: ClauseBit) -> str:
+    cls = type(bit)
+    if isinstance(bit, LIKE):
+        payload = f"{_encode_value(bit.value)},{bit.case_sensitive!r}"
+    else:
+        payload = _encode_value(bit.value)
+    return f"{cls.__module__}.{cls.__qualname__}({payload})"
+
+
+def canonicalize(stream: ClauseStream) -> CanonicalStream:
+    filters: list[tuple[str, str, ClauseBit]] = []
+    positional: list[tuple[str, ClauseBit]] = []
+    for field, bit in stream:
+        if isinstance(bit, FilterBit):
+            filters.append((field, encode(bit), bit))
+        else:
+            positional.append((field, bit))
+    filters.sort(key=lambda item: (item[0], item[1]))
+    return tuple((field, bit) for field, _, bit in filters) + tuple(positional)
+
+
+def fingerprint(stream: ClauseStream) -> str:
+    filters: list[str] = []
+    positional: list[str] = []
+    for field, bit in stream:
+        entry = f"{field!r}:{encode(bit)}"
+        if isinstance(bit, FilterBit):
+            filters.append(entry)
+        else:
+            positional.append(entry)
+    filters.sort()
+    payload = "\x00".join(filters) + "\x01" + "\x00".join(positional)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def _encode_value(value: typing.Any) -> str:
+    if isinstance(value, ClauseBit):
+        return encode(value)
+    if isinstance(value, tuple):
+        return "(" + ",".join(_encode_value(item) for item in value) + ")"
+    if isinstance(value, (set, frozenset)):
+        return "{" + ",".join(sorted(_encode_value(item) for item in value)) + "}"
+    return repr(value)
@@ -6,8 +6,13 @@ T = typing.TypeVar("T")
 
 
 class ClauseBit:
+    __slots__ = ("_data", "_hash")
+
+    _data: typing.Any
+    _hash: int
+
     def __init__(self, *data: typing.Self):
-        self._data: typing.Any = data
+        object.__setattr__(self, "_data", data)
 
     @property
     def value(self) -> typing.Any:
@@ -15,17 +20,52 @@ class ClauseBit:
 
     def __add__(self, other: typing.Self) -> 'ClauseBit':
         if type(self) is ClauseBit:
-            self._data = list(self._data)
-            self._data.append(other)
-            return self
+            return ClauseBit(*self._data, other)
         else:
             return ClauseBit(self, other)
 
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other: typing.Any) -> bool:
+        if not isinstance(other, ClauseBit):
+            return NotImplemented
+        return type(self) is type(other) and self._data == other._data
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            value = self._make_hash()
+            object.__setattr__(self, "_hash", value)
+            return value
+
+    def _make_hash(self) -> int:
+        return hash((type(self), self._data))
+
+    def __getstate__(self) -> dict[str, typing.Any]:
+        state = dict(getattr(self, "__dict__", {}))
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if name != "_hash" and hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state: dict[str, typing.Any]) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
 
 class SliceBit(ClauseBit):
+    __slots__ = ()
+
+    _data: int
+
     def __init__(self, value: int):
-        super().__init__()
-        self._data: int = value
+        object.__setattr__(self, "_data", value)
 
     @property
     def value(self) -> int:
@@ -33,22 +73,35 @@ class SliceBit(ClauseBit):
 
 
 class FilterBit(abc.ABC, ClauseBit, typing.Generic[T]):
+    __slots__ = ()
+
+    _data: T
+
     def __init__(self, value: T):
-        super().__init__()
-        self._data: T = value
+        object.__setattr__(self, "_data", value)
 
     @property
     def value(self) -> T:
         return self._data
 
     def __eq__(self, other: typing.Any) -> bool:
-        return bool(self._data == other) 
+        if isinstance(other, ClauseBit):
+            return type(self) is type(other) and bool(self._data == other._data)
+        return bool(self._data == other)
+
+    __hash__ = ClauseBit.__hash__
+
+    def _make_hash(self) -> int:
+        return hash(self._data)
 
 
 class OrderBit(abc.ABC, ClauseBit):
+    __slots__ = ()
+
+    _data: int
+
     def __init__(self, priority: int = 0):
-        super().__init__()
-        self._data: int = priority
+        object.__setattr__(self, "_data", priority)
 
     @property
     def value(self) -> int:
@@ -56,91 +109,131 @@ class OrderBit(abc.ABC, ClauseBit):
 
 
 class EQ(FilterBit, typing.Generic[T]):
+    __slots__ = ()
+
     def __init__(self, value: T):
         super().__init__(value)
 
 
 class NE(FilterBit, typing.Generic[T]):
+    __slots__ = ()
+
     def __init__(self, value: T):
         super().__init__(value)
 
 
 class LE(FilterBit, typing.Generic[T]):
+    __slots__ = ()
+
     def __init__(self, value: T):
         super().__init__(value)
 
 
 class GE(FilterBit, typing.Generic[T]):
+    __slots__ = ()
+
     def __init__(self, value: T):
         super().__init__(value)
 
 
 class LT(FilterBit, typing.Generic[T]):
+    __slots__ = ()
+
     def __init__(self, value: T):
         super().__init__(value)
 
 
 class GT(FilterBit, typing.Generic[T]):
+    __slots__ = ()
+
     def __init__(self, value: T):
         super().__init__(value)
 
 
 class IS(FilterBit, typing.Generic[T]):
+    __slots__ = ()
+
     def __init__(self, value: T):
         super().__init__(value)
 
 
 class LIKE(FilterBit, typing.Generic[T]):
+    __slots__ = ("_case_sensitive",)
+
+    _case_sensitive: bool
+
     def __init__(self, value: T, case_sensitive: bool = False):
         super().__init__(value)
-        self._case_sensitive: bool = case_sensitive
+        object.__setattr__(self, "_case_sensitive", case_sensitive)
 
     def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ClauseBit):
+            return NotImplemented
         if not isinstance(other, type(self)):
-            raise NotImplementedError
+            return False
         return self._data == other.value and self._case_sensitive == other.case_sensitive
 
+    __hash__ = ClauseBit.__hash__
+
+    def _make_hash(self) -> int:
+        return hash((type(self), self._data, self._case_sensitive))
+
     @property
     def case_sensitive(self) -> bool:
         return self._case_sensitive
 
 
 class SET(FilterBit, typing.Generic[T]):
+    __slots__ = ()
+
     def __init__(self, *value: T):
-        super().__init__(set(value))
+        super().__init__(frozenset(value))
 
 
 class RANGE(FilterBit, typing.Generic[T]):
+    __slots__ = ()
+
     def __init__(self, left: GE[T] | GT[T] | None, right: LE[T] | LT[T] | None):
         super().__init__((left, right))
 
 
 class NOT(FilterBit, typing.Generic[T]):
+    __slots__ = ()
+
+    _data: EQ[T] | LE[T] | GE[T] | LT[T] | GT[T] | IS[T] | LIKE[T] | SET[T] | RANGE[T]
+
     def __init__(self, value: EQ[T] | LE[T] | GE[T] | LT[T] | GT[T] | IS[T] | LIKE[T] | SET[T] | RANGE[T]):
         super().__init__(value)
-        self._value = value
+
+    @property
+    def _value(self) -> EQ[T] | LE[T] | GE[T] | LT[T] | GT[T] | IS[T] | LIKE[T] | SET[T] | RANGE[T]:
+        return self._data
 
     def __eq__(self, other: typing.Any) -> bool:
-        if hasattr(other, "value"):
+        if isinstance(other, ClauseBit):
+            return super().__eq__(other)
+        elif hasattr(other, "value"):
             return super().__eq__(other.value)
         else:
             return super().__eq__(other)
 
+    __hash__ = FilterBit.__hash__
+
 
 class Limit(SliceBit):
-    pass
+    __slots__ = ()
 
 
 class Offset(SliceBit):
-    pass
+    __slots__ = ()
 
 
 class ASC(OrderBit):
-    pass
+    __slots__ = ()
 
 
 class DESC(OrderBit):
-    pass
+    __slots__ = ()
 
 
 ClauseStream: typing.TypeAlias = collections.abc.Iterable[tuple[str, ClauseBit]]
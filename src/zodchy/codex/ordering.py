@@ -0,0 +1,96 @@
+import collections.abc
+import heapq
+import itertools
+import operator
+import typing
+
+from .operator import DESC, ClauseBit, ClauseStream, Limit, Offset, OrderBit
+
+R = typing.TypeVar("R")
+
+SortKey: typing.TypeAlias = tuple[str, bool]
+
+
+class _Descending:
+    __slots__ = ("value",)
+
+    def __init__(self, value: typing.Any):
+        self.value = value
+
+    def __lt__(self, other: "_Descending") -> bool:
+        return bool(other.value < self.value)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Descending) and bool(self.value == other.value)
+
+
+def sort_keys(stream: ClauseStream) -> list[SortKey]:
+    # Lower priority values sort first; equal priorities keep stream order.
+    bits = [(field, bit) for field, bit in stream if isinstance(bit, OrderBit)]
+    bits.sort(key=lambda item: item[1].value)
+    return [(field, isinstance(bit, DESC)) for field, bit in bits]
+
+
+def slice_bounds(stream: ClauseStream) -> tuple[int, int | None]:
+    limit: int | None = None
+    offset = 0
+    for _, bit in stream:
+        if isinstance(bit, Limit):
+            limit = bit.value
+        elif isinstance(bit, Offset):
+            offset = bit.value
+    return offset, limit
+
+
+def order(stream: ClauseStream, rows: collections.abc.Iterable[R], attribute: bool = False) -> list[R]:
+    clauses: tuple[tuple[str, ClauseBit], ...] = tuple(stream)
+    keys = sort_keys(clauses)
+    offset, limit = slice_bounds(clauses)
+    if not keys:
+        stop = None if limit is None else offset + limit
+        return list(itertools.islice(rows, offset, stop))
+    directions = {descending for _, descending in keys}
+    if len(directions) == 1:
+        descending = directions.pop()
+        key = _key_function(keys, attribute, mixed=False)
+        if limit is None:
+            return sorted(rows, key=key, reverse=descending)[offset:]
+        select = heapq.nlargest if descending else heapq.nsmallest
+        return select(offset + limit, rows, key=key)[offset:]
+    if limit is None:
+        # Stable multi-pass sort, least significant key first.
+        result = list(rows)
+        for field, descending in reversed(keys):
+            result.sort(key=_key_function([(field, descending)], attribute, mixed=False), reverse=descending)
+        return result[offset:]
+    return heapq.nsmallest(offset + limit, rows, key=_key_function(keys, attribute, mixed=True))[offset:]
+
+
+def _key_function(
+    keys: list[SortKey],
+    attribute: bool,
+    mixed: bool,
+) -> collections.abc.Callable[[typing.Any], typing.Any]:
+    getters = [
+        (operator.attrgetter(field) if attribute else operator.methodcaller("get", field), mixed and descending)
+        for field, descending in keys
+    ]
+    # None sorts last ascending and first descending.
+    if len(getters) == 1 and not mixed:
+        getter = getters[0][0]
+
+        def single(row: typing.Any) -> tuple[bool, typing.Any]:
+            value = getter(row)
+            return value is None, value
+
+        return single
+
+    def key(row: typing.Any) -> tuple[typing.Any, ...]:
+        parts = []
+        for getter, wrap in getters:
+            value = getter(row)
+            part = (value is None, value)
+            parts.append(_Descending(part) if wrap else part)
+        return tuple(parts)
+
+    return key
@@ -0,0 +1,97 @@
+import collections
+import collections.abc
+import re
+import threading
+import typing
+
+from .fingerprint import fingerprint
+from .operator import EQ, GE, GT, IS, LE, LIKE, LT, NE, NOT, RANGE, SET, ClauseBit, ClauseStream, FilterBit
+
+Predicate: typing.TypeAlias = collections.abc.Callable[[typing.Any], bool]
+
+_CACHE_SIZE = 1024
+_cache: collections.OrderedDict[tuple[str, bool], Predicate] = collections.OrderedDict()
+_cache_lock = threading.Lock()
+
+_COMPARISONS: dict[type[FilterBit], str] = {LE: "<=", GE: ">=", LT: "<", GT: ">"}
+
+
+def like_pattern(pattern: str, case_sensitive: bool = False) -> re.Pattern[str]:
+    parts = []
+    for char in pattern:
+        if char == "%":
+            parts.append(".*")
+        elif char == "_":
+            parts.append(".")
+        else:
+            parts.append(re.escape(char))
+    flags = re.DOTALL if case_sensitive else re.DOTALL | re.IGNORECASE
+    return re.compile("".join(parts), flags)
+
+
+def compile_predicate(stream: ClauseStream, attribute: bool = False) -> Predicate:
+    clauses = tuple(stream)
+    key = (fingerprint(clauses), attribute)
+    with _cache_lock:
+        predicate = _cache.get(key)
+        if predicate is not None:
+            _cache.move_to_end(key)
+            return predicate
+    predicate = _compile(clauses, attribute)
+    with _cache_lock:
+        _cache[key] = predicate
+        if len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return predicate
+
+
+def clear_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
+
+
+def _compile(clauses: tuple[tuple[str, ClauseBit], ...], attribute: bool) -> Predicate:
+    conditions: dict[str, list[str]] = {}
+    constants: dict[str, typing.Any] = {}
+    for field, bit in clauses:
+        if isinstance(bit, FilterBit):
+            conditions.setdefault(field, []).append(_expression(bit, constants))
+    lines = ["def predicate(row):"]
+    for field, expressions in conditions.items():
+        if attribute:
+            lines.append(f"    value = getattr(row, {field!r}, None)")
+        else:
+            lines.append(f"    value = row.get({field!r})")
+        lines.append(f"    if not ({' and '.join(expressions)}):")
+        lines.append("        return False")
+    lines.append("    return True")
+    namespace = dict(constants)
+    exec(compile("\n".join(lines), "<zodchy.codex.predicate>", "exec"), namespace)
+    return typing.cast(Predicate, namespace["predicate"])
+
+
+def _expression(bit: ClauseBit, constants: dict[str, typing.Any]) -> str:
+    def constant(value: typing.Any) -> str:
+        name = f"_c{len(constants)}"
+        constants[name] = value
+        return name
+
+    if isinstance(bit, NOT):
+        return f"not ({_expression(bit.value, constants)})"
+    if isinstance(bit, RANGE):
+        bounds = [_expression(bound, constants) for bound in bit.value if bound is not None]
+        return " and ".join(bounds) or "True"
+    if isinstance(bit, SET):
+        return f"value in {constant(bit.value)}"
+    if isinstance(bit, LIKE):
+        return f"value is not None and {constant(like_pattern(bit.value, bit.case_sensitive).fullmatch)}(value) is not None"
+    if isinstance(bit, IS):
+        return f"value is {constant(bit.value)}"
+    if isinstance(bit, EQ):
+        return f"value == {constant(bit.value)}"
+    if isinstance(bit, NE):
+        return f"value != {constant(bit.value)}"
+    for cls, operator in _COMPARISONS.items():
+        if isinstance(bit, cls):
+            return f"value is not None and value {operator} {constant(bit.value)}"
+    raise TypeError(f"Unsupported clause bit: {type(bit).__name__}")
@@ -0,0 +1,129 @@
+import collections
+import threading
+import typing
+
+from .operator import IS, LIKE, NOT, RANGE, SET, ClauseBit, ClauseStream, FilterBit, Limit, Offset, OrderBit
+
+ShapeKey: typing.TypeAlias = tuple[tuple[str, typing.Any], ...]
+
+
+class Shape:
+    __slots__ = ("key", "_hash")
+
+    def __init__(self, key: ShapeKey):
+        self.key = key
+        self._hash = hash(key)
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        return tuple(field for field, _ in self.key)
+
+    @property
+    def has_limit(self) -> bool:
+        return any(item is Limit for _, item in self.key)
+
+    @property
+    def has_offset(self) -> bool:
+        return any(item is Offset for _, item in self.key)
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, Shape):
+            return NotImplemented
+        return self._hash == other._hash and self.key == other.key
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"Shape({self.key!r})"
+
+
+class ShapeTable:
+    def __init__(self, maxsize: int = 4096):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self._maxsize = maxsize
+        self._shapes: collections.OrderedDict[ShapeKey, Shape] = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def intern(self, stream: ClauseStream) -> Shape:
+        key = shape_key(stream)
+        with self._lock:
+            shape = self._shapes.get(key)
+            if shape is not None:
+                self._shapes.move_to_end(key)
+                self.hits += 1
+                return shape
+            shape = self._shapes[key] = Shape(key)
+            self.misses += 1
+            if len(self._shapes) > self._maxsize:
+                self._shapes.popitem(last=False)
+                self.evictions += 1
+            return shape
+
+    def clear(self) -> None:
+        with self._lock:
+            self._shapes.clear()
+
+    def __len__(self) -> int:
+        return len(self._shapes)
+
+
+shapes = ShapeTable()
+
+
+def shape_of(stream: ClauseStream) -> Shape:
+    return shapes.intern(stream)
+
+
+def shape_key(stream: ClauseStream) -> ShapeKey:
+    return tuple((field, signature(bit)) for field, bit in stream)
+
+
+def signature(bit: ClauseBit) -> typing.Any:
+    if isinstance(bit, NOT):
+        return NOT, signature(bit.value)
+    if isinstance(bit, RANGE):
+        return RANGE, *(None if bound is None else signature(bound) for bound in bit.value)
+    if isinstance(bit, SET):
+        return SET, len(bit.value)
+    if isinstance(bit, LIKE):
+        return LIKE, bit.case_sensitive
+    if isinstance(bit, IS):
+        # The type keeps IS(1) and IS(0.0) apart from IS(True) and IS(False).
+        return IS, type(bit.value), bit.value
+    if isinstance(bit, OrderBit):
+        return type(bit), bit.value
+    return type(bit)
+
+
+def values(stream: ClauseStream) -> list[typing.Any]:
+    result: list[typing.Any] = []
+    limit: list[typing.Any] = []
+    offset: list[typing.Any] = []
+    for _, bit in stream:
+        if isinstance(bit, FilterBit):
+            _collect(bit, result)
+        elif isinstance(bit, Limit):
+            limit = [bit.value]
+        elif isinstance(bit, Offset):
+            offset = [bit.value]
+    return result + limit + offset
+
+
+def _collect(bit: ClauseBit, result: list[typing.Any]) -> None:
+    if isinstance(bit, NOT):
+        _collect(bit.value, result)
+    elif isinstance(bit, RANGE):
+        for bound in bit.value:
+            if bound is not None:
+                _collect(bound, result)
+    elif isinstance(bit, SET):
+        result.extend(bit.value)
+    elif not isinstance(bit, IS):
+        result.append(bit.value)
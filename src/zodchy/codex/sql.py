@@ -0,0 +1,154 @@
+import collections
+import collections.abc
+import itertools
+import threading
+import typing
+
+from .operator import (
+    EQ,
+    GE,
+    GT,
+    IS,
+    LE,
+    LIKE,
+    LT,
+    NE,
+    NOT,
+    RANGE,
+    SET,
+    ClauseBit,
+    ClauseStream,
+    FilterBit,
+    Limit,
+    Offset,
+)
+from .ordering import sort_keys
+from .shape import Shape, shape_of, values
+
+ParamStyle: typing.TypeAlias = typing.Literal["qmark", "numeric", "named", "format", "pyformat", "dollar"]
+Params: typing.TypeAlias = tuple[typing.Any, ...] | dict[str, typing.Any]
+
+_COMPARISONS: dict[type[FilterBit], str] = {EQ: "=", NE: "<>", LE: "<=", GE: ">=", LT: "<", GT: ">"}
+_IS_LITERALS: dict[typing.Any, str] = {None: "NULL", True: "TRUE", False: "FALSE"}
+
+
+class Statement(typing.NamedTuple):
+    text: str
+    params: Params
+
+
+class SQLCompiler:
+    def __init__(
+        self,
+        table: str,
+        columns: collections.abc.Sequence[str] | None = None,
+        style: ParamStyle = "qmark",
+        cache_size: int = 256,
+        unlimited: str = "-1",
+    ):
+        if style not in typing.get_args(ParamStyle):
+            raise ValueError(f"Unknown placeholder style: {style}")
+        # The table name comes from code and is used verbatim; field names may
+        # come from user input and are always quoted.
+        selection = "*" if columns is None else ", ".join(quote(column) for column in columns)
+        self._select = f"SELECT {selection} FROM {table}"
+        self._style = style
+        # OFFSET needs a LIMIT in front of it on sqlite and MySQL; this is what
+        # stands in when the stream has none ("-1" for sqlite, "ALL" for
+        # PostgreSQL, "18446744073709551615" for MySQL).
+        self._unlimited = unlimited
+        self._cache_size = cache_size
+        self._cache: collections.OrderedDict[Shape, str] = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, stream: ClauseStream) -> Statement:
+        clauses: tuple[tuple[str, ClauseBit], ...] = tuple(stream)
+        key = shape_of(clauses)
+        with self._lock:
+            text = self._cache.get(key)
+            if text is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+        if text is None:
+            text = self._compile(clauses)
+            with self._lock:
+                self.misses += 1
+                self._cache[key] = text
+                if len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+        params = values(clauses)
+        if self._style in ("named", "pyformat"):
+            return Statement(text, {f"p{index}": value for index, value in enumerate(params)})
+        return Statement(text, tuple(params))
+
+    def _compile(self, clauses: tuple[tuple[str, ClauseBit], ...]) -> str:
+        counter = itertools.count(1)
+
+        def placeholder() -> str:
+            index = next(counter)
+            match self._style:
+                case "qmark":
+                    return "?"
+                case "numeric":
+                    return f":{index}"
+                case "named":
+                    return f":p{index - 1}"
+                case "format":
+                    return "%s"
+                case "pyformat":
+                    return f"%(p{index - 1})s"
+                case _:
+                    return f"${index}"
+
+        conditions = [
+            _condition(quote(field), bit, placeholder) for field, bit in clauses if isinstance(bit, FilterBit)
+        ]
+        parts = [self._select]
+        if conditions:
+            parts.append("WHERE " + " AND ".join(conditions))
+        keys = sort_keys(clauses)
+        if keys:
+            parts.append("ORDER BY " + ", ".join(f"{quote(field)} {'DESC' if desc else 'ASC'}" for field, desc in keys))
+        offset = any(isinstance(bit, Offset) for _, bit in clauses)
+        if any(isinstance(bit, Limit) for _, bit in clauses):
+            parts.append(f"LIMIT {placeholder()}")
+        elif offset:
+            parts.append(f"LIMIT {self._unlimited}")
+        if offset:
+            parts.append(f"OFFSET {placeholder()}")
+        return " ".join(parts)
+
+
+def quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _condition(column: str, bit: ClauseBit, placeholder: collections.abc.Callable[[], str]) -> str:
+    if isinstance(bit, NOT):
+        return f"NOT ({_condition(column, bit.value, placeholder)})"
+    if isinstance(bit, RANGE):
+        bounds = [_condition(column, bound, placeholder) for bound in bit.value if bound is not None]
+        return "(" + " AND ".join(bounds) + ")" if bounds else "1 = 1"
+    if isinstance(bit, SET):
+        if not bit.value:
+            return "1 = 0"
+        return f"{column} IN ({', '.join(placeholder() for _ in bit.value)})"
+    if isinstance(bit, LIKE):
+        # Case sensitive LIKE is left to the database: PostgreSQL matches case
+        # sensitively, while sqlite and MySQL's default collations do not
+        # (sqlite needs PRAGMA case_sensitive_like = ON).
+        if bit.case_sensitive:
+            return f"{column} LIKE {placeholder()}"
+        return f"LOWER({column}) LIKE LOWER({placeholder()})"
+    if isinstance(bit, IS):
+        # Compared by identity so that IS(1) is not taken for IS(True).
+        literal = next((text for value, text in _IS_LITERALS.items() if bit.value is value), None)
+        if literal is None:
+            raise ValueError(f"IS supports only None, True and False, got {bit.value!r}")
+        return f"{column} IS {literal}"
+    for cls, operator in _COMPARISONS.items():
+        if isinstance(bit, cls):
+            return f"{column} {operator} {placeholder()}"
+    raise TypeError(f"Unsupported clause bit: {type(bit).__name__}")
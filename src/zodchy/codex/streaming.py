@@ -0,0 +1,66 @@
+import collections.abc
+import typing
+
+from .operator import ClauseBit, ClauseStream
+from .ordering import slice_bounds
+from .predicate import compile_predicate
+
+R = typing.TypeVar("R")
+
+
+def iterate(
+    stream: ClauseStream,
+    rows: collections.abc.Iterable[R],
+    attribute: bool = False,
+) -> collections.abc.Iterator[R]:
+    clauses: tuple[tuple[str, ClauseBit], ...] = tuple(stream)
+    predicate = compile_predicate(clauses, attribute)
+    offset, limit = slice_bounds(clauses)
+    iterator = iter(rows)
+    try:
+        if limit == 0:
+            return
+        emitted = 0
+        for row in iterator:
+            if not predicate(row):
+                continue
+            if offset:
+                offset -= 1
+                continue
+            yield row
+            emitted += 1
+            if emitted == limit:
+                return
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
+
+
+async def aiterate(
+    stream: ClauseStream,
+    rows: collections.abc.AsyncIterable[R],
+    attribute: bool = False,
+) -> collections.abc.AsyncIterator[R]:
+    clauses: tuple[tuple[str, ClauseBit], ...] = tuple(stream)
+    predicate = compile_predicate(clauses, attribute)
+    offset, limit = slice_bounds(clauses)
+    iterator = aiter(rows)
+    try:
+        if limit == 0:
+            return
+        emitted = 0
+        async for row in iterator:
+            if not predicate(row):
+                continue
+            if offset:
+                offset -= 1
+                continue
+            yield row
+            emitted += 1
+            if emitted == limit:
+                return
+    finally:
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
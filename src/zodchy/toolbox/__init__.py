@@ -1,3 +1,3 @@
-from . import di, identity, notation, processing
+from . import cache, di, identity, notation, processing
 
-__all__ = ["di", "identity", "notation", "processing"]
+__all__ = ["cache", "di", "identity", "notation", "processing"]
@@ -0,0 +1,140 @@
+import collections
+import collections.abc
+import dataclasses
+import math
+import time
+import typing
+
+from ..codex.cqea import Query, View
+from ..codex.fingerprint import fingerprint
+
+K = typing.TypeVar("K", bound=collections.abc.Hashable)
+V = typing.TypeVar("V")
+
+QueryCacheKey: typing.TypeAlias = tuple[type[Query], str]
+
+
+@dataclasses.dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class LRUCache(typing.Generic[K, V]):
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float | None = None,
+        clock: collections.abc.Callable[[], float] = time.monotonic,
+        maxweight: int | None = None,
+        weigher: collections.abc.Callable[[K, V], int] | None = None,
+    ):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if maxweight is not None and weigher is None:
+            raise ValueError("maxweight requires a weigher")
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._clock = clock
+        self._maxweight = maxweight
+        self._weigher = weigher
+        self._entries: collections.OrderedDict[K, tuple[V, float, int]] = collections.OrderedDict()
+        self.weight = 0
+        self.stats = CacheStats()
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        value, expires_at, weight = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self.weight -= weight
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        expires_at = math.inf if self._ttl is None else self._clock() + self._ttl
+        weight = 0 if self._weigher is None else self._weigher(key, value)
+        if self._maxweight is not None and weight > self._maxweight:
+            self.pop(key)
+            return
+        previous = self._entries.get(key)
+        if previous is not None:
+            self.weight -= previous[2]
+        self._entries[key] = (value, expires_at, weight)
+        self._entries.move_to_end(key)
+        self.weight += weight
+        while len(self._entries) > self._maxsize or (self._maxweight is not None and self.weight > self._maxweight):
+            _, (_, _, evicted) = self._entries.popitem(last=False)
+            self.weight -= evicted
+            self.stats.evictions += 1
+
+    def pop(self, key: K) -> V | None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        self.weight -= entry[2]
+        return entry[0]
+
+    def keys(self) -> list[K]:
+        return list(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.weight = 0
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class QueryCache:
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float | None = None,
+        clock: collections.abc.Callable[[], float] = time.monotonic,
+    ):
+        self._cache: LRUCache[QueryCacheKey, View] = LRUCache(maxsize, ttl, clock)
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._cache.stats
+
+    @staticmethod
+    def key(query: Query) -> QueryCacheKey:
+        return type(query), fingerprint(query.__iter__())
+
+    def get(self, query: Query) -> View | None:
+        return self._cache.get(self.key(query))
+
+    def set(self, query: Query, view: View) -> None:
+        self._cache.set(self.key(query), view)
+
+    def invalidate(self, query_type: type[Query] | None = None) -> None:
+        if query_type is None:
+            self._cache.clear()
+            return
+        for key in self._cache.keys():
+            if issubclass(key[0], query_type):
+                self._cache.pop(key)
+
+    def __len__(self) -> int:
+        return len(self._cache)
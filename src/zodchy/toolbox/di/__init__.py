@@ -0,0 +1,37 @@
+from . import compiler, concurrency, container, plan, providers, shutdown
+from .container import Container, Resolver
+from .contracts import (
+    DependencyCallback,
+    DependencyCallbackContext,
+    DependencyContext,
+    DependencyContract,
+    DependencyImplementation,
+    DIContainerContract,
+    DIResolverContract,
+    ResolverContext,
+    ShutdownContext,
+)
+from .shutdown import CallbackTiming, ShutdownError, ShutdownReport
+
+__all__ = [
+    "DependencyContract",
+    "DependencyImplementation",
+    "DependencyContext",
+    "ShutdownContext",
+    "ResolverContext",
+    "DependencyCallbackContext",
+    "DependencyCallback",
+    "DIResolverContract",
+    "DIContainerContract",
+    "Container",
+    "Resolver",
+    "CallbackTiming",
+    "ShutdownReport",
+    "ShutdownError",
+    "compiler",
+    "concurrency",
+    "container",
+    "plan",
+    "providers",
+    "shutdown",
+]
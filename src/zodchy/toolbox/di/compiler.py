@@ -0,0 +1,181 @@
+import collections.abc
+import typing
+
+from .concurrency import cached, gather, single_flight
+from .contracts import DependencyContract
+from .plan import BUILD, CACHED, MISSING, Plan, Planner, Step, cycle, name
+from .providers import EMPTY, Provider
+
+Compiled: typing.TypeAlias = collections.abc.Callable[[typing.Any], collections.abc.Awaitable[typing.Any]]
+
+
+def sort(
+    providers: collections.abc.Mapping[DependencyContract, Provider],
+    context: collections.abc.Iterable[DependencyContract] = (),
+) -> tuple[DependencyContract, ...]:
+    provided = set(context)
+    order: list[DependencyContract] = []
+    done: set[DependencyContract] = set()
+    stack: list[DependencyContract] = []
+    missing: list[str] = []
+
+    def visit(contract: DependencyContract) -> None:
+        if contract in done:
+            return
+        if contract in stack:
+            raise ValueError(f"Circular dependency: {cycle(stack, contract)}")
+        stack.append(contract)
+        for parameter in providers[contract].parameters:
+            dependency = parameter.contract
+            if dependency is None:
+                continue
+            if dependency in providers:
+                visit(dependency)
+            elif dependency not in provided and parameter.default is EMPTY:
+                missing.append(f"{name(dependency)} (required by {name(contract)})")
+        stack.pop()
+        done.add(contract)
+        order.append(contract)
+
+    for contract in providers:
+        visit(contract)
+    if missing:
+        raise LookupError(f"Unregistered dependencies: {', '.join(missing)}")
+    return tuple(order)
+
+
+def generate(
+    planner: Planner,
+    contracts: collections.abc.Iterable[DependencyContract],
+    concurrent: bool = False,
+) -> dict[DependencyContract, Compiled]:
+    generator = _Generator(concurrent)
+    entries = {contract: generator.function(planner.entry(contract), True) for contract in contracts}
+    namespace = generator.namespace
+    exec(compile("\n".join(generator.lines), "<zodchy.toolbox.di.compiler>", "exec"), namespace)
+    return {contract: namespace[function] for contract, function in entries.items()}
+
+
+def _missing(contract: DependencyContract) -> typing.NoReturn:
+    raise LookupError(f"Dependency {name(contract)} is not registered")
+
+
+class _Generator:
+    # Every plan becomes one straight-line function. Entry functions are
+    # coroutines; functions that build cached dependencies stay plain
+    # functions unless something in them has to be awaited.
+    def __init__(self, concurrent: bool) -> None:
+        self.lines: list[str] = []
+        self.namespace: dict[str, typing.Any] = {
+            "MISSING": MISSING,
+            "missing": _missing,
+            "single_flight": single_flight,
+            "cached": cached,
+            "gather": gather,
+        }
+        self._concurrent = concurrent
+        self._functions: dict[tuple[int, bool], str] = {}
+        self._constants: dict[int, str] = {}
+
+    def function(self, plan: Plan, entry: bool) -> str:
+        key = (id(plan), entry)
+        if key not in self._functions:
+            self._functions[key] = self._generate(plan, entry)
+        return self._functions[key]
+
+    def _constant(self, value: typing.Any) -> str:
+        key = id(value)
+        if key not in self._constants:
+            self._constants[key] = f"_c{len(self._constants)}"
+            self.namespace[self._constants[key]] = value
+        return self._constants[key]
+
+    def _generate(self, plan: Plan, entry: bool) -> str:
+        prelude: dict[str, str] = {}
+        body: list[str] = []
+        for slot, value in plan.constants:
+            body.append(f"    v{slot} = {self._constant(value)}")
+        for level in plan.levels if self._concurrent else [(step,) for step in plan.steps]:
+            branches = [step for step in level if step.awaits]
+            for step in level:
+                if len(branches) < 2 or not step.awaits:
+                    body.extend(self._step(step, prelude))
+            if len(branches) > 1:
+                targets = "".join(f"v{step.slot}, " for step in branches)
+                awaitables = ", ".join(self._awaitable(step, prelude) for step in branches)
+                if all(step.kind == CACHED for step in branches):
+                    # Once everything is cached there is nothing to run concurrently,
+                    # so probe first and only pay for tasks on a miss.
+                    for step in branches:
+                        instances = _scoped(prelude, typing.cast(Provider, step.provider).scope, "instances")
+                        body.append(f"    v{step.slot} = {instances}[{step.cache_slot}]")
+                    misses = " or ".join(f"v{step.slot} is MISSING" for step in branches)
+                    body.append(f"    if {misses}:")
+                    body.append(f"        {targets}= await gather({awaitables})")
+                else:
+                    body.append(f"    {targets}= await gather({awaitables})")
+                for step in branches:
+                    body.extend(self._track(step, prelude))
+        function = f"_f{len(self._functions)}"
+        self.lines.append(f"{'async ' if entry or plan.awaits else ''}def {function}(resolver):")
+        self.lines.extend(f"    {local} = {source}" for local, source in prelude.items())
+        self.lines.extend(body)
+        self.lines.append(f"    return v{plan.result}")
+        return function
+
+    def _step(self, step: Step, prelude: dict[str, str]) -> list[str]:
+        variable = f"v{step.slot}"
+        contract = self._constant(step.contract)
+        if step.kind == BUILD:
+            provider = typing.cast(Provider, step.provider)
+            if provider.is_value:
+                return [f"    {variable} = {self._constant(provider.implementation)}", *self._track(step, prelude)]
+            call = self._call(step)
+            return [f"    {variable} = {'await ' if step.awaits else ''}{call}", *self._track(step, prelude)]
+        if step.kind == CACHED:
+            plan = typing.cast(Plan, step.plan)
+            builder = self.function(plan, False)
+            scope = typing.cast(Provider, step.provider).scope
+            instances = _scoped(prelude, scope, "instances")
+            lines = [f"    {variable} = {instances}[{step.cache_slot}]", f"    if {variable} is MISSING:"]
+            if plan.awaits:
+                pending = _scoped(prelude, scope, "pending")
+                build = f"await single_flight({pending}, {instances}, {step.cache_slot}, {builder}, resolver)"
+            else:
+                build = f"{instances}[{step.cache_slot}] = {builder}(resolver)"
+            return [*lines, f"        {variable} = {build}"]
+        prelude["context"] = "resolver._context"
+        lines = [f"    {variable} = context.get({contract}, MISSING)", f"    if {variable} is MISSING:"]
+        if step.default is EMPTY:
+            return [*lines, f"        missing({contract})"]
+        return [*lines, f"        {variable} = {self._constant(step.default)}"]
+
+    def _awaitable(self, step: Step, prelude: dict[str, str]) -> str:
+        if step.kind == BUILD:
+            return self._call(step)
+        scope = typing.cast(Provider, step.provider).scope
+        instances = _scoped(prelude, scope, "instances")
+        pending = _scoped(prelude, scope, "pending")
+        builder = self.function(typing.cast(Plan, step.plan), False)
+        return f"cached({pending}, {instances}, {step.cache_slot}, {builder}, resolver)"
+
+    def _call(self, step: Step) -> str:
+        provider = typing.cast(Provider, step.provider)
+        arguments = [f"v{slot}" for slot in step.positional]
+        arguments.extend(f"{keyword}=v{slot}" for keyword, slot in step.keywords)
+        return f"{self._constant(provider.implementation)}({', '.join(arguments)})"
+
+    def _track(self, step: Step, prelude: dict[str, str]) -> list[str]:
+        if not step.tracked:
+            return []
+        created = _scoped(prelude, typing.cast(Provider, step.provider).scope, "created")
+        return [f"    {created}.append(({self._constant(step.contract)}, v{step.slot}))"]
+
+
+def _scoped(prelude: dict[str, str], scope: str | None, attribute: str) -> str:
+    if scope == "container":
+        local, source = f"container_{attribute}", f"resolver._container._{attribute}"
+    else:
+        local, source = f"resolver_{attribute}", f"resolver._{attribute}"
+    prelude[local] = source
+    return local
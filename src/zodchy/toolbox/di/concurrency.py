@@ -0,0 +1,74 @@
+import asyncio
+import collections.abc
+import typing
+
+from .plan import MISSING
+
+Builder: typing.TypeAlias = collections.abc.Callable[[typing.Any], collections.abc.Awaitable[typing.Any]]
+
+_ABANDONED: typing.Any = object()
+
+
+async def single_flight(
+    pending: dict[int, asyncio.Future[typing.Any]],
+    instances: list[typing.Any],
+    index: int,
+    build: Builder,
+    resolver: typing.Any,
+) -> typing.Any:
+    # Whoever misses first builds; everyone who misses while that build is
+    # suspended waits for the same instance instead of creating another one.
+    while True:
+        instance = instances[index]
+        if instance is not MISSING:
+            return instance
+        future = pending.get(index)
+        if future is None:
+            break
+        instance = await asyncio.shield(future)
+        if instance is not _ABANDONED:
+            return instance
+    future = pending[index] = asyncio.get_running_loop().create_future()
+    try:
+        instance = await build(resolver)
+    except asyncio.CancelledError:
+        # Cancelling the builder concerns its caller only: the waiters were
+        # not cancelled, so one of them takes the build over.
+        future.set_result(_ABANDONED)
+        raise
+    except BaseException as e:
+        future.set_exception(e)
+        # Nobody may be waiting; mark the exception as retrieved.
+        future.exception()
+        raise
+    finally:
+        del pending[index]
+    instances[index] = instance
+    future.set_result(instance)
+    return instance
+
+
+async def cached(
+    pending: dict[int, asyncio.Future[typing.Any]],
+    instances: list[typing.Any],
+    index: int,
+    build: Builder,
+    resolver: typing.Any,
+) -> typing.Any:
+    instance = instances[index]
+    if instance is MISSING:
+        instance = await single_flight(pending, instances, index, build, resolver)
+    return instance
+
+
+async def gather(*awaitables: collections.abc.Awaitable[typing.Any]) -> list[typing.Any]:
+    # Unlike a bare asyncio.gather, a failure does not leave sibling branches
+    # running in the background.
+    tasks = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.wait(tasks)
+        raise
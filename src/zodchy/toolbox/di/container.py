@@ -0,0 +1,295 @@
+import asyncio
+import collections.abc
+import types
+import typing
+
+from .compiler import Compiled, generate, sort
+from .concurrency import gather, single_flight
+from .contracts import (
+    DependencyCallback,
+    DependencyContract,
+    DependencyImplementation,
+    ResolverContext,
+    ShutdownContext,
+)
+from .plan import BUILD, CACHED, MISSING, Plan, Planner, Step, name
+from .providers import EMPTY, Provider, Scope, analyse
+from .shutdown import ShutdownReport, run
+
+
+class Container:
+    def __init__(
+        self,
+        concurrent: bool = False,
+        callback_timeout: float | None = None,
+        shutdown_timeout: float | None = None,
+    ) -> None:
+        self._concurrent = concurrent
+        self._callback_timeout = callback_timeout
+        self._shutdown_timeout = shutdown_timeout
+        self._providers: dict[DependencyContract, Provider] = {}
+        self._callbacks: dict[DependencyContract, list[DependencyCallback]] = {}
+        self._ids: dict[DependencyContract, int] = {}
+        self._slots: dict[tuple[str, DependencyContract], int] = {}
+        self._planner = Planner(self._providers, self._callbacks, self._ids)
+        self._compiled: dict[DependencyContract, Compiled] = {}
+        self._order: tuple[DependencyContract, ...] = ()
+        self._depths: dict[DependencyContract, int] = {}
+        self._frozen = False
+        # Cached instances live in flat arrays indexed by the id each contract
+        # gets in its scope at registration; resolvers copy the empty template,
+        # which only has room for resolver-scoped contracts.
+        self._instances: list[typing.Any] = []
+        self._template: list[typing.Any] = []
+        self._created: list[tuple[DependencyContract, typing.Any]] = []
+        self._pending: dict[int, asyncio.Future[typing.Any]] = {}
+        self._shutdown_report: ShutdownReport | None = None
+
+    @property
+    def providers(self) -> collections.abc.Mapping[DependencyContract, Provider]:
+        return types.MappingProxyType(self._providers)
+
+    @property
+    def frozen(self) -> bool:
+        return self._frozen
+
+    @property
+    def shutdown_report(self) -> ShutdownReport | None:
+        return self._shutdown_report
+
+    def register_dependency(
+        self,
+        implementation: DependencyImplementation,
+        contract: DependencyContract | None = None,
+        cache_scope: Scope = None,
+    ) -> None:
+        self._check_frozen()
+        provider = analyse(implementation, contract, cache_scope)
+        self._providers[provider.contract] = provider
+        if provider.scope is not None:
+            instances = self._instances if provider.scope == "container" else self._template
+            index = self._slots.get((provider.scope, provider.contract))
+            if index is None:
+                index = self._slots[(provider.scope, provider.contract)] = len(instances)
+                instances.append(MISSING)
+            self._ids[provider.contract] = index
+            if provider.scope == "container":
+                self._instances[index] = MISSING
+        self._invalidate()
+
+    def register_callback(
+        self,
+        contract: DependencyContract,
+        callback: DependencyCallback,
+        trigger: typing.Literal["shutdown"],
+    ) -> None:
+        if trigger != "shutdown":
+            raise ValueError(f"Unknown callback trigger: {trigger}")
+        self._check_frozen()
+        self._callbacks.setdefault(contract, []).append(callback)
+        self._invalidate()
+
+    def get_resolver(self, *context: typing.Any) -> "Resolver":
+        return Resolver(self, {type(value): value for value in context})
+
+    async def shutdown(self, context: ShutdownContext | None = None) -> None:
+        created, self._created = self._created, []
+        self._instances[:] = [MISSING] * len(self._instances)
+        self._shutdown_report = ShutdownReport()
+        await self._run_callbacks(self._shutdown_report, created, context or {})
+
+    async def __aenter__(self) -> typing.Self:
+        return self
+
+    async def __aexit__(
+        self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: typing.Any
+    ) -> None:
+        await self.shutdown()
+
+    def freeze(self, context: collections.abc.Iterable[DependencyContract] = ()) -> None:
+        # Validates the whole graph before anything is resolved and replaces
+        # plan interpretation with one generated function per contract.
+        order = sort(self._providers, context)
+        self._compiled = generate(self._planner, order, self._concurrent)
+        self._order = order
+        self._frozen = True
+
+    def plan(self, contract: DependencyContract) -> Plan:
+        return self._planner.entry(contract)
+
+    def _check_frozen(self) -> None:
+        if self._frozen:
+            raise RuntimeError("Container is frozen")
+
+    def _invalidate(self) -> None:
+        self._planner.clear()
+        self._depths.clear()
+
+    async def _run_callbacks(
+        self,
+        report: ShutdownReport,
+        created: list[tuple[DependencyContract, typing.Any]],
+        context: ShutdownContext,
+    ) -> None:
+        # Dependents are shut down before what they depend on; callbacks on
+        # the same dependency level run concurrently.
+        await run(
+            report,
+            created,
+            self._callbacks,
+            self._providers,
+            self._depths,
+            context,
+            self._callback_timeout,
+            self._shutdown_timeout,
+        )
+
+
+class Resolver:
+    __slots__ = ("_container", "_context", "_instances", "_created", "_pending", "_shutdown_report")
+
+    def __init__(self, container: Container, context: dict[DependencyContract, typing.Any]):
+        self._container = container
+        self._context = context
+        self._instances = container._template.copy()
+        self._created: list[tuple[DependencyContract, typing.Any]] = []
+        self._pending: dict[int, asyncio.Future[typing.Any]] = {}
+        self._shutdown_report: ShutdownReport | None = None
+
+    @property
+    def shutdown_report(self) -> ShutdownReport | None:
+        return self._shutdown_report
+
+    async def resolve(self, contract: DependencyContract, context: ResolverContext | None = None) -> typing.Any:
+        if context:
+            self._container.plan(contract)
+            return await self._resolve_overridden(contract, context, {})
+        compiled = self._container._compiled.get(contract)
+        if compiled is not None:
+            return await compiled(self)
+        return await self._execute(self._container.plan(contract))
+
+    async def shutdown(self, context: ShutdownContext | None = None) -> None:
+        created, self._created = self._created, []
+        self._instances = self._container._template.copy()
+        self._shutdown_report = ShutdownReport()
+        await self._container._run_callbacks(self._shutdown_report, created, context or {})
+
+    async def __aenter__(self) -> typing.Self:
+        return self
+
+    async def __aexit__(
+        self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: typing.Any
+    ) -> None:
+        await self.shutdown()
+
+    async def _execute(self, plan: Plan) -> typing.Any:
+        values: list[typing.Any] = [None] * plan.size
+        for slot, value in plan.constants:
+            values[slot] = value
+        if not self._container._concurrent:
+            for step in plan.steps:
+                values[step.slot] = await self._step(step, values)
+            return values[plan.result]
+        for level in plan.levels:
+            branches = [step for step in level if step.awaits]
+            for step in level:
+                if len(branches) < 2 or not step.awaits:
+                    values[step.slot] = await self._step(step, values)
+            if len(branches) > 1:
+                results = await gather(*(self._step(step, values) for step in branches))
+                for step, result in zip(branches, results, strict=True):
+                    values[step.slot] = result
+        return values[plan.result]
+
+    async def _step(self, step: Step, values: list[typing.Any]) -> typing.Any:
+        if step.kind == BUILD:
+            return await self._build(step, values)
+        if step.kind == CACHED:
+            return await self._cached(step)
+        return self._external(step)
+
+    async def _build(self, step: Step, values: list[typing.Any]) -> typing.Any:
+        provider = typing.cast(Provider, step.provider)
+        if provider.is_value:
+            instance = provider.implementation
+        else:
+            instance = provider.implementation(
+                *[values[slot] for slot in step.positional],
+                **{name: values[slot] for name, slot in step.keywords},
+            )
+            if provider.is_async:
+                instance = await instance
+        if step.tracked:
+            created = self._container._created if provider.scope == "container" else self._created
+            created.append((step.contract, instance))
+        return instance
+
+    async def _cached(self, step: Step) -> typing.Any:
+        owner = self._container if typing.cast(Provider, step.provider).scope == "container" else self
+        cache = owner._instances
+        if step.cache_slot >= len(cache):
+            # Only possible before freezing: the contract was registered after this resolver was created.
+            cache.extend(self._container._template[len(cache) :])
+        instance = cache[step.cache_slot]
+        if instance is MISSING:
+            plan = typing.cast(Plan, step.plan)
+            if plan.awaits:
+                instance = await single_flight(
+                    owner._pending, cache, step.cache_slot, lambda _: self._execute(plan), self
+                )
+            else:
+                instance = cache[step.cache_slot] = await self._execute(plan)
+        return instance
+
+    def _external(self, step: Step) -> typing.Any:
+        try:
+            return self._context[step.contract]
+        except KeyError:
+            if step.default is not EMPTY:
+                return step.default
+            raise LookupError(f"Dependency {name(step.contract)} is not registered") from None
+
+    async def _resolve_overridden(
+        self,
+        contract: DependencyContract,
+        context: ResolverContext,
+        memo: dict[DependencyContract, typing.Any],
+    ) -> typing.Any:
+        # Overrides apply to everything built for this call; shared scoped
+        # instances are resolved the usual way and never see them.
+        if contract in context:
+            return context[contract]
+        if contract in memo:
+            return memo[contract]
+        provider = self._container._providers.get(contract)
+        if provider is None or provider.scope is not None:
+            instance = await self._execute(self._container.plan(contract))
+        else:
+            positional = []
+            keywords = {}
+            for parameter in provider.parameters:
+                if parameter.name in context:
+                    value = context[parameter.name]
+                elif parameter.contract is not None and (
+                    parameter.contract in context
+                    or parameter.contract in self._container._providers
+                    or parameter.contract in self._context
+                    or parameter.default is EMPTY
+                ):
+                    value = await self._resolve_overridden(parameter.contract, context, memo)
+                elif parameter.positional:
+                    value = parameter.default
+                else:
+                    continue
+                if parameter.positional:
+                    positional.append(value)
+                else:
+                    keywords[parameter.name] = value
+            instance = provider.implementation(*positional, **keywords)
+            if provider.is_async:
+                instance = await instance
+            if contract in self._container._callbacks:
+                self._created.append((contract, instance))
+        memo[contract] = instance
+        return instance
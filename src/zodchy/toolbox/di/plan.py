@@ -0,0 +1,163 @@
+import collections.abc
+import typing
+
+from .contracts import DependencyCallback, DependencyContract
+from .providers import EMPTY, Provider
+
+BUILD = 0
+CACHED = 1
+EXTERNAL = 2
+
+MISSING: typing.Any = object()
+
+
+class Step(typing.NamedTuple):
+    kind: int
+    slot: int
+    contract: DependencyContract
+    provider: Provider | None
+    positional: tuple[int, ...] = ()
+    keywords: tuple[tuple[str, int], ...] = ()
+    default: typing.Any = EMPTY
+    plan: "Plan | None" = None
+    tracked: bool = False
+    cache_slot: int = -1
+    awaits: bool = False
+
+
+class Plan(typing.NamedTuple):
+    steps: tuple[Step, ...]
+    constants: tuple[tuple[int, typing.Any], ...]
+    size: int
+    result: int
+    # Steps grouped by dependency depth: nothing in a level depends on
+    # anything else in the same level, so a level may run concurrently.
+    levels: tuple[tuple[Step, ...], ...] = ()
+    awaits: bool = False
+
+
+class Planner:
+    def __init__(
+        self,
+        providers: collections.abc.Mapping[DependencyContract, Provider],
+        callbacks: collections.abc.Mapping[DependencyContract, list[DependencyCallback]],
+        ids: collections.abc.Mapping[DependencyContract, int],
+    ):
+        self._providers = providers
+        self._callbacks = callbacks
+        self._ids = ids
+        self._entries: dict[DependencyContract, Plan] = {}
+        self._constructions: dict[DependencyContract, Plan] = {}
+
+    def entry(self, contract: DependencyContract) -> Plan:
+        plan = self._entries.get(contract)
+        if plan is None:
+            provider = self._providers.get(contract)
+            if provider is not None and provider.scope is None:
+                plan = self.construction(contract)
+            else:
+                plan = _Builder(self, []).build(contract, False)
+            self._entries[contract] = plan
+        return plan
+
+    def construction(self, contract: DependencyContract, stack: list[DependencyContract] | None = None) -> Plan:
+        plan = self._constructions.get(contract)
+        if plan is None:
+            plan = self._constructions[contract] = _Builder(self, stack or []).build(contract, True)
+        return plan
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._constructions.clear()
+
+
+class _Builder:
+    def __init__(self, planner: Planner, stack: list[DependencyContract]):
+        self._planner = planner
+        self._stack = stack
+        self._steps: list[Step] = []
+        self._constants: list[tuple[int, typing.Any]] = []
+        self._slots: dict[DependencyContract, int] = {}
+        self._depths: dict[int, int] = {}
+        self._size = 0
+
+    def build(self, contract: DependencyContract, root: bool) -> Plan:
+        result = self._visit(contract, EMPTY, root)
+        levels: dict[int, list[Step]] = {}
+        for step in self._steps:
+            levels.setdefault(self._depths[step.slot], []).append(step)
+        return Plan(
+            tuple(self._steps),
+            tuple(self._constants),
+            self._size,
+            result,
+            tuple(tuple(levels[depth]) for depth in sorted(levels)),
+            any(step.awaits for step in self._steps),
+        )
+
+    def _allocate(self) -> int:
+        self._size += 1
+        return self._size - 1
+
+    def _visit(self, contract: DependencyContract, default: typing.Any, root: bool) -> int:
+        if contract in self._slots:
+            return self._slots[contract]
+        if contract in self._stack:
+            raise ValueError(f"Circular dependency: {cycle(self._stack, contract)}")
+        planner = self._planner
+        provider = planner._providers.get(contract)
+        if provider is None:
+            step = Step(EXTERNAL, self._allocate(), contract, None, default=default)
+        elif provider.scope is not None and not root:
+            plan = planner.construction(contract, self._stack)
+            step = Step(
+                CACHED,
+                self._allocate(),
+                contract,
+                provider,
+                plan=plan,
+                cache_slot=planner._ids[contract],
+                awaits=plan.awaits,
+            )
+        else:
+            self._stack.append(contract)
+            try:
+                positional = []
+                keywords = []
+                for parameter in provider.parameters:
+                    if parameter.contract is not None:
+                        slot = self._visit(parameter.contract, parameter.default, False)
+                    elif parameter.positional:
+                        slot = self._allocate()
+                        self._constants.append((slot, parameter.default))
+                    else:
+                        continue
+                    if parameter.positional:
+                        positional.append(slot)
+                    else:
+                        keywords.append((parameter.name, slot))
+            finally:
+                self._stack.pop()
+            step = Step(
+                BUILD,
+                self._allocate(),
+                contract,
+                provider,
+                tuple(positional),
+                tuple(keywords),
+                tracked=contract in planner._callbacks,
+                awaits=provider.is_async,
+            )
+        arguments = [*step.positional, *(slot for _, slot in step.keywords)]
+        self._depths[step.slot] = max((self._depths.get(slot, -1) for slot in arguments), default=-1) + 1
+        self._steps.append(step)
+        self._slots[contract] = step.slot
+        return step.slot
+
+
+def cycle(stack: list[DependencyContract], contract: DependencyContract) -> str:
+    return " -> ".join(name(item) for item in [*stack[stack.index(contract) :], contract])
+
+
+def name(value: typing.Any) -> str:
+    return getattr(value, "__qualname__", None) or repr(value)
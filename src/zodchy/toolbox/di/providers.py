@@ -0,0 +1,93 @@
+import inspect
+import typing
+
+from .contracts import DependencyContract, DependencyImplementation
+
+Scope: typing.TypeAlias = typing.Literal["container", "resolver"] | None
+
+EMPTY: typing.Any = inspect.Parameter.empty
+
+
+class Parameter(typing.NamedTuple):
+    name: str
+    contract: DependencyContract | None
+    default: typing.Any
+    positional: bool
+
+
+class Provider:
+    __slots__ = ("implementation", "contract", "scope", "parameters", "is_async", "is_value")
+
+    def __init__(
+        self,
+        implementation: DependencyImplementation,
+        contract: DependencyContract,
+        scope: Scope,
+        parameters: tuple[Parameter, ...],
+        is_async: bool,
+        is_value: bool,
+    ):
+        self.implementation = implementation
+        self.contract = contract
+        self.scope = scope
+        self.parameters = parameters
+        self.is_async = is_async
+        self.is_value = is_value
+
+    def __repr__(self) -> str:
+        return f"Provider({_name(self.implementation)} -> {_name(self.contract)}, scope={self.scope})"
+
+
+def analyse(
+    implementation: DependencyImplementation,
+    contract: DependencyContract | None = None,
+    scope: Scope = None,
+) -> Provider:
+    if scope not in (None, "container", "resolver"):
+        raise ValueError(f"Unknown cache scope: {scope}")
+    if isinstance(implementation, type):
+        hints = _hints(implementation.__init__, implementation)  # type: ignore[misc]
+        parameters = _parameters(implementation, inspect.signature(implementation), hints)
+        return Provider(implementation, contract or implementation, scope, parameters, False, False)
+    if inspect.isfunction(implementation) or inspect.ismethod(implementation):
+        hints = _hints(implementation, implementation)
+        if contract is None:
+            contract = hints.get("return")
+            if contract is None:
+                raise TypeError(f"Cannot infer the contract of {_name(implementation)}: no return annotation")
+        parameters = _parameters(implementation, inspect.signature(implementation), hints)
+        return Provider(implementation, contract, scope, parameters, inspect.iscoroutinefunction(implementation), False)
+    # Anything else is a ready instance: it is shared like a container-scoped dependency.
+    return Provider(implementation, contract or type(implementation), "container", (), False, True)
+
+
+def _hints(target: typing.Any, owner: DependencyImplementation) -> dict[str, typing.Any]:
+    try:
+        return typing.get_type_hints(target)
+    except NameError as e:
+        raise TypeError(f"Cannot analyse {_name(owner)}: {e}") from e
+    except TypeError:
+        # Builtin slot wrappers such as object.__init__ carry no annotations.
+        return {}
+
+
+def _parameters(
+    implementation: DependencyImplementation,
+    signature: inspect.Signature,
+    hints: dict[str, typing.Any],
+) -> tuple[Parameter, ...]:
+    parameters = []
+    for parameter in signature.parameters.values():
+        if parameter.kind in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD):
+            continue
+        contract = hints.get(parameter.name)
+        if contract is None and parameter.default is EMPTY:
+            raise TypeError(f"Cannot resolve parameter {parameter.name!r} of {_name(implementation)}: no annotation")
+        parameters.append(
+            Parameter(parameter.name, contract, parameter.default, parameter.kind == parameter.POSITIONAL_ONLY)
+        )
+    return tuple(parameters)
+
+
+def _name(value: typing.Any) -> str:
+    return getattr(value, "__qualname__", None) or repr(value)
@@ -0,0 +1,165 @@
+import asyncio
+import collections.abc
+import dataclasses
+import inspect
+import time
+import typing
+
+from .contracts import DependencyCallback, DependencyContract, ShutdownContext
+from .plan import name
+from .providers import Provider
+
+Outcome = typing.Literal["ok", "failed", "timed_out", "cancelled", "skipped"]
+
+
+@dataclasses.dataclass(frozen=True)
+class CallbackTiming:
+    contract: DependencyContract
+    callback: DependencyCallback
+    level: int
+    outcome: Outcome
+    duration: float = 0.0
+    error: BaseException | None = None
+
+
+@dataclasses.dataclass
+class ShutdownReport:
+    callbacks: list[CallbackTiming] = dataclasses.field(default_factory=list)
+    duration: float = 0.0
+
+    @property
+    def errors(self) -> list[BaseException]:
+        return [timing.error for timing in self.callbacks if timing.error is not None]
+
+    def __str__(self) -> str:
+        lines = [f"shutdown took {self.duration * 1000:.1f}ms"]
+        for timing in self.callbacks:
+            callback = name(timing.callback)
+            lines.append(
+                f"  [{timing.level}] {name(timing.contract)} {callback}: {timing.outcome} {timing.duration * 1000:.1f}ms"
+            )
+        return "\n".join(lines)
+
+
+class ShutdownError(ExceptionGroup[Exception]):
+    report: ShutdownReport
+
+    def __new__(
+        cls, message: str, exceptions: collections.abc.Sequence[Exception], report: ShutdownReport
+    ) -> typing.Self:
+        self = super().__new__(cls, message, exceptions)
+        self.report = report
+        return self
+
+    def __init__(self, message: str, exceptions: collections.abc.Sequence[Exception], report: ShutdownReport) -> None:
+        super().__init__(message, exceptions)
+
+    def derive(self, excs: collections.abc.Sequence[Exception]) -> "ShutdownError":  # type: ignore[override]
+        return ShutdownError(self.message, excs, self.report)
+
+
+def levels(
+    created: collections.abc.Iterable[tuple[DependencyContract, typing.Any]],
+    providers: collections.abc.Mapping[DependencyContract, Provider],
+    depths: dict[DependencyContract, int],
+) -> list[list[tuple[DependencyContract, typing.Any]]]:
+    # Groups instances by how deep their contract sits in the dependency
+    # graph, deepest first: everything in a group is only depended on by
+    # groups before it, so a group can be shut down concurrently.
+    grouped: dict[int, list[tuple[DependencyContract, typing.Any]]] = {}
+    for contract, instance in created:
+        grouped.setdefault(_depth(contract, providers, depths), []).append((contract, instance))
+    return [grouped[depth] for depth in sorted(grouped, reverse=True)]
+
+
+def _depth(
+    contract: DependencyContract,
+    providers: collections.abc.Mapping[DependencyContract, Provider],
+    depths: dict[DependencyContract, int],
+) -> int:
+    depth = depths.get(contract)
+    if depth is None:
+        # A cycle cannot have been resolved; the placeholder only keeps this finite.
+        depths[contract] = 0
+        provider = providers.get(contract)
+        dependencies = [
+            parameter.contract
+            for parameter in (provider.parameters if provider is not None else ())
+            if parameter.contract is not None and parameter.contract in providers
+        ]
+        depth = depths[contract] = 1 + max((_depth(item, providers, depths) for item in dependencies), default=-1)
+    return depth
+
+
+async def run(
+    report: ShutdownReport,
+    created: list[tuple[DependencyContract, typing.Any]],
+    callbacks: collections.abc.Mapping[DependencyContract, list[DependencyCallback]],
+    providers: collections.abc.Mapping[DependencyContract, Provider],
+    depths: dict[DependencyContract, int],
+    context: ShutdownContext,
+    callback_timeout: float | None = None,
+    timeout: float | None = None,
+) -> None:
+    started = time.perf_counter()
+    loop = asyncio.get_running_loop()
+    deadline = None if timeout is None else loop.time() + timeout
+    calls = [
+        [(contract, instance, callback) for contract, instance in group for callback in callbacks.get(contract, ())]
+        for group in levels(created, providers, depths)
+    ]
+    for level, group in enumerate(calls):
+        remaining = None if deadline is None else deadline - loop.time()
+        if remaining is not None and remaining <= 0:
+            report.callbacks.extend(
+                CallbackTiming(contract, callback, level, "skipped") for contract, _, callback in group
+            )
+            continue
+        tasks = [
+            asyncio.ensure_future(_call(contract, instance, callback, level, context, callback_timeout))
+            for contract, instance, callback in group
+        ]
+        try:
+            _, pending = await asyncio.wait(tasks, timeout=remaining)
+        except asyncio.CancelledError:
+            for task in tasks:
+                task.cancel()
+            raise
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+        report.callbacks.extend(task.result() for task in tasks)
+    report.duration = time.perf_counter() - started
+    errors: list[Exception] = [error for error in report.errors if isinstance(error, Exception)]
+    skipped = sum(timing.outcome == "skipped" for timing in report.callbacks)
+    if skipped:
+        errors.append(TimeoutError(f"Shutdown timed out, {skipped} callbacks skipped"))
+    if errors:
+        raise ShutdownError("Shutdown callbacks failed", errors, report)
+
+
+async def _call(
+    contract: DependencyContract,
+    instance: typing.Any,
+    callback: DependencyCallback,
+    level: int,
+    context: ShutdownContext,
+    timeout: float | None,
+) -> CallbackTiming:
+    started = time.perf_counter()
+    limit = asyncio.timeout(timeout)
+    try:
+        # Synchronous callbacks run inline and cannot be interrupted; only
+        # awaiting is subject to the timeout.
+        result = callback(instance, context)
+        if inspect.isawaitable(result):
+            async with limit:
+                await result
+    except asyncio.CancelledError:
+        error = TimeoutError(f"Shutdown callback for {name(contract)} cancelled at the shutdown deadline")
+        return CallbackTiming(contract, callback, level, "cancelled", time.perf_counter() - started, error)
+    except Exception as e:
+        outcome: Outcome = "timed_out" if limit.expired() else "failed"
+        return CallbackTiming(contract, callback, level, outcome, time.perf_counter() - started, e)
+    return CallbackTiming(contract, callback, level, "ok", time.perf_counter() - started)
@@ -1,11 +1,41 @@
 import collections.abc
+import concurrent.futures
+import datetime
+import sys
 import typing
+import urllib.parse
 
-from ..codex.operator import ClauseStream
+from ..codex.operator import (
+    ASC,
+    DESC,
+    EQ,
+    GE,
+    GT,
+    IS,
+    LE,
+    LIKE,
+    LT,
+    NE,
+    NOT,
+    RANGE,
+    SET,
+    ClauseBit,
+    ClauseStream,
+    Limit,
+    Offset,
+)
+from .cache import CacheStats, LRUCache
 
 ParamName: typing.TypeAlias = str
 ParamValue: typing.TypeAlias = str
 
+Converter: typing.TypeAlias = collections.abc.Callable[[str], typing.Any]
+Handler: typing.TypeAlias = collections.abc.Callable[[str], ClauseBit]
+HandlerTable: typing.TypeAlias = dict[str, tuple[str, Handler]]
+FrozenStream: typing.TypeAlias = tuple[tuple[str, ClauseBit], ...]
+ParseCacheKey: typing.TypeAlias = tuple[str | tuple[tuple[ParamName, ParamValue], ...], int]
+ParseCacheEntry: typing.TypeAlias = tuple[collections.abc.Mapping[ParamName, type], FrozenStream]
+
 
 class ParserContract(typing.Protocol):
     def __call__(
@@ -13,3 +43,316 @@ class ParserContract(typing.Protocol):
         query: str | collections.abc.Mapping[ParamName, ParamValue],
         types_map: collections.abc.Mapping[ParamName, type],
     ) -> ClauseStream: ...
+
+
+class BatchParserContract(typing.Protocol):
+    def __call__(
+        self,
+        queries: collections.abc.Iterable[str | collections.abc.Mapping[ParamName, ParamValue]],
+        types_map: collections.abc.Mapping[ParamName, type],
+    ) -> collections.abc.Sequence[ClauseStream]: ...
+
+
+_IS_VALUES: dict[str, bool | None] = {"null": None, "true": True, "false": False}
+_BOOL_VALUES: dict[str, bool] = {"true": True, "1": True, "yes": True, "false": False, "0": False, "no": False}
+
+
+def _to_bool(raw: str) -> bool:
+    try:
+        return _BOOL_VALUES[raw.lower()]
+    except KeyError:
+        raise ValueError(f"Invalid boolean: {raw!r}") from None
+
+
+CONVERTERS: dict[type, Converter] = {
+    str: str,
+    int: int,
+    float: float,
+    bool: _to_bool,
+    datetime.datetime: datetime.datetime.fromisoformat,
+    datetime.date: datetime.date.fromisoformat,
+    datetime.time: datetime.time.fromisoformat,
+}
+
+
+def _scalar(cls: type[ClauseBit]) -> collections.abc.Callable[[Converter], Handler]:
+    def factory(convert: Converter) -> Handler:
+        return lambda raw: cls(convert(raw))
+
+    return factory
+
+
+def _like(case_sensitive: bool) -> collections.abc.Callable[[Converter], Handler]:
+    def factory(convert: Converter) -> Handler:
+        return lambda raw: LIKE(raw, case_sensitive=case_sensitive)
+
+    return factory
+
+
+def _set(convert: Converter) -> Handler:
+    return lambda raw: SET(*(convert(item) for item in raw.split(",")))
+
+
+def _range(convert: Converter) -> Handler:
+    def handler(raw: str) -> ClauseBit:
+        left, _, right = raw.partition(",")
+        return RANGE(GE(convert(left)) if left else None, LE(convert(right)) if right else None)
+
+    return handler
+
+
+def _is(convert: Converter) -> Handler:
+    def handler(raw: str) -> ClauseBit:
+        try:
+            return IS(_IS_VALUES[raw.lower()])
+        except KeyError:
+            raise ValueError(f"Invalid IS value: {raw!r}") from None
+
+    return handler
+
+
+OPERATORS: dict[str, collections.abc.Callable[[Converter], Handler]] = {
+    "eq": _scalar(EQ),
+    "ne": _scalar(NE),
+    "lt": _scalar(LT),
+    "le": _scalar(LE),
+    "gt": _scalar(GT),
+    "ge": _scalar(GE),
+    "like": _like(case_sensitive=True),
+    "ilike": _like(case_sensitive=False),
+    "in": _set,
+    "range": _range,
+    "is": _is,
+}
+
+
+class Parser:
+    def __init__(
+        self,
+        separator: str = "__",
+        order_param: str = "order_by",
+        limit_param: str = "limit",
+        offset_param: str = "offset",
+        tables_size: int = 256,
+    ):
+        self._separator = separator
+        self._order_param = order_param
+        self._limit_param = limit_param
+        self._offset_param = offset_param
+        self._tables_size = tables_size
+        self._tables: dict[int, tuple[collections.abc.Mapping[ParamName, type], HandlerTable]] = {}
+
+    def __call__(
+        self,
+        query: str | collections.abc.Mapping[ParamName, ParamValue],
+        types_map: collections.abc.Mapping[ParamName, type],
+    ) -> ClauseStream:
+        return self._parse(query, types_map, self.table(types_map), None)
+
+    def batch(
+        self,
+        queries: collections.abc.Iterable[str | collections.abc.Mapping[ParamName, ParamValue]],
+        types_map: collections.abc.Mapping[ParamName, type],
+        executor: concurrent.futures.Executor | None = None,
+        chunksize: int = 256,
+    ) -> list[FrozenStream]:
+        items = list(queries)
+        if executor is None or len(items) <= chunksize:
+            return self._batch(items, types_map)
+        settings = {
+            "separator": self._separator,
+            "order_param": self._order_param,
+            "limit_param": self._limit_param,
+            "offset_param": self._offset_param,
+        }
+        futures = [
+            executor.submit(_parse_chunk, type(self), settings, items[start : start + chunksize], types_map)
+            for start in range(0, len(items), chunksize)
+        ]
+        return [stream for future in futures for stream in future.result()]
+
+    def _batch(
+        self,
+        queries: list[str | collections.abc.Mapping[ParamName, ParamValue]],
+        types_map: collections.abc.Mapping[ParamName, type],
+    ) -> list[FrozenStream]:
+        table = self.table(types_map)
+        # Identical parameters across the batch share one converted clause.
+        memo: dict[tuple[str, str], list[tuple[str, ClauseBit]]] = {}
+        return [tuple(self._parse(query, types_map, table, memo)) for query in queries]
+
+    def _parse(
+        self,
+        query: str | collections.abc.Mapping[ParamName, ParamValue],
+        types_map: collections.abc.Mapping[ParamName, type],
+        table: HandlerTable,
+        memo: dict[tuple[str, str], list[tuple[str, ClauseBit]]] | None,
+    ) -> list[tuple[str, ClauseBit]]:
+        pairs = _tokenize(query) if isinstance(query, str) else query.items()
+        result: list[tuple[str, ClauseBit]] = []
+        for key, raw in pairs:
+            if memo is None:
+                result.extend(self._clauses(key, raw, types_map, table))
+                continue
+            clauses = memo.get((key, raw))
+            if clauses is None:
+                clauses = memo[key, raw] = self._clauses(key, raw, types_map, table)
+            result.extend(clauses)
+        return result
+
+    def _clauses(
+        self,
+        key: str,
+        raw: str,
+        types_map: collections.abc.Mapping[ParamName, type],
+        table: HandlerTable,
+    ) -> list[tuple[str, ClauseBit]]:
+        entry = table.get(key)
+        if entry is not None:
+            field, handler = entry
+            try:
+                return [(field, handler(raw))]
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Invalid value for {key}: {raw!r}") from e
+        if key == self._order_param:
+            return self._order(raw, types_map)
+        if key == self._limit_param:
+            return [(key, Limit(_to_count(key, raw)))]
+        if key == self._offset_param:
+            return [(key, Offset(_to_count(key, raw)))]
+        # Unknown fields are ignored, but a typo in the operator of a known
+        # field must not silently drop the filter.
+        field, separator, operator = key.rpartition(self._separator)
+        if separator and field in types_map:
+            raise ValueError(f"Unknown operator for {field}: {operator!r}")
+        return []
+
+    def table(self, types_map: collections.abc.Mapping[ParamName, type]) -> HandlerTable:
+        cached = self._tables.get(id(types_map))
+        if cached is not None and cached[0] is types_map:
+            return cached[1]
+        table = self._compile(types_map)
+        if len(self._tables) >= self._tables_size:
+            del self._tables[next(iter(self._tables))]
+        # The mapping is kept alive alongside its table so its id cannot be reused.
+        self._tables[id(types_map)] = (types_map, table)
+        return table
+
+    def _compile(self, types_map: collections.abc.Mapping[ParamName, type]) -> HandlerTable:
+        table: HandlerTable = {}
+        for field, type_ in types_map.items():
+            convert = CONVERTERS.get(type_, type_)
+            for name, factory in OPERATORS.items():
+                handler = factory(convert)
+                table[f"{field}{self._separator}{name}"] = (field, handler)
+                table[f"{field}{self._separator}not_{name}"] = (field, _negate(handler))
+            table[field] = table[f"{field}{self._separator}eq"]
+        return table
+
+    def _order(self, raw: str, types_map: collections.abc.Mapping[ParamName, type]) -> list[tuple[str, ClauseBit]]:
+        result: list[tuple[str, ClauseBit]] = []
+        for priority, item in enumerate(raw.split(",")):
+            # A leading "+" arrives as a space once the query is unquoted.
+            item = item.strip()
+            field = item.lstrip("+-")
+            if field not in types_map:
+                raise ValueError(f"Unknown order field: {field!r}")
+            result.append((field, DESC(priority) if item.startswith("-") else ASC(priority)))
+        return result
+
+
+class CachingParser:
+    def __init__(self, parser: ParserContract, maxsize: int = 1024, maxbytes: int | None = None):
+        self._parser = parser
+        # Keys hold the id of a types map. Each entry keeps its map alive, so
+        # the id cannot be reused while the entry exists, and the map is
+        # released together with its last entry.
+        self._cache: LRUCache[ParseCacheKey, ParseCacheEntry] = LRUCache(
+            maxsize, maxweight=maxbytes, weigher=_cache_entry_size
+        )
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._cache.stats
+
+    @property
+    def nbytes(self) -> int:
+        return self._cache.weight
+
+    def __call__(
+        self,
+        query: str | collections.abc.Mapping[ParamName, ParamValue],
+        types_map: collections.abc.Mapping[ParamName, type],
+    ) -> FrozenStream:
+        key: ParseCacheKey = (query if isinstance(query, str) else tuple(query.items()), id(types_map))
+        entry = self._cache.get(key)
+        if entry is not None:
+            return entry[1]
+        stream = tuple(self._parser(query, types_map))
+        self._cache.set(key, (types_map, stream))
+        return stream
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+def _cache_entry_size(key: ParseCacheKey, entry: ParseCacheEntry) -> int:
+    # The types map is shared between entries and not counted.
+    stream = entry[1]
+    payload = key[0]
+    size = sys.getsizeof(payload)
+    if not isinstance(payload, str):
+        size += sum(sys.getsizeof(item) + sys.getsizeof(item[0]) + sys.getsizeof(item[1]) for item in payload)
+    size += sys.getsizeof(stream)
+    for field, bit in stream:
+        size += sys.getsizeof((field, bit)) + sys.getsizeof(field) + _bit_size(bit)
+    return size
+
+
+def _bit_size(value: typing.Any) -> int:
+    size = sys.getsizeof(value)
+    if isinstance(value, ClauseBit):
+        size += _bit_size(value.value)
+    elif isinstance(value, (tuple, frozenset)):
+        size += sum(_bit_size(item) for item in value if item is not None)
+    return size
+
+
+def _parse_chunk(
+    cls: type[Parser],
+    settings: dict[str, typing.Any],
+    queries: list[str | collections.abc.Mapping[ParamName, ParamValue]],
+    types_map: collections.abc.Mapping[ParamName, type],
+) -> list[FrozenStream]:
+    return cls(**settings)._batch(queries, types_map)
+
+
+def _negate(handler: Handler) -> Handler:
+    return lambda raw: NOT(handler(raw))  # type: ignore[arg-type]
+
+
+def _to_count(key: str, raw: str) -> int:
+    try:
+        value = int(raw)
+    except ValueError:
+        raise ValueError(f"Invalid value for {key}: {raw!r}") from None
+    if value < 0:
+        raise ValueError(f"Invalid value for {key}: {raw!r}")
+    return value
+
+
+def _tokenize(query: str) -> collections.abc.Iterator[tuple[str, str]]:
+    if query.startswith("?"):
+        query = query[1:]
+    for token in query.split("&"):
+        key, sep, raw = token.partition("=")
+        if not sep:
+            continue
+        if "%" in key or "+" in key:
+            key = urllib.parse.unquote_plus(key)
+        if "%" in raw or "+" in raw:
+            raw = urllib.parse.unquote_plus(raw)
+        yield key, raw
@@ -0,0 +1,62 @@
+from . import batching, bridge, buffer, dispatch, instrumentation, parallel, pipeline, pool
+from .batching import AsyncBatcher, AsyncUnbatcher, Batch, SyncBatcher, SyncUnbatcher
+from .bridge import EventLoopThread, ThreadPoolStage
+from .buffer import BufferStage, BufferStats, OverflowPolicy
+from .contracts import (
+    AsyncMessageStreamContract,
+    AsyncPipelineContract,
+    AsyncProcessorContract,
+    SyncMessageStreamContract,
+    SyncPipelineContract,
+    SyncProcessorContract,
+)
+from .dispatch import Dispatcher
+from .instrumentation import (
+    AsyncInstrumentedStage,
+    CollectorContract,
+    Histogram,
+    StageStats,
+    StatsCollector,
+    SyncInstrumentedStage,
+)
+from .parallel import ParallelStage
+from .pipeline import AsyncPipeline, SyncPipeline
+from .pool import ProcessPoolStage
+
+__all__ = [
+    "AsyncMessageStreamContract",
+    "AsyncPipelineContract",
+    "AsyncProcessorContract",
+    "SyncMessageStreamContract",
+    "SyncPipelineContract",
+    "SyncProcessorContract",
+    "AsyncPipeline",
+    "SyncPipeline",
+    "Batch",
+    "AsyncBatcher",
+    "SyncBatcher",
+    "AsyncUnbatcher",
+    "SyncUnbatcher",
+    "ParallelStage",
+    "ProcessPoolStage",
+    "ThreadPoolStage",
+    "EventLoopThread",
+    "Dispatcher",
+    "BufferStage",
+    "BufferStats",
+    "OverflowPolicy",
+    "CollectorContract",
+    "Histogram",
+    "StageStats",
+    "StatsCollector",
+    "AsyncInstrumentedStage",
+    "SyncInstrumentedStage",
+    "batching",
+    "bridge",
+    "buffer",
+    "dispatch",
+    "instrumentation",
+    "parallel",
+    "pipeline",
+    "pool",
+]
@@ -0,0 +1,142 @@
+import asyncio
+import contextlib
+import time
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+from ...codex.cqea import Message
+from .contracts import AsyncMessageStreamContract, SyncMessageStreamContract
+
+_END = object()
+
+
+class Batch(Message):
+    def __init__(self, *messages: Message):
+        self._messages = messages
+
+    @property
+    def messages(self) -> tuple[Message, ...]:
+        return self._messages
+
+    def __iter__(self) -> Iterator[Message]:
+        return iter(self._messages)
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+
+class AsyncBatcher:
+    def __init__(self, max_size: int = 100, max_latency: float | None = None):
+        _validate(max_size, max_latency)
+        self._max_size = max_size
+        self._max_latency = max_latency
+
+    def __call__(self, stream: AsyncMessageStreamContract, *args: Any, **kwargs: Any) -> AsyncMessageStreamContract:
+        return self._run(stream)
+
+    async def _run(self, stream: AsyncMessageStreamContract) -> AsyncIterator[Message]:
+        loop = asyncio.get_running_loop()
+        batch: list[Message] = []
+        deadline = 0.0
+        # A pull that outlived a latency timeout; it is awaited again instead of
+        # being cancelled, which would break the upstream generator.
+        pending: asyncio.Task[Any] | None = None
+        try:
+            while True:
+                if batch and self._max_latency is not None:
+                    if pending is None:
+                        pending = asyncio.create_task(_next(stream))
+                    done, _ = await asyncio.wait((pending,), timeout=max(deadline - loop.time(), 0))
+                    if not done:
+                        yield Batch(*batch)
+                        batch = []
+                        continue
+                    item, pending = pending.result(), None
+                elif pending is not None:
+                    item, pending = await pending, None
+                else:
+                    item = await _next(stream)
+                if item is _END:
+                    break
+                if not batch and self._max_latency is not None:
+                    deadline = loop.time() + self._max_latency
+                batch.append(item)
+                if len(batch) >= self._max_size:
+                    yield Batch(*batch)
+                    batch = []
+            if batch:
+                yield Batch(*batch)
+        finally:
+            if pending is not None:
+                pending.cancel()
+                with contextlib.suppress(BaseException):
+                    await pending
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+
+class SyncBatcher:
+    def __init__(self, max_size: int = 100, max_latency: float | None = None):
+        _validate(max_size, max_latency)
+        self._max_size = max_size
+        self._max_latency = max_latency
+
+    def __call__(self, stream: SyncMessageStreamContract, *args: Any, **kwargs: Any) -> SyncMessageStreamContract:
+        return self._run(stream)
+
+    def _run(self, stream: SyncMessageStreamContract) -> Iterator[Message]:
+        # Without a timer the latency bound is checked when the next message arrives.
+        batch: list[Message] = []
+        started = 0.0
+        for message in stream:
+            if batch and self._max_latency is not None and time.monotonic() - started >= self._max_latency:
+                yield Batch(*batch)
+                batch = []
+            if not batch:
+                started = time.monotonic()
+            batch.append(message)
+            if len(batch) >= self._max_size:
+                yield Batch(*batch)
+                batch = []
+        if batch:
+            yield Batch(*batch)
+
+
+class AsyncUnbatcher:
+    def __call__(self, stream: AsyncMessageStreamContract, *args: Any, **kwargs: Any) -> AsyncMessageStreamContract:
+        return self._run(stream)
+
+    async def _run(self, stream: AsyncMessageStreamContract) -> AsyncIterator[Message]:
+        async for message in stream:
+            if isinstance(message, Batch):
+                for item in message.messages:
+                    yield item
+            else:
+                yield message
+
+
+class SyncUnbatcher:
+    def __call__(self, stream: SyncMessageStreamContract, *args: Any, **kwargs: Any) -> SyncMessageStreamContract:
+        return self._run(stream)
+
+    def _run(self, stream: SyncMessageStreamContract) -> Iterator[Message]:
+        for message in stream:
+            if isinstance(message, Batch):
+                yield from message.messages
+            else:
+                yield message
+
+
+def _validate(max_size: int, max_latency: float | None) -> None:
+    if max_size <= 0:
+        raise ValueError("max_size must be positive")
+    if max_latency is not None and max_latency <= 0:
+        raise ValueError("max_latency must be positive")
+
+
+async def _next(stream: AsyncMessageStreamContract) -> Any:
+    try:
+        return await anext(stream)
+    except StopAsyncIteration:
+        return _END
@@ -0,0 +1,278 @@
+import asyncio
+import collections
+import concurrent.futures
+import contextlib
+import threading
+from collections.abc import AsyncIterator, Iterator
+from types import TracebackType
+from typing import Any, Self
+
+from ...codex.cqea import Message
+from .contracts import (
+    AsyncMessageStreamContract,
+    AsyncPipelineContract,
+    SyncMessageStreamContract,
+    SyncPipelineContract,
+    SyncProcessorContract,
+)
+
+_DONE = object()
+
+
+class _Failure:
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class _Closed(Exception):
+    pass
+
+
+class _Channel:
+    # A bounded queue between one event-loop party and one thread party. The
+    # thread side blocks on a condition; the loop side awaits a future that the
+    # thread resolves only when the loop is actually waiting, so a steady flow
+    # of messages costs no loop wake-ups.
+    def __init__(self, loop: asyncio.AbstractEventLoop, maxsize: int):
+        self._loop = loop
+        self._maxsize = maxsize
+        self._items: collections.deque[Any] = collections.deque()
+        self._condition = threading.Condition()
+        self._waiter: asyncio.Future[None] | None = None
+        self._closed = False
+
+    def put(self, item: Any, force: bool = False) -> None:
+        with self._condition:
+            while not force and not self._closed and len(self._items) >= self._maxsize:
+                self._condition.wait()
+            if self._closed:
+                raise _Closed
+            self._items.append(item)
+            self._wake()
+
+    def get(self) -> Any:
+        with self._condition:
+            while not self._items:
+                if self._closed:
+                    return _DONE
+                self._condition.wait()
+            item = self._items.popleft()
+            self._wake()
+            return item
+
+    async def aput(self, item: Any, force: bool = False) -> None:
+        while True:
+            with self._condition:
+                if self._closed:
+                    raise _Closed
+                if force or len(self._items) < self._maxsize:
+                    self._items.append(item)
+                    self._condition.notify()
+                    return
+                waiter = self._waiter = self._loop.create_future()
+            await waiter
+
+    async def aget(self) -> Any:
+        while True:
+            with self._condition:
+                if self._items:
+                    item = self._items.popleft()
+                    self._condition.notify()
+                    return item
+                if self._closed:
+                    return _DONE
+                waiter = self._waiter = self._loop.create_future()
+            await waiter
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            self._wake()
+
+    def _wake(self) -> None:
+        self._condition.notify()
+        if self._waiter is not None:
+            waiter, self._waiter = self._waiter, None
+            with contextlib.suppress(RuntimeError):
+                self._loop.call_soon_threadsafe(_resolve, waiter)
+
+
+class ThreadPoolStage:
+    def __init__(
+        self,
+        processor: SyncProcessorContract,
+        executor: concurrent.futures.Executor | None = None,
+        prefetch: int = 64,
+    ):
+        if prefetch <= 0:
+            raise ValueError("prefetch must be positive")
+        self._processor = processor
+        self._executor = executor
+        self._prefetch = prefetch
+
+    def __call__(self, stream: AsyncMessageStreamContract, *args: Any, **kwargs: Any) -> AsyncMessageStreamContract:
+        return self._run(stream, args, kwargs)
+
+    async def _run(
+        self,
+        stream: AsyncMessageStreamContract,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> AsyncIterator[Message]:
+        loop = asyncio.get_running_loop()
+        inbox = _Channel(loop, self._prefetch)
+        outbox = _Channel(loop, self._prefetch)
+        feeder = asyncio.create_task(_feed(stream, inbox))
+        worker = loop.run_in_executor(self._executor, self._drive, inbox, outbox, args, kwargs)
+        try:
+            while (item := await outbox.aget()) is not _DONE:
+                if isinstance(item, _Failure):
+                    raise item.error
+                yield item
+        finally:
+            inbox.close()
+            outbox.close()
+            feeder.cancel()
+            await asyncio.gather(feeder, worker, return_exceptions=True)
+
+    def _drive(
+        self,
+        inbox: _Channel,
+        outbox: _Channel,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        try:
+            results = iter(self._processor(_drain(inbox), *args, **kwargs))
+            try:
+                for message in results:
+                    outbox.put(message)
+            finally:
+                close = getattr(results, "close", None)
+                if close is not None:
+                    close()
+        except _Closed:
+            return
+        except Exception as e:
+            with contextlib.suppress(_Closed):
+                outbox.put(_Failure(e), force=True)
+            return
+        with contextlib.suppress(_Closed):
+            outbox.put(_DONE, force=True)
+
+
+class EventLoopThread:
+    def __init__(self, prefetch: int = 64):
+        if prefetch <= 0:
+            raise ValueError("prefetch must be positive")
+        self._prefetch = prefetch
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="zodchy-event-loop", daemon=True)
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    def run(self, coroutine: Any) -> Any:
+        try:
+            self._check_thread()
+        except RuntimeError:
+            coroutine.close()
+            raise
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    def iterate(self, stream: AsyncMessageStreamContract) -> Iterator[Message]:
+        self._check_thread()
+        channel = _Channel(self.loop, self._prefetch)
+        future = asyncio.run_coroutine_threadsafe(_feed(stream, channel), self.loop)
+        try:
+            while (item := channel.get()) is not _DONE:
+                if isinstance(item, _Failure):
+                    raise item.error
+                yield item
+        finally:
+            channel.close()
+            future.cancel()
+
+    def wrap(self, pipeline: AsyncPipelineContract) -> SyncPipelineContract:
+        def call(*messages: Message, **kwargs: Any) -> SyncMessageStreamContract:
+            return self.iterate(pipeline(*messages, **kwargs))
+
+        return call
+
+    def stop(self) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(_shutdown(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    def _check_thread(self) -> None:
+        # Blocking on the loop from its own thread would deadlock.
+        if self._thread is not None and threading.current_thread() is self._thread:
+            raise RuntimeError("EventLoopThread cannot be driven from its own loop")
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.stop()
+
+
+async def _feed(stream: AsyncMessageStreamContract, channel: _Channel) -> None:
+    try:
+        async for message in stream:
+            await channel.aput(message)
+    except _Closed:
+        return
+    except Exception as e:
+        with contextlib.suppress(_Closed):
+            await channel.aput(_Failure(e), force=True)
+        return
+    finally:
+        aclose = getattr(stream, "aclose", None)
+        if aclose is not None:
+            with contextlib.suppress(Exception):
+                await aclose()
+    with contextlib.suppress(_Closed):
+        await channel.aput(_DONE, force=True)
+
+
+def _drain(channel: _Channel) -> Iterator[Message]:
+    while (item := channel.get()) is not _DONE:
+        if isinstance(item, _Failure):
+            raise item.error
+        yield item
+
+
+def _resolve(waiter: asyncio.Future[None]) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+async def _shutdown() -> None:
+    current = asyncio.current_task()
+    tasks = [task for task in asyncio.all_tasks() if task is not current]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await asyncio.get_running_loop().shutdown_asyncgens()
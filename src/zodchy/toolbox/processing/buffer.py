@@ -0,0 +1,127 @@
+import asyncio
+import collections
+import contextlib
+import dataclasses
+import itertools
+from collections.abc import AsyncIterator, Callable, Hashable
+from typing import Any, Literal
+
+from ...codex.cqea import Message
+from .contracts import AsyncMessageStreamContract
+
+OverflowPolicy = Literal["block", "drop_oldest", "drop_newest", "coalesce"]
+
+_POLICIES = ("block", "drop_oldest", "drop_newest", "coalesce")
+
+
+@dataclasses.dataclass
+class BufferStats:
+    received: int = 0
+    emitted: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    blocked: int = 0
+    high_water_mark: int = 0
+
+
+class BufferStage:
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        policy: OverflowPolicy = "block",
+        key: Callable[[Message], Hashable] | None = None,
+    ):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        if policy not in _POLICIES:
+            raise ValueError(f"Unknown overflow policy: {policy}")
+        if (policy == "coalesce") != (key is not None):
+            raise ValueError("key is required for, and only for, the coalesce policy")
+        self._maxsize = maxsize
+        self._policy = policy
+        self._key = key
+        self._stats = BufferStats()
+
+    @property
+    def stats(self) -> BufferStats:
+        return self._stats
+
+    def __call__(self, stream: AsyncMessageStreamContract, *args: Any, **kwargs: Any) -> AsyncMessageStreamContract:
+        return self._run(stream)
+
+    async def _run(self, stream: AsyncMessageStreamContract) -> AsyncIterator[Message]:
+        state = _State()
+        feeder = asyncio.create_task(self._feed(stream, state))
+        stats = self._stats
+        try:
+            while True:
+                if state.items:
+                    _, message = state.items.popitem(last=False)
+                    state.space.set()
+                    stats.emitted += 1
+                    yield message
+                    continue
+                if state.done:
+                    if state.failure is not None:
+                        raise state.failure
+                    return
+                state.ready.clear()
+                await state.ready.wait()
+        finally:
+            feeder.cancel()
+            await asyncio.gather(feeder, return_exceptions=True)
+
+    async def _feed(self, stream: AsyncMessageStreamContract, state: "_State") -> None:
+        items, stats, maxsize, policy = state.items, self._stats, self._maxsize, self._policy
+        # Without coalescing every message gets a unique key, so one ordered
+        # mapping serves all policies.
+        keys: Callable[[Message], Hashable] = self._key or _counter()
+        try:
+            async for message in stream:
+                stats.received += 1
+                key = keys(message)
+                if key in items:
+                    items[key] = message
+                    stats.coalesced += 1
+                    continue
+                if len(items) >= maxsize:
+                    if policy == "drop_newest":
+                        stats.dropped += 1
+                        continue
+                    if policy == "drop_oldest":
+                        items.popitem(last=False)
+                        stats.dropped += 1
+                    else:
+                        stats.blocked += 1
+                        while len(items) >= maxsize:
+                            state.space.clear()
+                            await state.space.wait()
+                items[key] = message
+                if len(items) > stats.high_water_mark:
+                    stats.high_water_mark = len(items)
+                state.ready.set()
+        except Exception as e:
+            state.failure = e
+        finally:
+            state.done = True
+            state.ready.set()
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                with contextlib.suppress(Exception):
+                    await aclose()
+
+
+class _State:
+    __slots__ = ("items", "ready", "space", "done", "failure")
+
+    def __init__(self) -> None:
+        self.items: collections.OrderedDict[Hashable, Message] = collections.OrderedDict()
+        self.ready = asyncio.Event()
+        self.space = asyncio.Event()
+        self.done = False
+        self.failure: Exception | None = None
+
+
+def _counter() -> Callable[[Message], Hashable]:
+    counter = itertools.count()
+    return lambda message: next(counter)
@@ -1,7 +1,7 @@
 from collections.abc import AsyncIterator, Iterator
 from typing import Any, Protocol, TypeAlias
 
-from ..codex.cqea import Message
+from ...codex.cqea import Message
 
 AsyncMessageStreamContract: TypeAlias = AsyncIterator[Message]
 
@@ -0,0 +1,60 @@
+import types
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from ...codex.cqea import Message
+
+Handler = Callable[..., Any]
+
+_MISSING = object()
+
+
+class Dispatcher:
+    def __init__(self, default: Handler | None = None):
+        self._default = default
+        self._handlers: dict[type[Message], Handler] = {}
+        self._table: dict[type, Handler | None] = {}
+
+    @property
+    def handlers(self) -> Mapping[type[Message], Handler]:
+        return types.MappingProxyType(self._handlers)
+
+    def register(self, message_type: type[Message], handler: Handler | None = None) -> Any:
+        if handler is None:
+
+            def decorator(func: Handler) -> Handler:
+                self.register(message_type, func)
+                return func
+
+            return decorator
+        self._handlers[message_type] = handler
+        self._table.clear()
+        return handler
+
+    def resolve(self, message_type: type) -> Handler | None:
+        handler = self._table.get(message_type, _MISSING)
+        if handler is _MISSING:
+            handler = self._table[message_type] = self._lookup(message_type)
+        return handler  # type: ignore[return-value]
+
+    def __call__(self, message: Message, *args: Any, **kwargs: Any) -> Any:
+        handler = self._table.get(type(message), _MISSING)
+        if handler is _MISSING:
+            handler = self.resolve(type(message))
+        if handler is None:
+            raise LookupError(f"No handler registered for {type(message).__qualname__}")
+        return handler(message, *args, **kwargs)  # type: ignore[operator]
+
+    def __contains__(self, message_type: type) -> bool:
+        return self.resolve(message_type) is not None
+
+    def _lookup(self, message_type: type) -> Handler | None:
+        # The nearest registered ancestor wins. Classes registered on an ABC via
+        # register() never show up in the MRO, so they get a second pass.
+        for cls in message_type.__mro__:
+            if cls in self._handlers:
+                return self._handlers[cls]
+        for cls, handler in self._handlers.items():
+            if issubclass(message_type, cls):
+                return handler
+        return self._default
@@ -0,0 +1,276 @@
+import bisect
+import dataclasses
+import math
+import threading
+import time
+import types
+from collections.abc import AsyncIterator, Callable, Iterator, Mapping
+from typing import Any, Protocol
+
+from ...codex.cqea import Message
+from .contracts import (
+    AsyncMessageStreamContract,
+    AsyncProcessorContract,
+    SyncMessageStreamContract,
+    SyncProcessorContract,
+)
+
+
+class CollectorContract(Protocol):
+    def record(self, stage: str, received: int, emitted: int, waiting: float, working: float) -> None: ...
+
+
+class Histogram:
+    # Log-scale buckets: every bucket is `growth` times wider than the previous
+    # one, so percentiles carry a bounded relative error at any magnitude.
+    def __init__(self, resolution: float = 1e-7, growth: float = 1.05):
+        if resolution <= 0:
+            raise ValueError("resolution must be positive")
+        if growth <= 1:
+            raise ValueError("growth must be greater than one")
+        self._resolution = resolution
+        self._log_growth = math.log(growth)
+        self._growth = growth
+        self._buckets: dict[int, int] = {}
+        self._count = 0
+        self._max = 0.0
+
+    def add(self, value: float) -> None:
+        index = int(math.log(value / self._resolution) / self._log_growth) + 1 if value > self._resolution else 0
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+        self._count += 1
+        if value > self._max:
+            self._max = value
+
+    def percentile(self, q: float) -> float:
+        if not 0 <= q <= 100:
+            raise ValueError("q must be between 0 and 100")
+        if not self._count:
+            return 0.0
+        indexes = sorted(self._buckets)
+        totals = []
+        total = 0
+        for index in indexes:
+            total += self._buckets[index]
+            totals.append(total)
+        position = bisect.bisect_left(totals, max(1, math.ceil(self._count * q / 100)))
+        index = indexes[position]
+        upper = self._resolution * self._growth**index if index else self._resolution
+        return min(upper, self._max)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def max(self) -> float:
+        return self._max
+
+
+@dataclasses.dataclass
+class StageStats:
+    received: int = 0
+    emitted: int = 0
+    waiting: float = 0.0
+    working: float = 0.0
+    latency: Histogram = dataclasses.field(default_factory=Histogram)
+
+    @property
+    def throughput(self) -> float:
+        elapsed = self.waiting + self.working
+        return self.emitted / elapsed if elapsed else 0.0
+
+    @property
+    def p50(self) -> float:
+        return self.latency.percentile(50)
+
+    @property
+    def p95(self) -> float:
+        return self.latency.percentile(95)
+
+    @property
+    def p99(self) -> float:
+        return self.latency.percentile(99)
+
+
+class StatsCollector:
+    def __init__(self, histogram: Callable[[], Histogram] = Histogram):
+        self._histogram = histogram
+        self._stages: dict[str, StageStats] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def stages(self) -> Mapping[str, StageStats]:
+        return types.MappingProxyType(self._stages)
+
+    def record(self, stage: str, received: int, emitted: int, waiting: float, working: float) -> None:
+        with self._lock:
+            stats = self._stages.get(stage)
+            if stats is None:
+                stats = self._stages[stage] = StageStats(latency=self._histogram())
+            stats.received += received
+            stats.emitted += emitted
+            stats.waiting += waiting
+            stats.working += working
+            if emitted:
+                stats.latency.add(working)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stages.clear()
+
+    def __getitem__(self, stage: str) -> StageStats:
+        return self._stages[stage]
+
+
+class AsyncInstrumentedStage:
+    def __init__(
+        self,
+        processor: AsyncProcessorContract,
+        collector: CollectorContract,
+        name: str | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self._processor = processor
+        self._collector = collector
+        self._name = name or stage_name(processor)
+        self._clock = clock
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def __call__(self, stream: AsyncMessageStreamContract, *args: Any, **kwargs: Any) -> AsyncMessageStreamContract:
+        return self._run(stream, args, kwargs)
+
+    async def _run(
+        self,
+        stream: AsyncMessageStreamContract,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> AsyncIterator[Message]:
+        clock, collector, name = self._clock, self._collector, self._name
+        probe = _AsyncProbe(stream, clock)
+        output = self._processor(probe, *args, **kwargs)
+        try:
+            while True:
+                probe.received = 0
+                probe.waiting = 0.0
+                started = clock()
+                try:
+                    message = await anext(output)
+                except StopAsyncIteration:
+                    # Whatever was consumed after the last output is still accounted.
+                    collector.record(name, probe.received, 0, probe.waiting, clock() - started - probe.waiting)
+                    return
+                collector.record(name, probe.received, 1, probe.waiting, clock() - started - probe.waiting)
+                yield message
+        finally:
+            aclose = getattr(output, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+
+class SyncInstrumentedStage:
+    def __init__(
+        self,
+        processor: SyncProcessorContract,
+        collector: CollectorContract,
+        name: str | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self._processor = processor
+        self._collector = collector
+        self._name = name or stage_name(processor)
+        self._clock = clock
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def __call__(self, stream: SyncMessageStreamContract, *args: Any, **kwargs: Any) -> SyncMessageStreamContract:
+        return self._run(stream, args, kwargs)
+
+    def _run(
+        self,
+        stream: SyncMessageStreamContract,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Iterator[Message]:
+        clock, collector, name = self._clock, self._collector, self._name
+        probe = _SyncProbe(stream, clock)
+        output = iter(self._processor(probe, *args, **kwargs))
+        try:
+            while True:
+                probe.received = 0
+                probe.waiting = 0.0
+                started = clock()
+                try:
+                    message = next(output)
+                except StopIteration:
+                    collector.record(name, probe.received, 0, probe.waiting, clock() - started - probe.waiting)
+                    return
+                collector.record(name, probe.received, 1, probe.waiting, clock() - started - probe.waiting)
+                yield message
+        finally:
+            close = getattr(output, "close", None)
+            if close is not None:
+                close()
+
+
+def stage_name(processor: Any) -> str:
+    return getattr(processor, "__qualname__", None) or type(processor).__qualname__
+
+
+class _AsyncProbe:
+    __slots__ = ("_stream", "_clock", "received", "waiting")
+
+    def __init__(self, stream: AsyncMessageStreamContract, clock: Callable[[], float]):
+        self._stream = stream
+        self._clock = clock
+        self.received = 0
+        self.waiting = 0.0
+
+    def __aiter__(self) -> "_AsyncProbe":
+        return self
+
+    async def __anext__(self) -> Message:
+        started = self._clock()
+        try:
+            message = await anext(self._stream)
+        finally:
+            self.waiting += self._clock() - started
+        self.received += 1
+        return message
+
+    async def aclose(self) -> None:
+        aclose = getattr(self._stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+class _SyncProbe:
+    __slots__ = ("_stream", "_clock", "received", "waiting")
+
+    def __init__(self, stream: SyncMessageStreamContract, clock: Callable[[], float]):
+        self._stream = iter(stream)
+        self._clock = clock
+        self.received = 0
+        self.waiting = 0.0
+
+    def __iter__(self) -> "_SyncProbe":
+        return self
+
+    def __next__(self) -> Message:
+        started = self._clock()
+        try:
+            message = next(self._stream)
+        finally:
+            self.waiting += self._clock() - started
+        self.received += 1
+        return message
+
+    def close(self) -> None:
+        close = getattr(self._stream, "close", None)
+        if close is not None:
+            close()
@@ -0,0 +1,121 @@
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+from typing import Any
+
+from ...codex.cqea import Message
+from .contracts import AsyncMessageStreamContract, AsyncProcessorContract
+
+_DONE = object()
+
+
+class _Failure:
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class ParallelStage:
+    def __init__(
+        self,
+        processor: AsyncProcessorContract,
+        workers: int = 4,
+        buffer: int | None = None,
+        ordered: bool = True,
+    ):
+        if workers <= 0:
+            raise ValueError("workers must be positive")
+        if buffer is not None and buffer <= 0:
+            raise ValueError("buffer must be positive")
+        self._processor = processor
+        self._workers = workers
+        self._buffer = buffer or workers * 2
+        self._ordered = ordered
+
+    def __call__(self, stream: AsyncMessageStreamContract, *args: Any, **kwargs: Any) -> AsyncMessageStreamContract:
+        return self._run(stream, args, kwargs)
+
+    async def _run(
+        self,
+        stream: AsyncMessageStreamContract,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> AsyncIterator[Message]:
+        jobs: asyncio.Queue[tuple[Message, asyncio.Future[list[Message]] | None] | None] = asyncio.Queue(self._buffer)
+        results: asyncio.Queue[Any] = asyncio.Queue(self._buffer)
+        tasks = [asyncio.create_task(self._feed(stream, jobs, results))]
+        tasks.extend(asyncio.create_task(self._work(jobs, results, args, kwargs)) for _ in range(self._workers))
+        try:
+            finished = 0
+            while True:
+                item = await results.get()
+                if item is _DONE:
+                    finished += 1
+                    if self._ordered or finished == self._workers:
+                        return
+                    continue
+                if isinstance(item, _Failure):
+                    raise item.error
+                for message in await item if self._ordered else item:
+                    yield message
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _feed(
+        self,
+        stream: AsyncMessageStreamContract,
+        jobs: asyncio.Queue[tuple[Message, asyncio.Future[list[Message]] | None] | None],
+        results: asyncio.Queue[Any],
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            async for message in stream:
+                future: asyncio.Future[list[Message]] | None = None
+                if self._ordered:
+                    # Futures enter the results queue in input order, so the
+                    # consumer yields in order no matter which worker finishes first.
+                    future = loop.create_future()
+                    await results.put(future)
+                await jobs.put((message, future))
+        except Exception as e:
+            await results.put(_Failure(e))
+        finally:
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                with contextlib.suppress(Exception):
+                    await aclose()
+        for _ in range(self._workers):
+            await jobs.put(None)
+        if self._ordered:
+            await results.put(_DONE)
+
+    async def _work(
+        self,
+        jobs: asyncio.Queue[tuple[Message, asyncio.Future[list[Message]] | None] | None],
+        results: asyncio.Queue[Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        while (job := await jobs.get()) is not None:
+            message, future = job
+            try:
+                output = [item async for item in self._processor(_single(message), *args, **kwargs)]
+            except Exception as e:
+                if future is None:
+                    await results.put(_Failure(e))
+                else:
+                    future.set_exception(e)
+                continue
+            if future is None:
+                await results.put(output)
+            else:
+                future.set_result(output)
+        if not self._ordered:
+            await results.put(_DONE)
+
+
+async def _single(message: Message) -> AsyncIterator[Message]:
+    yield message
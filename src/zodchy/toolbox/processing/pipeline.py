@@ -0,0 +1,68 @@
+from collections.abc import AsyncIterator, Iterable
+from typing import Any
+
+from ...codex.cqea import Message
+from .contracts import (
+    AsyncMessageStreamContract,
+    AsyncProcessorContract,
+    SyncMessageStreamContract,
+    SyncProcessorContract,
+)
+from .instrumentation import AsyncInstrumentedStage, CollectorContract, SyncInstrumentedStage, stage_name
+
+
+class AsyncPipeline:
+    def __init__(self, *processors: AsyncProcessorContract, collector: CollectorContract | None = None):
+        self._processors = processors
+        self._stages: tuple[AsyncProcessorContract, ...] = processors
+        if collector is not None:
+            self._stages = tuple(
+                AsyncInstrumentedStage(processor, collector, _numbered(index, processor))
+                for index, processor in enumerate(processors)
+            )
+
+    @property
+    def processors(self) -> tuple[AsyncProcessorContract, ...]:
+        return self._processors
+
+    def __call__(self, *messages: Message, **kwargs: Any) -> AsyncMessageStreamContract:
+        return self.run(_async_source(messages), **kwargs)
+
+    def run(self, stream: AsyncMessageStreamContract, **kwargs: Any) -> AsyncMessageStreamContract:
+        # Stages are chained as nested async iterators: pulling from the last
+        # one drives the whole chain in the caller's task.
+        for processor in self._stages:
+            stream = processor(stream, **kwargs)
+        return stream
+
+
+class SyncPipeline:
+    def __init__(self, *processors: SyncProcessorContract, collector: CollectorContract | None = None):
+        self._processors = processors
+        self._stages: tuple[SyncProcessorContract, ...] = processors
+        if collector is not None:
+            self._stages = tuple(
+                SyncInstrumentedStage(processor, collector, _numbered(index, processor))
+                for index, processor in enumerate(processors)
+            )
+
+    @property
+    def processors(self) -> tuple[SyncProcessorContract, ...]:
+        return self._processors
+
+    def __call__(self, *messages: Message, **kwargs: Any) -> SyncMessageStreamContract:
+        return self.run(messages, **kwargs)
+
+    def run(self, stream: SyncMessageStreamContract, **kwargs: Any) -> SyncMessageStreamContract:
+        for processor in self._stages:
+            stream = processor(stream, **kwargs)
+        return stream
+
+
+async def _async_source(messages: Iterable[Message]) -> AsyncIterator[Message]:
+    for message in messages:
+        yield message
+
+
+def _numbered(index: int, processor: object) -> str:
+    return f"{index}:{stage_name(processor)}"
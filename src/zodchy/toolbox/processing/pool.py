@@ -0,0 +1,113 @@
+import collections
+import concurrent.futures
+import os
+import pickle
+from collections.abc import Iterator
+from types import TracebackType
+from typing import Any, Self
+
+from ...codex.cqea import Message
+from .contracts import SyncMessageStreamContract, SyncProcessorContract
+
+
+class ProcessPoolStage:
+    def __init__(
+        self,
+        processor: SyncProcessorContract,
+        executor: concurrent.futures.Executor | None = None,
+        max_workers: int | None = None,
+        chunksize: int = 256,
+        prefetch: int | None = None,
+    ):
+        if chunksize <= 0:
+            raise ValueError("chunksize must be positive")
+        if prefetch is not None and prefetch <= 0:
+            raise ValueError("prefetch must be positive")
+        try:
+            pickle.dumps(processor, pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            raise TypeError(f"Processor {processor!r} cannot be pickled for process execution: {e}") from e
+        self._processor = processor
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._chunksize = chunksize
+        self._prefetch = prefetch or self._max_workers * 2
+
+    def __call__(self, stream: SyncMessageStreamContract, *args: Any, **kwargs: Any) -> SyncMessageStreamContract:
+        return self._run(stream, args, kwargs)
+
+    def _run(
+        self, stream: SyncMessageStreamContract, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> Iterator[Message]:
+        executor = self._get_executor()
+        pending: collections.deque[concurrent.futures.Future[bytes]] = collections.deque()
+        try:
+            for chunk in _chunks(stream, self._chunksize):
+                pending.append(executor.submit(_process_chunk, self._processor, _dumps(chunk), args, kwargs))
+                if len(pending) >= self._prefetch:
+                    yield from pickle.loads(pending.popleft().result())
+            while pending:
+                yield from pickle.loads(pending.popleft().result())
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _get_executor(self) -> concurrent.futures.Executor:
+        if self._executor is None:
+            self._executor = concurrent.futures.ProcessPoolExecutor(max_workers=self._max_workers)
+        return self._executor
+
+    def shutdown(self) -> None:
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.shutdown()
+
+
+def _chunks(stream: SyncMessageStreamContract, size: int) -> Iterator[list[Message]]:
+    chunk: list[Message] = []
+    for message in stream:
+        chunk.append(message)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _dumps(messages: list[Message]) -> bytes:
+    # Chunks are pickled here rather than by the executor so that a message
+    # which cannot cross the process boundary is reported by its type.
+    try:
+        return pickle.dumps(messages, pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        for message in messages:
+            try:
+                pickle.dumps(message, pickle.HIGHEST_PROTOCOL)
+            except Exception as error:
+                raise TypeError(
+                    f"{type(message).__module__}.{type(message).__qualname__} cannot be pickled "
+                    f"for process execution: {error}"
+                ) from error
+        raise TypeError(f"Messages cannot be pickled for process execution: {e}") from e
+
+
+def _process_chunk(
+    processor: SyncProcessorContract,
+    payload: bytes,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> bytes:
+    messages = pickle.loads(payload)
+    return pickle.dumps(list(processor(messages, *args, **kwargs)), pickle.HIGHEST_PROTOCOL)
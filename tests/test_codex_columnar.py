@@ -0,0 +1,184 @@
+"""
+Tests for the codex.columnar module.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from zodchy.codex.columnar import apply, mask, select  # noqa: E402
+from zodchy.codex.operator import (  # noqa: E402
+    ASC,
+    DESC,
+    EQ,
+    GE,
+    GT,
+    IS,
+    LE,
+    LIKE,
+    LT,
+    NE,
+    NOT,
+    RANGE,
+    SET,
+    FilterBit,
+    Limit,
+    Offset,
+)
+from zodchy.codex.predicate import compile_predicate  # noqa: E402
+
+
+@pytest.fixture
+def columns():
+    return {
+        "id": np.array([1, 2, 3, 4, 5]),
+        "score": np.array([10.0, np.nan, 30.0, 20.0, 30.0]),
+        "name": np.array(["alice", "Bob", "anna", "carl", "alex"]),
+        "tag": np.array(["x", None, "y", "x", None], dtype=object),
+    }
+
+
+class TestMask:
+    """Test class for mask."""
+
+    @pytest.mark.parametrize(
+        "field, bit, expected",
+        [
+            ("id", EQ(3), [False, False, True, False, False]),
+            ("id", NE(3), [True, True, False, True, True]),
+            ("id", LE(2), [True, True, False, False, False]),
+            ("id", GE(4), [False, False, False, True, True]),
+            ("id", LT(2), [True, False, False, False, False]),
+            ("id", GT(4), [False, False, False, False, True]),
+            ("id", SET(1, 5), [True, False, False, False, True]),
+            ("id", RANGE(GT(1), LE(3)), [False, True, True, False, False]),
+            ("id", NOT(SET(1, 5)), [False, True, True, True, False]),
+            ("score", IS(None), [False, True, False, False, False]),
+            ("tag", IS(None), [False, True, False, False, True]),
+            ("tag", EQ("x"), [True, False, False, True, False]),
+            ("tag", GT("x"), [False, False, True, False, False]),
+        ],
+    )
+    def test_operators(self, columns, field, bit, expected):
+        """Test each operator against a column."""
+        assert mask([(field, bit)], columns).tolist() == expected
+
+    @pytest.mark.parametrize(
+        "bit, expected",
+        [
+            (LIKE("a%"), [True, False, True, False, True]),
+            (LIKE("%l"), [False, False, False, True, False]),
+            (LIKE("%l%"), [True, False, False, True, True]),
+            (LIKE("bob"), [False, True, False, False, False]),
+            (LIKE("bob", case_sensitive=True), [False, False, False, False, False]),
+            (LIKE("a_e%"), [False, False, False, False, True]),
+            (LIKE("A%", case_sensitive=True), [False, False, False, False, False]),
+        ],
+    )
+    def test_like(self, columns, bit, expected):
+        """Test LIKE fast paths and the regex fallback."""
+        assert mask([("name", bit)], columns).tolist() == expected
+
+    def test_like_skips_missing_values(self, columns):
+        """Test that LIKE does not match None in object columns."""
+        assert mask([("tag", LIKE("%"))], columns).tolist() == [True, False, True, True, False]
+
+    def test_filters_are_combined(self, columns):
+        """Test that filters are combined with AND and non-filters ignored."""
+        stream = [("id", GT(1)), ("name", LIKE("a%")), ("id", ASC()), ("limit", Limit(1))]
+        assert mask(stream, columns).tolist() == [False, False, True, False, True]
+
+    def test_mismatched_lengths(self):
+        """Test that columns of different lengths are rejected."""
+        with pytest.raises(ValueError):
+            mask([], {"a": np.array([1]), "b": np.array([1, 2])})
+
+    def test_unsupported_bit(self, columns):
+        """Test that unknown filter bits are rejected."""
+
+        class Custom(FilterBit[int]):
+            pass
+
+        with pytest.raises(TypeError):
+            mask([("id", Custom(1))], columns)
+
+
+class TestMissingValues:
+    """Test class for missing values, checked against codex.predicate."""
+
+    @pytest.mark.parametrize(
+        "bit",
+        [
+            EQ(1),
+            NE(1),
+            LT(2),
+            LE(1),
+            GT(1),
+            GE(1),
+            EQ(None),
+            NE(None),
+            NOT(EQ(1)),
+            NOT(NE(1)),
+            NOT(LT(2)),
+            RANGE(GE(1), LE(3)),
+            NOT(RANGE(GE(1), LE(3))),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "column",
+        [np.array([1, None, 3], dtype=object), np.array([1.0, np.nan, 3.0])],
+        ids=["object", "float"],
+    )
+    def test_matches_predicate(self, bit, column):
+        """Test that missing values select the same rows as the row predicate."""
+        predicate = compile_predicate([("v", bit)])
+        expected = [predicate({"v": value}) for value in column.tolist()]
+        assert mask([("v", bit)], {"v": column}).tolist() == expected
+
+    def test_ne_and_not_eq_agree(self):
+        """Test that NE and NOT(EQ) select the same rows over missing values."""
+        columns = {"v": np.array([1, None, 3], dtype=object)}
+        assert mask([("v", NE(1))], columns).tolist() == [False, True, True]
+        assert mask([("v", NOT(EQ(1)))], columns).tolist() == [False, True, True]
+
+
+class TestSelect:
+    """Test class for select and apply."""
+
+    def test_order_by_priority(self, columns):
+        """Test that lower priority values are primary sort keys."""
+        stream = [("id", ASC(1)), ("score", DESC(0)), ("score", NOT(IS(None)))]
+        assert select(stream, columns).tolist() == [2, 4, 3, 0]
+
+    def test_descending_strings(self, columns):
+        """Test descending order over a string column."""
+        assert select([("name", DESC())], columns).tolist() == [3, 2, 0, 4, 1]
+
+    def test_missing_values_order(self, columns):
+        """Test that missing values sort last ascending and first descending."""
+        assert select([("tag", ASC())], columns).tolist() == [0, 3, 2, 1, 4]
+        assert select([("tag", DESC())], columns).tolist() == [1, 4, 2, 0, 3]
+        assert select([("score", DESC())], columns).tolist() == [1, 2, 4, 3, 0]
+
+    def test_descending_extreme_integers(self):
+        """Test that descending order does not overflow at the integer minimum."""
+        info = np.iinfo(np.int64)
+        columns = {"n": np.array([info.min, 0, 5, info.max], dtype=np.int64)}
+        assert select([("n", DESC())], columns).tolist() == [3, 2, 1, 0]
+        columns = {"n": np.array([0, 7, info.max], dtype=np.uint64)}
+        assert select([("n", DESC())], columns).tolist() == [2, 1, 0]
+
+    def test_limit_and_offset(self, columns):
+        """Test that Limit and Offset slice the ordered result."""
+        stream = [("id", DESC()), ("limit", Limit(2)), ("offset", Offset(1))]
+        assert select(stream, columns).tolist() == [3, 2]
+
+    def test_apply_returns_columns(self, columns):
+        """Test that apply gathers every column for the selected rows."""
+        result = apply([("id", SET(2, 4)), ("id", DESC())], columns)
+        assert result["id"].tolist() == [4, 2]
+        assert result["name"].tolist() == ["carl", "Bob"]
+
+    def test_empty_columns(self):
+        """Test evaluation over no columns."""
+        assert select([], {}).tolist() == []
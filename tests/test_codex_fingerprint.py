@@ -0,0 +1,94 @@
+"""
+Tests for the codex.fingerprint module.
+"""
+
+from zodchy.codex.fingerprint import canonicalize, encode, fingerprint
+from zodchy.codex.operator import (
+    ASC,
+    DESC,
+    EQ,
+    GE,
+    LE,
+    LIKE,
+    NOT,
+    RANGE,
+    SET,
+    Limit,
+    Offset,
+)
+
+
+class TestEncode:
+    """Test class for encode."""
+
+    def test_encode_includes_type(self):
+        """Test that bits with the same value but different types encode differently."""
+        assert encode(EQ(1)) != encode(NOT(EQ(1)))
+        assert encode(EQ(1)) != encode(EQ("1"))
+
+    def test_encode_like_includes_case_sensitivity(self):
+        """Test that LIKE encoding includes the case sensitivity flag."""
+        assert encode(LIKE("a%")) != encode(LIKE("a%", case_sensitive=True))
+
+    def test_encode_set_is_order_insensitive(self):
+        """Test that SET encoding does not depend on member order."""
+        assert encode(SET(3, 1, 2)) == encode(SET(1, 2, 3))
+
+    def test_encode_nested(self):
+        """Test encoding of nested bits."""
+        assert encode(NOT(RANGE(GE(1), None))) == encode(NOT(RANGE(GE(1), None)))
+        assert encode(RANGE(GE(1), None)) != encode(RANGE(None, LE(1)))
+
+
+class TestCanonicalize:
+    """Test class for canonicalize."""
+
+    def test_filters_sorted_by_field(self):
+        """Test that filters are sorted by field name."""
+        stream = [("b", EQ(2)), ("a", EQ(1))]
+        assert canonicalize(stream) == (("a", EQ(1)), ("b", EQ(2)))
+
+    def test_positional_bits_keep_order_after_filters(self):
+        """Test that order and slice bits stay positional after filters."""
+        stream = [("name", DESC()), ("limit", Limit(10)), ("id", EQ(1)), ("offset", Offset(5)), ("id", ASC(1))]
+        assert canonicalize(stream) == (
+            ("id", EQ(1)),
+            ("name", DESC()),
+            ("limit", Limit(10)),
+            ("offset", Offset(5)),
+            ("id", ASC(1)),
+        )
+
+    def test_result_is_hashable(self):
+        """Test that the canonical stream can be used as a key."""
+        assert hash(canonicalize([("a", SET(1, 2))])) == hash(canonicalize([("a", SET(2, 1))]))
+
+
+class TestFingerprint:
+    """Test class for fingerprint."""
+
+    def test_filter_order_is_ignored(self):
+        """Test that filter order does not change the fingerprint."""
+        left = [("a", EQ(1)), ("b", LIKE("x%")), ("a", LE(5))]
+        right = [("a", LE(5)), ("b", LIKE("x%")), ("a", EQ(1))]
+        assert fingerprint(left) == fingerprint(right)
+
+    def test_slice_order_is_significant(self):
+        """Test that positional bits keep their order in the fingerprint."""
+        left = [("name", ASC(0)), ("id", DESC(0))]
+        right = [("id", DESC(0)), ("name", ASC(0))]
+        assert fingerprint(left) != fingerprint(right)
+
+    def test_values_are_significant(self):
+        """Test that different values produce different fingerprints."""
+        assert fingerprint([("a", EQ(1))]) != fingerprint([("a", EQ(2))])
+        assert fingerprint([("limit", Limit(10))]) != fingerprint([("limit", Limit(20))])
+
+    def test_accepts_iterators(self):
+        """Test that one-shot iterators are accepted."""
+        stream = [("a", EQ(1))]
+        assert fingerprint(iter(stream)) == fingerprint(stream)
+
+    def test_empty_stream(self):
+        """Test fingerprint of an empty stream."""
+        assert fingerprint([]) == fingerprint(iter(()))
@@ -281,8 +281,9 @@ class TestLIKE:
     def test_like_equality_with_non_like(self):
         """Test LIKE equality with non-LIKE object."""
         like = LIKE("pattern")
-        with pytest.raises(NotImplementedError):
-            like == "pattern"
+        assert like != "pattern"
+        assert like != None  # noqa: E711
+        assert like not in [None]
 
 
 class TestSET:
@@ -468,3 +469,131 @@ class TestClauseStream:
         result = list(stream)
         assert len(result) == 7
 
+
+class TestSlots:
+    """Test class for the slotted representation of clause bits."""
+
+    @pytest.mark.parametrize(
+        "bit",
+        [
+            ClauseBit(),
+            EQ(1),
+            NE(1),
+            LE(1),
+            GE(1),
+            LT(1),
+            GT(1),
+            IS(None),
+            LIKE("pattern", case_sensitive=True),
+            SET(1, 2),
+            RANGE(GE(1), LE(2)),
+            NOT(EQ(1)),
+            Limit(10),
+            Offset(5),
+            ASC(1),
+            DESC(2),
+        ],
+    )
+    def test_bit_has_no_instance_dict(self, bit):
+        """Test that built-in clause bits carry no instance __dict__."""
+        assert not hasattr(bit, "__dict__")
+
+    def test_generic_alias_instantiation(self):
+        """Test that parametrized instantiation works without __dict__."""
+        eq = EQ[int](5)
+        assert eq.value == 5
+        assert not hasattr(eq, "__dict__")
+
+    def test_not_does_not_duplicate_value(self):
+        """Test that NOT stores its operand once and exposes it via _value."""
+        eq = EQ(42)
+        not_filter = NOT(eq)
+        assert not_filter._value is not_filter.value
+
+
+class TestImmutability:
+    """Test class for frozen, hashable clause bits."""
+
+    def test_attributes_cannot_be_assigned(self):
+        """Test that clause bits reject attribute assignment."""
+        eq = EQ(42)
+        with pytest.raises(AttributeError):
+            eq._data = 43
+        with pytest.raises(AttributeError):
+            del eq._data
+        assert eq.value == 42
+
+    def test_addition_does_not_mutate_operands(self):
+        """Test that ClauseBit addition returns a new bit."""
+        bit1 = ClauseBit()
+        bit2 = ClauseBit()
+        result = bit1 + bit2
+        assert result is not bit1
+        assert bit1.value == ()
+        assert result.value == (bit2,)
+
+    def test_set_value_is_frozenset(self):
+        """Test that SET stores its members as a frozenset."""
+        assert isinstance(SET(1, 2).value, frozenset)
+
+    def test_structural_equality(self):
+        """Test that bits compare by type and value."""
+        assert EQ(1) == EQ(1)
+        assert EQ(1) != NE(1)
+        assert EQ(1) != EQ(2)
+        assert SET(1, 2) == SET(2, 1)
+        assert RANGE(GE(1), LE(2)) == RANGE(GE(1), LE(2))
+        assert RANGE(GE(1), LE(2)) != RANGE(GT(1), LE(2))
+        assert NOT(EQ(1)) == NOT(EQ(1))
+        assert NOT(EQ(1)) != EQ(1)
+        assert LIKE("a%") != EQ("a%")
+        assert Limit(10) == Limit(10)
+        assert Limit(10) != Offset(10)
+        assert ASC(1) != DESC(1)
+
+    def test_equal_bits_hash_equally(self):
+        """Test that equal bits share a hash and deduplicate in sets."""
+        bits = {
+            EQ(1),
+            EQ(1),
+            NE(1),
+            SET(1, 2),
+            SET(2, 1),
+            LIKE("a"),
+            LIKE("a", case_sensitive=True),
+            Limit(1),
+            Limit(1),
+        }
+        assert len(bits) == 6
+        assert hash(EQ(42)) == hash(42)
+        assert hash(NOT(EQ(42))) == hash(42)
+
+    def test_hash_is_cached(self):
+        """Test that the hash is computed once and reused."""
+        bit = RANGE(GE(1), LE(2))
+        assert hash(bit) == hash(bit)
+        assert bit._hash == hash(bit)
+
+    def test_stream_can_be_used_as_key(self):
+        """Test that a frozen clause stream is usable as a dict key."""
+        stream = (("id", EQ(1)), ("status", SET("a", "b")), ("limit", Limit(10)))
+        cache = {stream: "result"}
+        assert cache[(("id", EQ(1)), ("status", SET("b", "a")), ("limit", Limit(10)))] == "result"
+
+    def test_unhashable_value_fails_on_hash_only(self):
+        """Test that unhashable values are accepted until hashed."""
+        eq = EQ([1, 2])
+        assert eq == [1, 2]
+        with pytest.raises(TypeError):
+            hash(eq)
+
+    def test_pickle_roundtrip(self):
+        """Test that bits survive pickling without carrying the cached hash."""
+        import pickle
+
+        bit = NOT(LIKE("a%", case_sensitive=True))
+        hash(bit)
+        restored = pickle.loads(pickle.dumps(bit))
+        assert restored == bit
+        assert restored.value.case_sensitive is True
+        assert not hasattr(restored, "_hash")
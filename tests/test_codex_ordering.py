@@ -0,0 +1,90 @@
+"""
+Tests for the codex.ordering module.
+"""
+
+import dataclasses
+
+from zodchy.codex.operator import ASC, DESC, EQ, Limit, Offset
+from zodchy.codex.ordering import order, slice_bounds, sort_keys
+
+
+@dataclasses.dataclass
+class Row:
+    id: int
+    name: str | None
+
+
+ROWS = [
+    {"id": 1, "name": "b", "score": 10},
+    {"id": 2, "name": "a", "score": 30},
+    {"id": 3, "name": "c", "score": 20},
+    {"id": 4, "name": None, "score": 30},
+    {"id": 5, "name": "a", "score": 10},
+]
+
+
+def ids(rows):
+    return [row["id"] for row in rows]
+
+
+class TestSortKeys:
+    """Test class for sort_keys."""
+
+    def test_priority_then_position(self):
+        """Test that keys are ordered by priority and then stream position."""
+        stream = [("a", ASC(1)), ("b", DESC(0)), ("id", EQ(1)), ("c", ASC(1))]
+        assert sort_keys(stream) == [("b", True), ("a", False), ("c", False)]
+
+
+class TestSliceBounds:
+    """Test class for slice_bounds."""
+
+    def test_defaults(self):
+        """Test bounds without slice bits."""
+        assert slice_bounds([("id", ASC())]) == (0, None)
+
+    def test_limit_and_offset(self):
+        """Test bounds with Limit and Offset."""
+        assert slice_bounds([("limit", Limit(10)), ("offset", Offset(20))]) == (20, 10)
+
+
+class TestOrder:
+    """Test class for order."""
+
+    def test_full_sort(self):
+        """Test ordering without a limit."""
+        assert ids(order([("score", DESC()), ("id", ASC(1))], ROWS)) == [2, 4, 3, 1, 5]
+
+    def test_top_k_matches_full_sort(self):
+        """Test that the partial sort returns the same page as a full sort."""
+        stream = [("score", ASC()), ("name", DESC(1))]
+        full = ids(order(stream, ROWS))
+        for offset in range(5):
+            for limit in range(1, 6):
+                page = order([*stream, ("limit", Limit(limit)), ("offset", Offset(offset))], ROWS)
+                assert ids(page) == full[offset : offset + limit]
+
+    def test_stable_for_equal_keys(self):
+        """Test that equal keys preserve input order."""
+        assert ids(order([("score", ASC()), ("limit", Limit(2))], ROWS)) == [1, 5]
+        assert ids(order([("score", ASC())], ROWS)) == [1, 5, 3, 2, 4]
+
+    def test_none_placement(self):
+        """Test that None sorts last ascending and first descending."""
+        assert ids(order([("name", ASC())], ROWS))[-1] == 4
+        assert ids(order([("name", DESC())], ROWS))[0] == 4
+
+    def test_accepts_iterators(self):
+        """Test that one-shot iterators are consumed."""
+        assert ids(order([("id", DESC()), ("limit", Limit(2))], iter(ROWS))) == [5, 4]
+
+    def test_slice_without_order(self):
+        """Test Limit and Offset without order keys."""
+        assert ids(order([("limit", Limit(2)), ("offset", Offset(1))], iter(ROWS))) == [2, 3]
+        assert ids(order([("offset", Offset(3))], ROWS)) == [4, 5]
+        assert order([("limit", Limit(0))], ROWS) == []
+
+    def test_attribute_rows(self):
+        """Test ordering objects by attribute."""
+        rows = [Row(1, "b"), Row(2, "a"), Row(3, "c")]
+        assert [row.id for row in order([("name", ASC()), ("limit", Limit(2))], rows, attribute=True)] == [2, 1]
@@ -0,0 +1,135 @@
+"""
+Tests for the codex.predicate module.
+"""
+
+import dataclasses
+
+import pytest
+
+from zodchy.codex import predicate as predicate_module
+from zodchy.codex.operator import (
+    ASC,
+    EQ,
+    GE,
+    GT,
+    IS,
+    LE,
+    LIKE,
+    LT,
+    NE,
+    NOT,
+    RANGE,
+    SET,
+    FilterBit,
+    Limit,
+)
+from zodchy.codex.predicate import clear_cache, compile_predicate, like_pattern
+
+
+@dataclasses.dataclass
+class Row:
+    id: int
+    name: str | None
+    age: int | None
+
+
+class TestLikePattern:
+    """Test class for like_pattern."""
+
+    def test_wildcards(self):
+        """Test translation of % and _ wildcards."""
+        assert like_pattern("jo%").fullmatch("john")
+        assert like_pattern("j_hn").fullmatch("john")
+        assert not like_pattern("j_hn").fullmatch("joohn")
+
+    def test_case_sensitivity(self):
+        """Test case sensitive and insensitive matching."""
+        assert like_pattern("JO%").fullmatch("john")
+        assert not like_pattern("JO%", case_sensitive=True).fullmatch("john")
+
+    def test_regex_characters_are_escaped(self):
+        """Test that regex metacharacters are matched literally."""
+        assert like_pattern("a.c").fullmatch("a.c")
+        assert not like_pattern("a.c").fullmatch("abc")
+
+
+class TestCompilePredicate:
+    """Test class for compile_predicate."""
+
+    def setup_method(self):
+        clear_cache()
+
+    @pytest.mark.parametrize(
+        "bit, matches, rejects",
+        [
+            (EQ(5), 5, 6),
+            (NE(5), 6, 5),
+            (LE(5), 5, 6),
+            (GE(5), 5, 4),
+            (LT(5), 4, 5),
+            (GT(5), 6, 5),
+            (IS(None), None, 0),
+            (LIKE("ab%"), "ABC", "cab"),
+            (SET(1, 2), 2, 3),
+            (RANGE(GE(1), LT(3)), 2, 3),
+            (RANGE(None, LE(3)), 3, 4),
+            (RANGE(None, None), 100, None),
+            (NOT(EQ(5)), 6, 5),
+            (NOT(SET(1, 2)), 3, 1),
+        ],
+    )
+    def test_operators(self, bit, matches, rejects):
+        """Test each supported operator on dict rows."""
+        predicate = compile_predicate([("x", bit)])
+        assert predicate({"x": matches}) is True
+        if not isinstance(bit, RANGE) or any(bit.value):
+            assert predicate({"x": rejects}) is False
+
+    def test_none_does_not_satisfy_comparisons(self):
+        """Test that comparisons and LIKE reject missing values instead of raising."""
+        for bit in (GT(1), LE(1), LIKE("a%")):
+            predicate = compile_predicate([("x", bit)])
+            assert predicate({"x": None}) is False
+            assert predicate({}) is False
+
+    def test_conjunction_across_fields(self):
+        """Test that all filters must hold."""
+        predicate = compile_predicate([("id", GT(1)), ("name", LIKE("a%")), ("id", NE(3))])
+        assert predicate({"id": 2, "name": "alice"})
+        assert not predicate({"id": 3, "name": "alice"})
+        assert not predicate({"id": 2, "name": "bob"})
+
+    def test_non_filter_bits_are_ignored(self):
+        """Test that order and slice bits do not affect the predicate."""
+        predicate = compile_predicate([("id", ASC()), ("limit", Limit(1))])
+        assert predicate({"id": 1})
+
+    def test_attribute_access(self):
+        """Test predicates over dataclass rows."""
+        predicate = compile_predicate([("age", GE(18)), ("name", NOT(IS(None)))], attribute=True)
+        assert predicate(Row(1, "a", 20))
+        assert not predicate(Row(1, None, 20))
+        assert not predicate(Row(1, "a", None))
+
+    def test_cached_by_fingerprint(self):
+        """Test that equivalent streams reuse the compiled predicate."""
+        first = compile_predicate([("a", EQ(1)), ("b", SET(1, 2))])
+        second = compile_predicate(iter([("b", SET(2, 1)), ("a", EQ(1))]))
+        assert first is second
+        assert compile_predicate([("a", EQ(1)), ("b", SET(1, 2))], attribute=True) is not first
+
+    def test_cache_is_bounded(self, monkeypatch):
+        """Test that the cache evicts old entries."""
+        monkeypatch.setattr(predicate_module, "_CACHE_SIZE", 2)
+        for value in range(3):
+            compile_predicate([("a", EQ(value))])
+        assert len(predicate_module._cache) == 2
+
+    def test_unsupported_bit(self):
+        """Test that unknown filter bits are rejected."""
+
+        class Custom(FilterBit[int]):
+            pass
+
+        with pytest.raises(TypeError):
+            compile_predicate([("a", Custom(1))])
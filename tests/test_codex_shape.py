@@ -0,0 +1,104 @@
+"""
+Tests for the codex.shape module.
+"""
+
+import pytest
+
+from zodchy.codex.operator import ASC, EQ, GE, GT, IS, LIKE, LT, NOT, RANGE, SET, Limit, Offset
+from zodchy.codex.shape import Shape, ShapeTable, shape_key, shape_of, shapes, values
+
+
+class TestShapeKey:
+    """Test class for shape_key."""
+
+    def test_ignores_values(self):
+        """Test that shape keys depend on structure only."""
+        assert shape_key([("a", EQ(1)), ("b", RANGE(GE(1), None))]) == shape_key(
+            [("a", EQ(2)), ("b", RANGE(GE(5), None))]
+        )
+        assert shape_key([("l", Limit(1))]) == shape_key([("l", Limit(100))])
+
+    def test_structure_is_significant(self):
+        """Test that structural differences produce different keys."""
+        assert shape_key([("b", RANGE(GE(1), None))]) != shape_key([("b", RANGE(GT(1), None))])
+        assert shape_key([("a", SET(1))]) != shape_key([("a", SET(1, 2))])
+        assert shape_key([("a", LIKE("x"))]) != shape_key([("a", LIKE("x", case_sensitive=True))])
+        assert shape_key([("a", IS(None))]) != shape_key([("a", IS(True))])
+        assert shape_key([("a", IS(1))]) != shape_key([("a", IS(True))])
+        assert shape_key([("a", IS(0.0))]) != shape_key([("a", IS(False))])
+        assert shape_key([("a", ASC(0))]) != shape_key([("a", ASC(1))])
+        assert shape_key([("a", EQ(1)), ("b", EQ(1))]) != shape_key([("b", EQ(1)), ("a", EQ(1))])
+
+
+class TestShape:
+    """Test class for Shape."""
+
+    def test_properties(self):
+        """Test field names and slice presence."""
+        shape = Shape(shape_key([("a", EQ(1)), ("b", NOT(EQ(1))), ("limit", Limit(1))]))
+        assert shape.fields == ("a", "b", "limit")
+        assert shape.has_limit
+        assert not shape.has_offset
+
+    def test_equality_and_hash(self):
+        """Test that shapes compare by key."""
+        left = Shape(shape_key([("a", EQ(1))]))
+        right = Shape(shape_key([("a", EQ(2))]))
+        assert left == right
+        assert hash(left) == hash(right)
+        assert left != Shape(shape_key([("a", GT(1))]))
+
+
+class TestShapeTable:
+    """Test class for ShapeTable."""
+
+    def test_interns_shapes(self):
+        """Test that streams of the same shape share one Shape instance."""
+        table = ShapeTable()
+        first = table.intern([("a", EQ(1)), ("offset", Offset(0))])
+        second = table.intern(iter([("a", EQ(2)), ("offset", Offset(10))]))
+        assert first is second
+        assert (table.hits, table.misses, len(table)) == (1, 1, 1)
+
+    def test_bounded(self):
+        """Test that the table evicts the least recently used shape."""
+        table = ShapeTable(maxsize=2)
+        a = table.intern([("a", EQ(1))])
+        table.intern([("b", EQ(1))])
+        table.intern([("a", EQ(1))])
+        table.intern([("c", EQ(1))])
+        assert len(table) == 2
+        assert table.evictions == 1
+        assert table.intern([("a", EQ(1))]) is a
+        assert table.intern([("b", EQ(1))]) == Shape(shape_key([("b", EQ(1))]))
+        assert table.evictions == 2
+
+    def test_clear(self):
+        """Test clearing the table."""
+        table = ShapeTable()
+        table.intern([("a", EQ(1))])
+        table.clear()
+        assert len(table) == 0
+
+    def test_invalid_size(self):
+        """Test that non-positive sizes are rejected."""
+        with pytest.raises(ValueError):
+            ShapeTable(maxsize=0)
+
+    def test_global_table(self):
+        """Test that shape_of uses the module level table."""
+        assert shape_of([("zz", EQ(1))]) is shape_of([("zz", EQ(2))])
+        assert len(shapes) >= 1
+
+
+class TestValues:
+    """Test class for values."""
+
+    def test_bind_order(self):
+        """Test that values follow filters, then Limit, then Offset."""
+        stream = [("offset", Offset(4)), ("a", NOT(RANGE(GE(1), LT(2)))), ("limit", Limit(3)), ("b", IS(None))]
+        assert values(stream) == [1, 2, 3, 4]
+
+    def test_set_members(self):
+        """Test that SET contributes every member."""
+        assert sorted(values([("a", SET(1, 2, 3))])) == [1, 2, 3]
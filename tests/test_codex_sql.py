@@ -0,0 +1,179 @@
+"""
+Tests for the codex.sql module.
+"""
+
+import sqlite3
+
+import pytest
+
+from zodchy.codex.operator import (
+    ASC,
+    DESC,
+    EQ,
+    GE,
+    GT,
+    IS,
+    LE,
+    LIKE,
+    LT,
+    NE,
+    NOT,
+    RANGE,
+    SET,
+    FilterBit,
+    Limit,
+    Offset,
+)
+from zodchy.codex.sql import SQLCompiler, quote
+
+ROWS = [
+    (1, "alice", 30, None),
+    (2, "Bob", 25, "x"),
+    (3, "anna", 41, "y"),
+    (4, "carl", 19, None),
+    (5, "alex", 25, "x"),
+]
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE users (id INTEGER, name TEXT, age INTEGER, tag TEXT)")
+    connection.executemany("INSERT INTO users VALUES (?, ?, ?, ?)", ROWS)
+    yield connection
+    connection.close()
+
+
+def fetch_ids(connection, compiler, stream):
+    statement = compiler(stream)
+    return [row[0] for row in connection.execute(statement.text, statement.params)]
+
+
+class TestQuote:
+    """Test class for quote."""
+
+    def test_escapes_quotes(self):
+        """Test that embedded double quotes are escaped."""
+        assert quote('a"b') == '"a""b"'
+
+
+class TestSQLCompiler:
+    """Test class for SQLCompiler."""
+
+    @pytest.mark.parametrize(
+        "stream, expected",
+        [
+            ([("id", EQ(3))], [3]),
+            ([("id", NE(3)), ("id", ASC())], [1, 2, 4, 5]),
+            ([("age", LE(25)), ("id", ASC())], [2, 4, 5]),
+            ([("age", GE(30)), ("id", ASC())], [1, 3]),
+            ([("age", LT(25))], [4]),
+            ([("age", GT(30))], [3]),
+            ([("tag", IS(None)), ("id", ASC())], [1, 4]),
+            ([("name", LIKE("A%")), ("id", ASC())], [1, 3, 5]),
+            ([("id", SET(1, 3, 9)), ("id", ASC())], [1, 3]),
+            ([("id", SET())], []),
+            ([("age", RANGE(GT(19), LE(30))), ("id", ASC())], [1, 2, 5]),
+            ([("age", RANGE(None, None)), ("id", DESC())], [5, 4, 3, 2, 1]),
+            ([("id", NOT(SET(1, 2))), ("id", ASC())], [3, 4, 5]),
+            ([("tag", NOT(IS(None))), ("id", ASC())], [2, 3, 5]),
+        ],
+    )
+    def test_filters_against_sqlite(self, connection, stream, expected):
+        """Test generated filters against sqlite3."""
+        assert fetch_ids(connection, SQLCompiler("users", ["id"]), stream) == expected
+
+    def test_order_limit_offset(self, connection):
+        """Test ordering by priority with Limit and Offset."""
+        stream = [("id", ASC(1)), ("age", DESC(0)), ("limit", Limit(2)), ("offset", Offset(1))]
+        assert fetch_ids(connection, SQLCompiler("users", ["id"]), stream) == [1, 2]
+
+    def test_offset_without_limit(self, connection):
+        """Test that Offset alone compiles to a statement sqlite accepts."""
+        stream = [("id", ASC()), ("offset", Offset(2))]
+        assert SQLCompiler("users", ["id"])(stream).text.endswith("LIMIT -1 OFFSET ?")
+        assert fetch_ids(connection, SQLCompiler("users", ["id"]), stream) == [3, 4, 5]
+        assert SQLCompiler("users", unlimited="ALL")(stream).text.endswith("LIMIT ALL OFFSET ?")
+
+    @pytest.mark.parametrize(
+        "style, text, params",
+        [
+            ("qmark", '"id" = ? AND "age" > ? LIMIT ?', (1, 2, 3)),
+            ("numeric", '"id" = :1 AND "age" > :2 LIMIT :3', (1, 2, 3)),
+            ("named", '"id" = :p0 AND "age" > :p1 LIMIT :p2', {"p0": 1, "p1": 2, "p2": 3}),
+            ("format", '"id" = %s AND "age" > %s LIMIT %s', (1, 2, 3)),
+            ("pyformat", '"id" = %(p0)s AND "age" > %(p1)s LIMIT %(p2)s', {"p0": 1, "p1": 2, "p2": 3}),
+            ("dollar", '"id" = $1 AND "age" > $2 LIMIT $3', (1, 2, 3)),
+        ],
+    )
+    def test_placeholder_styles(self, style, text, params):
+        """Test every supported placeholder style."""
+        statement = SQLCompiler("users", style=style)([("id", EQ(1)), ("age", GT(2)), ("limit", Limit(3))])
+        assert statement.text == f"SELECT * FROM users WHERE {text}"
+        assert statement.params == params
+
+    def test_named_styles_against_sqlite(self, connection):
+        """Test that named and numeric styles execute in sqlite3."""
+        stream = [("id", SET(1, 2)), ("name", LIKE("a%")), ("limit", Limit(5))]
+        for style in ("named", "numeric"):
+            assert fetch_ids(connection, SQLCompiler("users", ["id"], style=style), stream) == [1]
+
+    def test_field_names_are_quoted(self):
+        """Test that user supplied field names cannot break out of identifiers."""
+        statement = SQLCompiler("users")([('id" OR 1=1 --', EQ(1))])
+        assert statement.text == 'SELECT * FROM users WHERE "id"" OR 1=1 --" = ?'
+
+    def test_statement_cached_by_shape(self):
+        """Test that streams differing only in values reuse the statement text."""
+        compiler = SQLCompiler("users")
+        first = compiler([("id", EQ(1)), ("tag", SET("a", "b")), ("limit", Limit(1))])
+        second = compiler([("id", EQ(2)), ("tag", SET("c", "d")), ("limit", Limit(5))])
+        third = compiler([("id", EQ(2)), ("tag", SET("c", "d", "e"))])
+        assert first.text is second.text
+        assert second.params[0] == 2
+        assert third.text != second.text
+        assert (compiler.hits, compiler.misses) == (1, 2)
+
+    def test_cache_is_bounded(self):
+        """Test that the statement cache evicts old shapes."""
+        compiler = SQLCompiler("users", cache_size=1)
+        compiler([("id", EQ(1))])
+        compiler([("age", EQ(1))])
+        compiler([("id", EQ(1))])
+        assert compiler.misses == 3
+
+    def test_case_sensitive_like(self):
+        """Test that case sensitive LIKE compares the column directly."""
+        statement = SQLCompiler("users")([("name", LIKE("A%", case_sensitive=True))])
+        assert statement.text.endswith('WHERE "name" LIKE ?')
+
+    def test_invalid_style(self):
+        """Test that unknown placeholder styles are rejected."""
+        with pytest.raises(ValueError):
+            SQLCompiler("users", style="unknown")
+
+    def test_unsupported_is_value(self):
+        """Test that IS only accepts NULL and boolean literals."""
+        with pytest.raises(ValueError):
+            SQLCompiler("users")([("id", IS("x"))])
+        for value in (0, 1):
+            with pytest.raises(ValueError):
+                SQLCompiler("users")([("id", IS(value))])
+
+    def test_is_literals_cached_by_identity(self):
+        """Test that a cached IS TRUE statement is not reused for IS(1)."""
+        compiler = SQLCompiler("users")
+        assert compiler([("id", IS(True))]).text.endswith('"id" IS TRUE')
+        assert compiler([("id", IS(False))]).text.endswith('"id" IS FALSE')
+        for value in (1, 0, 0.0):
+            with pytest.raises(ValueError):
+                compiler([("id", IS(value))])
+
+    def test_unsupported_bit(self):
+        """Test that unknown filter bits are rejected."""
+
+        class Custom(FilterBit[int]):
+            pass
+
+        with pytest.raises(TypeError):
+            SQLCompiler("users")([("id", Custom(1))])
@@ -0,0 +1,96 @@
+"""
+Tests for the codex.streaming module.
+"""
+
+import contextlib
+
+from zodchy.codex.operator import ASC, GT, Limit, Offset
+from zodchy.codex.streaming import aiterate, iterate
+
+
+class Source:
+    """Row source that records how far it was consumed and whether it was closed."""
+
+    def __init__(self, count: int):
+        self.count = count
+        self.pulled = 0
+        self.closed = False
+
+    def rows(self):
+        try:
+            for index in range(self.count):
+                self.pulled += 1
+                yield {"id": index}
+        finally:
+            self.closed = True
+
+    async def arows(self):
+        try:
+            for index in range(self.count):
+                self.pulled += 1
+                yield {"id": index}
+        finally:
+            self.closed = True
+
+
+class TestIterate:
+    """Test class for iterate."""
+
+    def test_filters_rows(self):
+        """Test that only matching rows are yielded."""
+        rows = [{"id": index} for index in range(5)]
+        assert [row["id"] for row in iterate([("id", GT(2)), ("id", ASC())], rows)] == [3, 4]
+
+    def test_offset_and_limit(self):
+        """Test that Offset skips matching rows and Limit stops early."""
+        source = Source(100)
+        stream = [("id", GT(10)), ("offset", Offset(2)), ("limit", Limit(3))]
+        assert [row["id"] for row in iterate(stream, source.rows())] == [13, 14, 15]
+        assert source.pulled == 16
+        assert source.closed
+
+    def test_zero_limit_pulls_nothing(self):
+        """Test that Limit(0) does not touch the source."""
+        source = Source(10)
+        assert list(iterate([("limit", Limit(0))], source.rows())) == []
+        assert source.pulled == 0
+
+    def test_consumer_stop_closes_source(self):
+        """Test that closing the stage closes the upstream iterator."""
+        source = Source(100)
+        stage = iterate([], source.rows())
+        next(stage)
+        stage.close()
+        assert source.closed
+        assert source.pulled == 1
+
+
+class TestAiterate:
+    """Test class for aiterate."""
+
+    async def test_filters_and_limits(self):
+        """Test filtering and pagination over an async source."""
+        source = Source(100)
+        stream = [("id", GT(10)), ("offset", Offset(2)), ("limit", Limit(3))]
+        result = [row["id"] async for row in aiterate(stream, source.arows())]
+        assert result == [13, 14, 15]
+        assert source.pulled == 16
+        assert source.closed
+
+    async def test_consumer_stop_closes_source(self):
+        """Test that closing the stage closes the upstream async iterator."""
+        source = Source(100)
+        async with contextlib.aclosing(aiterate([], source.arows())) as stage:
+            async for _ in stage:
+                break
+        assert source.closed
+        assert source.pulled == 1
+
+    async def test_plain_async_iterable(self):
+        """Test that async iterables without aclose are accepted."""
+
+        class Rows:
+            def __aiter__(self):
+                return Source(3).arows()
+
+        assert [row["id"] async for row in aiterate([("id", GT(0))], Rows())] == [1, 2]
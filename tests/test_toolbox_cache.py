@@ -0,0 +1,177 @@
+"""
+Tests for the toolbox.cache module.
+"""
+
+import pytest
+
+from zodchy.codex.cqea import Query, View
+from zodchy.codex.operator import EQ, SET, ClauseStream, Limit
+from zodchy.toolbox.cache import CacheStats, LRUCache, QueryCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ItemsQuery(Query):
+    def __init__(self, *clauses):
+        self.clauses = clauses
+
+    def __iter__(self) -> ClauseStream:
+        return iter(self.clauses)
+
+
+class OtherQuery(ItemsQuery):
+    pass
+
+
+class ItemsView(View):
+    def __init__(self, payload):
+        self.payload = payload
+
+    def data(self):
+        return self.payload
+
+
+class TestCacheStats:
+    """Test class for CacheStats."""
+
+    def test_hit_ratio(self):
+        """Test hit ratio calculation."""
+        assert CacheStats().hit_ratio == 0.0
+        assert CacheStats(hits=3, misses=1).hit_ratio == 0.75
+
+
+class TestLRUCache:
+    """Test class for LRUCache."""
+
+    def test_get_and_set(self):
+        """Test basic get and set with counters."""
+        cache = LRUCache(maxsize=2)
+        assert cache.get("a") is None
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted."""
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert "b" not in cache
+        assert "a" in cache
+        assert cache.stats.evictions == 1
+        assert len(cache) == 2
+
+    def test_ttl_expiration(self):
+        """Test that entries expire after ttl."""
+        clock = FakeClock()
+        cache = LRUCache(maxsize=2, ttl=10, clock=clock)
+        cache.set("a", 1)
+        clock.now = 9.9
+        assert cache.get("a") == 1
+        clock.now = 10
+        assert cache.get("a") is None
+        assert cache.stats.expirations == 1
+        assert len(cache) == 0
+
+    def test_pop_and_clear(self):
+        """Test pop and clear."""
+        cache = LRUCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.pop("a") == 1
+        assert cache.pop("a") is None
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.weight == 0
+
+    def test_weight_accounting(self):
+        """Test that entry weights are tracked and bound the cache."""
+        cache = LRUCache(maxweight=10, weigher=lambda key, value: len(value))
+        cache.set("a", "xxxx")
+        cache.set("b", "xxxx")
+        assert cache.weight == 8
+        cache.set("a", "xx")
+        assert cache.weight == 6
+        cache.set("c", "xxxxxx")
+        assert "b" not in cache
+        assert cache.weight == 8
+        assert cache.stats.evictions == 1
+        cache.pop("a")
+        assert cache.weight == 6
+
+    def test_entry_heavier_than_limit_is_not_stored(self):
+        """Test that an entry exceeding maxweight is dropped."""
+        cache = LRUCache(maxweight=3, weigher=lambda key, value: len(value))
+        cache.set("a", "xx")
+        cache.set("a", "xxxx")
+        assert "a" not in cache
+        assert cache.weight == 0
+
+    def test_expired_entry_releases_weight(self):
+        """Test that expiration updates the weight."""
+        clock = FakeClock()
+        cache = LRUCache(ttl=1, clock=clock, weigher=lambda key, value: 5)
+        cache.set("a", 1)
+        clock.now = 2
+        cache.get("a")
+        assert cache.weight == 0
+
+    @pytest.mark.parametrize("kwargs", [{"maxsize": 0}, {"ttl": 0}, {"maxweight": 1}])
+    def test_invalid_arguments(self, kwargs):
+        """Test that invalid sizes are rejected."""
+        with pytest.raises(ValueError):
+            LRUCache(**kwargs)
+
+
+class TestQueryCache:
+    """Test class for QueryCache."""
+
+    def test_equivalent_queries_share_entry(self):
+        """Test that queries with equivalent clause streams hit the same entry."""
+        cache = QueryCache()
+        view = ItemsView([1])
+        cache.set(ItemsQuery(("id", EQ(1)), ("status", SET("a", "b")), ("limit", Limit(10))), view)
+        query = ItemsQuery(("status", SET("b", "a")), ("id", EQ(1)), ("limit", Limit(10)))
+        assert cache.get(query) is view
+        assert cache.stats.hits == 1
+
+    def test_query_type_is_part_of_key(self):
+        """Test that different query types do not share entries."""
+        cache = QueryCache()
+        cache.set(ItemsQuery(("id", EQ(1))), ItemsView([1]))
+        assert cache.get(OtherQuery(("id", EQ(1)))) is None
+        assert cache.stats.misses == 1
+
+    def test_eviction_counter(self):
+        """Test that evictions are counted."""
+        cache = QueryCache(maxsize=1)
+        cache.set(ItemsQuery(("id", EQ(1))), ItemsView([1]))
+        cache.set(ItemsQuery(("id", EQ(2))), ItemsView([2]))
+        assert cache.stats.evictions == 1
+        assert len(cache) == 1
+
+    def test_invalidate_by_type(self):
+        """Test invalidation by query type including subclasses."""
+        cache = QueryCache()
+        cache.set(ItemsQuery(("id", EQ(1))), ItemsView([1]))
+        cache.set(OtherQuery(("id", EQ(1))), ItemsView([1]))
+        cache.invalidate(OtherQuery)
+        assert len(cache) == 1
+        cache.invalidate(ItemsQuery)
+        assert len(cache) == 0
+
+    def test_invalidate_all(self):
+        """Test invalidation of every entry."""
+        cache = QueryCache()
+        cache.set(ItemsQuery(("id", EQ(1))), ItemsView([1]))
+        cache.invalidate()
+        assert len(cache) == 0
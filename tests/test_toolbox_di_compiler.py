@@ -0,0 +1,173 @@
+"""
+Tests for the toolbox.di.compiler module.
+"""
+
+import pytest
+
+from zodchy.toolbox.di import Container
+from zodchy.toolbox.di.compiler import generate, sort
+from zodchy.toolbox.di.plan import Planner
+from zodchy.toolbox.di.providers import analyse
+
+
+class Settings:
+    pass
+
+
+class Engine:
+    def __init__(self, settings: Settings):
+        self.settings = settings
+
+
+class Session:
+    def __init__(self, engine: Engine, settings: Settings, /, retries: int = 3):
+        self.engine = engine
+        self.settings = settings
+        self.retries = retries
+
+
+class Request:
+    pass
+
+
+class Handler:
+    def __init__(self, session: Session, request: Request, label: str = "default"):
+        self.session = session
+        self.request = request
+        self.label = label
+
+
+class Client:
+    pass
+
+
+async def connect(settings: Settings) -> Client:
+    return Client()
+
+
+class Left:
+    def __init__(self, right: "Right"):
+        self.right = right
+
+
+class Right:
+    def __init__(self, left: Left):
+        self.left = left
+
+
+def providers(*implementations):
+    return {provider.contract: provider for provider in map(analyse, implementations)}
+
+
+class TestSort:
+    """Test class for sort."""
+
+    def test_dependencies_first(self):
+        """Test that every contract comes after its dependencies."""
+        order = sort(providers(Handler, Session, Engine, Settings), context=[Request])
+        assert order == (Settings, Engine, Session, Handler)
+
+    def test_missing_reported_together(self):
+        """Test that all unregistered dependencies are listed at once."""
+        with pytest.raises(LookupError) as error:
+            sort(providers(Handler, Session))
+        message = str(error.value)
+        assert "Engine (required by Session)" in message
+        assert "Settings (required by Session)" in message
+        assert "Request (required by Handler)" in message
+
+    def test_defaults_are_not_missing(self):
+        """Test that dependencies with defaults may stay unregistered."""
+        assert sort(providers(Session, Engine, Settings)) == (Settings, Engine, Session)
+
+    def test_cycle(self):
+        """Test that a cycle is reported with its path."""
+        with pytest.raises(ValueError, match="Circular dependency: Left -> Right -> Left"):
+            sort(providers(Left, Right))
+
+
+class TestGenerate:
+    """Test class for generate."""
+
+    async def test_generated_resolvers(self):
+        """Test that generated functions build the graph."""
+        container = Container()
+        container.register_dependency(Settings, cache_scope="container")
+        container.register_dependency(Engine)
+        container.register_dependency(Session)
+        compiled = generate(Planner(container._providers, container._callbacks, container._ids), [Session])
+        resolver = container.get_resolver()
+        session = await compiled[Session](resolver)
+        assert isinstance(session.engine, Engine)
+        assert session.settings is session.engine.settings is container._instances[container._ids[Settings]]
+        assert session.retries == 3
+
+
+class TestFreeze:
+    """Test class for Container.freeze."""
+
+    def make_container(self):
+        container = Container()
+        container.register_dependency(Settings, cache_scope="container")
+        container.register_dependency(Engine, cache_scope="container")
+        container.register_dependency(Session, cache_scope="resolver")
+        container.register_dependency(Handler)
+        container.register_dependency(connect, cache_scope="container")
+        return container
+
+    async def test_resolves_after_freeze(self):
+        """Test that a frozen container resolves with generated functions."""
+        container = self.make_container()
+        container.freeze(context=[Request])
+        assert container.frozen
+        request = Request()
+        resolver = container.get_resolver(request)
+        handler = await resolver.resolve(Handler)
+        assert handler.request is request
+        assert handler.label == "default"
+        assert handler.session is await resolver.resolve(Session)
+        assert isinstance(await resolver.resolve(Client), Client)
+        other = await container.get_resolver(Request()).resolve(Handler)
+        assert other.session is not handler.session
+        assert other.session.engine is handler.session.engine
+
+    async def test_missing_context_at_resolve(self):
+        """Test that a declared context type absent from the resolver raises."""
+        container = self.make_container()
+        container.freeze(context=[Request])
+        with pytest.raises(LookupError, match="Request"):
+            await container.get_resolver().resolve(Handler)
+
+    def test_undeclared_context_fails_freeze(self):
+        """Test that freeze reports dependencies nobody provides."""
+        with pytest.raises(LookupError, match="Request"):
+            self.make_container().freeze()
+
+    def test_registration_after_freeze(self):
+        """Test that a frozen container rejects registrations."""
+        container = self.make_container()
+        container.freeze(context=[Request])
+        with pytest.raises(RuntimeError):
+            container.register_dependency(Settings)
+        with pytest.raises(RuntimeError):
+            container.register_callback(Settings, lambda dependency, context: None, "shutdown")
+
+    async def test_callbacks_tracked(self):
+        """Test that generated functions record instances for shutdown callbacks."""
+        closed = []
+        container = self.make_container()
+        container.register_callback(Session, lambda dependency, context: closed.append("session"), "shutdown")
+        container.register_callback(Engine, lambda dependency, context: closed.append("engine"), "shutdown")
+        container.freeze(context=[Request])
+        async with container:
+            async with container.get_resolver(Request()) as resolver:
+                await resolver.resolve(Handler)
+            assert closed == ["session"]
+        assert closed == ["session", "engine"]
+
+    async def test_overrides_still_apply(self):
+        """Test that resolve context overrides work on a frozen container."""
+        container = self.make_container()
+        container.freeze(context=[Request])
+        handler = await container.get_resolver(Request()).resolve(Handler, {"label": "custom"})
+        assert handler.label == "custom"
@@ -0,0 +1,252 @@
+"""
+Tests for the toolbox.di.concurrency module.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from zodchy.toolbox.di import Container
+from zodchy.toolbox.di.concurrency import gather, single_flight
+from zodchy.toolbox.di.plan import MISSING
+
+DELAY = 0.05
+
+
+class Database:
+    pass
+
+
+class Broker:
+    pass
+
+
+class Storage:
+    pass
+
+
+class Application:
+    def __init__(self, database: Database, broker: Broker, storage: Storage):
+        self.database = database
+        self.broker = broker
+        self.storage = storage
+
+
+def make_container(concurrent: bool = True, scope: str | None = "container") -> tuple[Container, list[str]]:
+    calls: list[str] = []
+
+    async def database() -> Database:
+        calls.append("database")
+        await asyncio.sleep(DELAY)
+        return Database()
+
+    async def broker() -> Broker:
+        calls.append("broker")
+        await asyncio.sleep(DELAY)
+        return Broker()
+
+    async def storage() -> Storage:
+        calls.append("storage")
+        await asyncio.sleep(DELAY)
+        return Storage()
+
+    container = Container(concurrent=concurrent)
+    container.register_dependency(database, cache_scope=scope)
+    container.register_dependency(broker, cache_scope=scope)
+    container.register_dependency(storage, cache_scope=scope)
+    container.register_dependency(Application)
+    return container, calls
+
+
+async def timed(container: Container) -> float:
+    start = time.perf_counter()
+    application = await container.get_resolver().resolve(Application)
+    assert isinstance(application.storage, Storage)
+    return time.perf_counter() - start
+
+
+class TestConcurrentResolution:
+    """Test class for concurrent resolution of independent dependencies."""
+
+    @pytest.mark.parametrize("scope", ["container", "resolver", None])
+    @pytest.mark.parametrize("frozen", [False, True])
+    async def test_independent_branches_overlap(self, scope, frozen):
+        """Test that independent async dependencies are awaited together."""
+        container, _ = make_container(scope=scope)
+        if frozen:
+            container.freeze()
+        assert await timed(container) < 2 * DELAY
+
+    @pytest.mark.parametrize("frozen", [False, True])
+    async def test_sequential_by_default(self, frozen):
+        """Test that a container built without the flag awaits one branch at a time."""
+        container, _ = make_container(concurrent=False)
+        if frozen:
+            container.freeze()
+        assert await timed(container) >= 3 * DELAY
+
+    @pytest.mark.parametrize("frozen", [False, True])
+    async def test_cached_after_first_resolve(self, frozen):
+        """Test that later resolves reuse the instances without rebuilding."""
+        container, calls = make_container()
+        if frozen:
+            container.freeze()
+        first = await container.get_resolver().resolve(Application)
+        second = await container.get_resolver().resolve(Application)
+        assert first.database is second.database
+        assert sorted(calls) == ["broker", "database", "storage"]
+
+    @pytest.mark.parametrize("concurrent", [False, True])
+    @pytest.mark.parametrize("frozen", [False, True])
+    async def test_single_flight(self, concurrent, frozen):
+        """Test that racing resolves of a cached async dependency build it once."""
+        container, calls = make_container(concurrent=concurrent)
+        if frozen:
+            container.freeze()
+        applications = await asyncio.gather(*(container.get_resolver().resolve(Application) for _ in range(5)))
+        assert calls.count("database") == 1
+        assert len({id(application.database) for application in applications}) == 1
+
+    @pytest.mark.parametrize("frozen", [False, True])
+    async def test_failure_cancels_siblings(self, frozen):
+        """Test that a failing branch cancels the others and is not cached."""
+        finished = []
+
+        async def database() -> Database:
+            await asyncio.sleep(DELAY)
+            finished.append("database")
+            return Database()
+
+        async def broker() -> Broker:
+            raise ConnectionError("broker")
+
+        container, _ = make_container()
+        container.register_dependency(database, cache_scope="container")
+        container.register_dependency(broker, cache_scope="container")
+        if frozen:
+            container.freeze()
+        with pytest.raises(ConnectionError):
+            await container.get_resolver().resolve(Application)
+        await asyncio.sleep(2 * DELAY)
+        assert finished == []
+        assert not container._pending
+
+    @pytest.mark.parametrize("frozen", [False, True])
+    async def test_cancelled_build_is_taken_over(self, frozen):
+        """Test that a waiter on a shared build is not cancelled with the request that started it."""
+        builds = []
+
+        async def database() -> Database:
+            builds.append("database")
+            await asyncio.sleep(2 * DELAY)
+            return Database()
+
+        async def broker() -> Broker:
+            await asyncio.sleep(DELAY / 2)
+            raise ConnectionError("broker")
+
+        container, _ = make_container()
+        container.register_dependency(database, cache_scope="container")
+        container.register_dependency(broker)
+        if frozen:
+            container.freeze()
+
+        async def other_request():
+            await asyncio.sleep(DELAY / 10)
+            return await container.get_resolver().resolve(Database)
+
+        first, second = await asyncio.gather(
+            container.get_resolver().resolve(Application), other_request(), return_exceptions=True
+        )
+        assert isinstance(first, ConnectionError)
+        assert isinstance(second, Database)
+        assert builds == ["database", "database"]
+        assert await container.get_resolver().resolve(Database) is second
+
+
+class TestSingleFlight:
+    """Test class for single_flight."""
+
+    async def test_waiters_share_result(self):
+        """Test that callers arriving during a build receive the same instance."""
+        pending: dict = {}
+        instances = [MISSING]
+        builds = []
+
+        async def build(resolver):
+            builds.append(resolver)
+            await asyncio.sleep(0)
+            return object()
+
+        results = await asyncio.gather(*(single_flight(pending, instances, 0, build, None) for _ in range(3)))
+        assert len(builds) == 1
+        assert results[0] is results[1] is results[2] is instances[0]
+        assert pending == {}
+
+    async def test_waiters_share_error(self):
+        """Test that a failed build is reported to every waiter and left uncached."""
+        pending: dict = {}
+        instances = [MISSING]
+
+        async def build(resolver):
+            await asyncio.sleep(0)
+            raise RuntimeError("build")
+
+        results = await asyncio.gather(
+            *(single_flight(pending, instances, 0, build, None) for _ in range(2)),
+            return_exceptions=True,
+        )
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert instances == [MISSING] and pending == {}
+
+    async def test_cancelled_builder_hands_over(self):
+        """Test that cancelling the builder lets a waiter build instead of cancelling it."""
+        pending: dict = {}
+        instances = [MISSING]
+        started = asyncio.Event()
+
+        async def build(resolver):
+            started.set()
+            await asyncio.sleep(resolver)
+            return resolver
+
+        builder = asyncio.ensure_future(single_flight(pending, instances, 0, build, 10))
+        await started.wait()
+        waiter = asyncio.ensure_future(single_flight(pending, instances, 0, build, 0))
+        await asyncio.sleep(0)
+        builder.cancel()
+        assert await waiter == 0
+        assert builder.cancelled()
+        assert instances == [0] and pending == {}
+
+
+class TestGather:
+    """Test class for gather."""
+
+    async def test_results_in_order(self):
+        """Test that results come back in argument order."""
+
+        async def value(result, delay):
+            await asyncio.sleep(delay)
+            return result
+
+        assert await gather(value(1, 0.02), value(2, 0)) == [1, 2]
+
+    async def test_failure_cancels_pending(self):
+        """Test that siblings are cancelled when one awaitable fails."""
+        cancelled = []
+
+        async def slow():
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        async def fail():
+            raise ValueError("fail")
+
+        with pytest.raises(ValueError):
+            await gather(slow(), fail())
+        assert cancelled == [True]
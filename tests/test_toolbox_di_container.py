@@ -0,0 +1,270 @@
+"""
+Tests for the toolbox.di.container module.
+"""
+
+import pytest
+
+from zodchy.toolbox.di import Container, DIContainerContract, DIResolverContract
+
+
+class Settings:
+    def __init__(self, dsn: str = "sqlite://"):
+        self.dsn = dsn
+
+
+class Engine:
+    def __init__(self, settings: Settings):
+        self.settings = settings
+
+
+class Session:
+    def __init__(self, engine: Engine, settings: Settings):
+        self.engine = engine
+        self.settings = settings
+
+
+class Repository:
+    def __init__(self, session: Session, *, page_size: int = 50):
+        self.session = session
+        self.page_size = page_size
+
+
+class Service:
+    def __init__(self, repository: Repository, other: Repository):
+        self.repository = repository
+        self.other = other
+
+
+class Request:
+    def __init__(self, path: str):
+        self.path = path
+
+
+class Handler:
+    def __init__(self, request: Request, session: Session):
+        self.request = request
+        self.session = session
+
+
+class Cache:
+    pass
+
+
+async def connect(settings: Settings) -> Cache:
+    return Cache()
+
+
+class Left:
+    def __init__(self, right: "Right"):
+        self.right = right
+
+
+class Right:
+    def __init__(self, left: Left):
+        self.left = left
+
+
+def make_container() -> Container:
+    container = Container()
+    container.register_dependency(Settings, cache_scope="container")
+    container.register_dependency(Engine, cache_scope="container")
+    container.register_dependency(Session, cache_scope="resolver")
+    container.register_dependency(Repository)
+    container.register_dependency(Service)
+    return container
+
+
+class TestContainer:
+    """Test class for Container."""
+
+    def test_implements_contracts(self):
+        """Test that the container and its resolvers satisfy the DI contracts."""
+        container: DIContainerContract = Container()
+        resolver: DIResolverContract = container.get_resolver()
+        assert container is not None and resolver is not None
+
+    async def test_resolves_graph(self):
+        """Test that constructor dependencies are injected."""
+        service = await make_container().get_resolver().resolve(Service)
+        assert isinstance(service.repository.session.engine.settings, Settings)
+        assert service.repository.page_size == 50
+
+    async def test_transient(self):
+        """Test that unscoped dependencies are rebuilt per resolve and shared within one."""
+        resolver = make_container().get_resolver()
+        service = await resolver.resolve(Service)
+        assert service.repository is service.other
+        assert await resolver.resolve(Repository) is not await resolver.resolve(Repository)
+
+    async def test_resolver_scope(self):
+        """Test that resolver-scoped instances are shared per resolver only."""
+        container = make_container()
+        first, second = container.get_resolver(), container.get_resolver()
+        assert await first.resolve(Session) is await first.resolve(Session)
+        assert await first.resolve(Session) is not await second.resolve(Session)
+
+    async def test_container_scope(self):
+        """Test that container-scoped instances are shared across resolvers."""
+        container = make_container()
+        first = await container.get_resolver().resolve(Session)
+        second = await container.get_resolver().resolve(Session)
+        assert first.engine is second.engine
+        assert first.settings is first.engine.settings
+
+    async def test_factory_and_async_factory(self):
+        """Test that factories, including coroutine functions, provide dependencies."""
+        container = make_container()
+        container.register_dependency(connect, cache_scope="container")
+        resolver = container.get_resolver()
+        cache = await resolver.resolve(Cache)
+        assert isinstance(cache, Cache)
+        assert await resolver.resolve(Cache) is cache
+
+    async def test_instance(self):
+        """Test that a registered instance is returned as is."""
+        container = make_container()
+        settings = Settings("postgres://")
+        container.register_dependency(settings)
+        engine = await container.get_resolver().resolve(Engine)
+        assert engine.settings is settings
+
+    async def test_explicit_contract(self):
+        """Test that an implementation can be bound to another contract."""
+
+        class Base:
+            pass
+
+        class Impl(Base):
+            pass
+
+        container = Container()
+        container.register_dependency(Impl, Base)
+        assert isinstance(await container.get_resolver().resolve(Base), Impl)
+
+    async def test_resolver_context(self):
+        """Test that objects passed to get_resolver are injected by type."""
+        container = make_container()
+        container.register_dependency(Handler)
+        handler = await container.get_resolver(Request("/users")).resolve(Handler)
+        assert handler.request.path == "/users"
+
+    async def test_missing_dependency(self):
+        """Test that an unregistered dependency raises LookupError."""
+        container = make_container()
+        container.register_dependency(Handler)
+        with pytest.raises(LookupError, match="Request"):
+            await container.get_resolver().resolve(Handler)
+
+    async def test_default_for_unregistered(self):
+        """Test that parameter defaults fill unregistered dependencies."""
+        container = Container()
+        container.register_dependency(Settings)
+        assert (await container.get_resolver().resolve(Settings)).dsn == "sqlite://"
+
+    async def test_call_context_overrides(self):
+        """Test that resolve context overrides by contract and by parameter name."""
+        container = make_container()
+        resolver = container.get_resolver()
+        session = await resolver.resolve(Session)
+        repository = await resolver.resolve(Repository, {"page_size": 10})
+        assert repository.page_size == 10
+        assert repository.session is session
+        replacement = object.__new__(Session)
+        service = await resolver.resolve(Service, {Session: replacement})
+        assert service.repository.session is replacement
+
+    async def test_cycle(self):
+        """Test that circular dependencies are reported."""
+        container = Container()
+        container.register_dependency(Left)
+        container.register_dependency(Right)
+        with pytest.raises(ValueError, match="Circular dependency: Left -> Right -> Left"):
+            await container.get_resolver().resolve(Left)
+
+    async def test_cycle_through_scopes(self):
+        """Test that cycles through cached dependencies are reported."""
+        container = Container()
+        container.register_dependency(Left, cache_scope="container")
+        container.register_dependency(Right, cache_scope="resolver")
+        with pytest.raises(ValueError, match="Circular dependency"):
+            await container.get_resolver().resolve(Left)
+
+    async def test_reregistration(self):
+        """Test that registering again replaces the provider and its plans."""
+        container = make_container()
+        resolver = container.get_resolver()
+        await resolver.resolve(Repository)
+
+        class Fake(Repository):
+            pass
+
+        container.register_dependency(Fake, Repository)
+        assert isinstance((await resolver.resolve(Service)).repository, Fake)
+
+    def test_contract_ids(self):
+        """Test that contracts get stable dense ids within their scope at registration."""
+        container = make_container()
+        assert [container._ids[contract] for contract in (Settings, Engine, Session)] == [0, 1, 0]
+        assert len(container._instances) == 2
+        assert len(container.get_resolver()._instances) == 1
+        container.register_dependency(Session, cache_scope="container")
+        assert container._ids[Session] == 2
+        container.register_dependency(Session, cache_scope="resolver")
+        assert container._ids[Session] == 0
+
+    async def test_reregistration_drops_cached_instance(self):
+        """Test that replacing a container-scoped provider forgets its instance."""
+        container = make_container()
+        first = await container.get_resolver().resolve(Settings)
+        container.register_dependency(Settings, cache_scope="container")
+        assert await container.get_resolver().resolve(Settings) is not first
+
+    async def test_resolver_created_before_registration(self):
+        """Test that an older resolver can cache contracts registered after it."""
+        container = make_container()
+        resolver = container.get_resolver()
+        container.register_dependency(connect, cache_scope="resolver")
+        assert await resolver.resolve(Cache) is await resolver.resolve(Cache)
+
+    async def test_resolver_shutdown_resets_scope(self):
+        """Test that a resolver forgets its instances on shutdown."""
+        resolver = make_container().get_resolver()
+        first = await resolver.resolve(Session)
+        await resolver.shutdown()
+        assert await resolver.resolve(Session) is not first
+
+    async def test_shutdown_callbacks(self):
+        """Test that shutdown callbacks run in reverse creation order per scope."""
+        calls = []
+        container = make_container()
+        container.register_callback(Engine, lambda dependency, context: calls.append(("engine", context)), "shutdown")
+
+        async def close_session(dependency, context):
+            calls.append(("session", context))
+
+        container.register_callback(Session, close_session, "shutdown")
+        async with container:
+            async with container.get_resolver() as resolver:
+                await resolver.resolve(Service)
+            assert calls == [("session", {})]
+        assert calls == [("session", {}), ("engine", {})]
+
+    async def test_shutdown_collects_errors(self):
+        """Test that failing callbacks do not stop the others."""
+        calls = []
+
+        def fail(dependency, context):
+            raise RuntimeError("close")
+
+        container = make_container()
+        container.register_callback(Settings, lambda dependency, context: calls.append(context["reason"]), "shutdown")
+        container.register_callback(Engine, fail, "shutdown")
+        await container.get_resolver().resolve(Engine)
+        with pytest.raises(ExceptionGroup):
+            await container.shutdown({"reason": "deploy"})
+        assert calls == ["deploy"]
+
+    def test_unknown_trigger(self):
+        """Test that only shutdown callbacks are supported."""
+        with pytest.raises(ValueError):
+            Container().register_callback(Engine, lambda dependency, context: None, "startup")
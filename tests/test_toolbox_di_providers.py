@@ -0,0 +1,90 @@
+"""
+Tests for the toolbox.di.providers module.
+"""
+
+import pytest
+
+from zodchy.toolbox.di.providers import EMPTY, Parameter, analyse
+
+
+class Settings:
+    pass
+
+
+class Repository:
+    def __init__(self, settings: Settings, retries: int = 3, *args, label="repo", **kwargs):
+        self.settings = settings
+
+
+class Plain:
+    pass
+
+
+def make_repository(settings: Settings) -> Repository:
+    return Repository(settings)
+
+
+async def open_repository(settings: Settings, /) -> Repository:
+    return Repository(settings)
+
+
+class TestAnalyse:
+    """Test class for analyse."""
+
+    def test_class(self):
+        """Test that a class is analysed through its constructor."""
+        provider = analyse(Repository)
+        assert provider.contract is Repository
+        assert provider.parameters == (
+            Parameter("settings", Settings, EMPTY, False),
+            Parameter("retries", int, 3, False),
+            Parameter("label", None, "repo", False),
+        )
+        assert not provider.is_async and not provider.is_value
+
+    def test_class_without_constructor(self):
+        """Test that a class with the default constructor has no parameters."""
+        assert analyse(Plain).parameters == ()
+
+    def test_factory_contract_from_return(self):
+        """Test that a factory's contract defaults to its return annotation."""
+        provider = analyse(make_repository, scope="resolver")
+        assert provider.contract is Repository
+        assert provider.scope == "resolver"
+
+    def test_async_factory(self):
+        """Test that coroutine functions are flagged as async."""
+        provider = analyse(open_repository)
+        assert provider.is_async
+        assert provider.parameters == (Parameter("settings", Settings, EMPTY, True),)
+
+    def test_instance(self):
+        """Test that an instance is treated as a shared value."""
+        settings = Settings()
+        provider = analyse(settings)
+        assert provider.is_value
+        assert provider.contract is Settings
+        assert provider.scope == "container"
+
+    def test_explicit_contract(self):
+        """Test that an explicit contract overrides inference."""
+        assert analyse(Repository, contract=object).contract is object
+
+    def test_missing_return_annotation(self):
+        """Test that a factory without return annotation needs a contract."""
+        with pytest.raises(TypeError, match="return annotation"):
+            analyse(lambda: None)
+
+    def test_missing_parameter_annotation(self):
+        """Test that required parameters must be annotated."""
+
+        def factory(settings) -> Repository:
+            return Repository(settings)
+
+        with pytest.raises(TypeError, match="'settings'"):
+            analyse(factory)
+
+    def test_unknown_scope(self):
+        """Test that an unknown cache scope is rejected."""
+        with pytest.raises(ValueError):
+            analyse(Plain, scope="request")
@@ -0,0 +1,143 @@
+"""
+Tests for the toolbox.di.shutdown module.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from zodchy.toolbox.di import Container, ShutdownError
+from zodchy.toolbox.di.shutdown import levels
+
+DELAY = 0.05
+
+
+class Settings:
+    pass
+
+
+class Database:
+    def __init__(self, settings: Settings):
+        self.settings = settings
+
+
+class Broker:
+    def __init__(self, settings: Settings):
+        self.settings = settings
+
+
+class Application:
+    def __init__(self, database: Database, broker: Broker):
+        self.database = database
+        self.broker = broker
+
+
+def make_container(**kwargs) -> Container:
+    container = Container(**kwargs)
+    for cls in (Settings, Database, Broker, Application):
+        container.register_dependency(cls, cache_scope="container")
+    return container
+
+
+def closing(events: list, label: str, delay: float = DELAY):
+    async def close(dependency, context):
+        events.append(("start", label))
+        await asyncio.sleep(delay)
+        events.append(("end", label))
+
+    return close
+
+
+class TestLevels:
+    """Test class for levels."""
+
+    def test_dependents_first(self):
+        """Test that instances are grouped by dependency depth, deepest first."""
+        container = make_container()
+        created = [(Settings, 1), (Database, 2), (Broker, 3), (Application, 4)]
+        assert levels(created, container.providers, {}) == [
+            [(Application, 4)],
+            [(Database, 2), (Broker, 3)],
+            [(Settings, 1)],
+        ]
+
+
+class TestShutdown:
+    """Test class for ordered concurrent shutdown."""
+
+    async def test_reverse_dependency_order(self):
+        """Test that dependents close before their dependencies regardless of creation order."""
+        events: list = []
+        container = make_container()
+        for cls in (Settings, Database, Broker, Application):
+            container.register_callback(cls, closing(events, cls.__name__, 0), "shutdown")
+        await container.get_resolver().resolve(Application)
+        await container.shutdown()
+        ends = [label for kind, label in events if kind == "end"]
+        assert ends[0] == "Application" and ends[-1] == "Settings"
+
+    async def test_level_runs_concurrently(self):
+        """Test that callbacks on the same level overlap."""
+        events: list = []
+        container = make_container()
+        container.register_callback(Database, closing(events, "database"), "shutdown")
+        container.register_callback(Broker, closing(events, "broker"), "shutdown")
+        await container.get_resolver().resolve(Application)
+        started = time.perf_counter()
+        await container.shutdown()
+        assert time.perf_counter() - started < 2 * DELAY
+        assert [kind for kind, _ in events] == ["start", "start", "end", "end"]
+
+    async def test_report(self):
+        """Test that the report records each callback's outcome and duration."""
+        container = make_container()
+        container.register_callback(Database, closing([], "database"), "shutdown")
+        container.register_callback(Settings, lambda dependency, context: None, "shutdown")
+        await container.get_resolver().resolve(Application)
+        await container.shutdown()
+        report = container.shutdown_report
+        assert [(timing.contract, timing.level, timing.outcome) for timing in report.callbacks] == [
+            (Database, 0, "ok"),
+            (Settings, 1, "ok"),
+        ]
+        assert report.callbacks[0].duration >= DELAY
+        assert report.duration >= report.callbacks[0].duration
+        assert "Database" in str(report)
+
+    async def test_callback_timeout(self):
+        """Test that a slow callback is abandoned without holding up the rest."""
+        events: list = []
+        container = make_container(callback_timeout=DELAY)
+        container.register_callback(Database, closing(events, "database", 10), "shutdown")
+        container.register_callback(Settings, closing(events, "settings", 0), "shutdown")
+        await container.get_resolver().resolve(Application)
+        with pytest.raises(ShutdownError) as info:
+            await container.shutdown()
+        assert isinstance(info.value.exceptions[0], TimeoutError)
+        assert [timing.outcome for timing in info.value.report.callbacks] == ["timed_out", "ok"]
+        assert ("end", "settings") in events
+
+    async def test_shutdown_timeout(self):
+        """Test that the global deadline cancels running callbacks and skips later levels."""
+        container = make_container(shutdown_timeout=DELAY)
+        container.register_callback(Database, closing([], "database", 10), "shutdown")
+        container.register_callback(Broker, closing([], "broker", 0), "shutdown")
+        container.register_callback(Settings, closing([], "settings", 0), "shutdown")
+        await container.get_resolver().resolve(Application)
+        started = time.perf_counter()
+        with pytest.raises(ShutdownError):
+            await container.shutdown()
+        assert time.perf_counter() - started < 10
+        outcomes = {timing.contract: timing.outcome for timing in container.shutdown_report.callbacks}
+        assert outcomes == {Database: "cancelled", Broker: "ok", Settings: "skipped"}
+
+    async def test_resolver_report(self):
+        """Test that resolvers report on their own shutdown."""
+        container = make_container()
+        container.register_dependency(Database, cache_scope="resolver")
+        container.register_callback(Database, lambda dependency, context: None, "shutdown")
+        async with container.get_resolver() as resolver:
+            await resolver.resolve(Database)
+        assert [timing.contract for timing in resolver.shutdown_report.callbacks] == [Database]
+        assert container.shutdown_report is None
@@ -2,14 +2,40 @@
 Tests for the toolbox.notation module.
 """
 
+import concurrent.futures
+import datetime
+import gc
+import uuid
+import weakref
+
 import pytest
 from collections.abc import Mapping
 from zodchy.toolbox.notation import (
+    BatchParserContract,
+    CachingParser,
+    Parser,
     ParserContract,
     ParamName,
     ParamValue,
 )
-from zodchy.codex.operator import ClauseStream
+from zodchy.codex.operator import (
+    ASC,
+    DESC,
+    EQ,
+    GE,
+    GT,
+    IS,
+    LE,
+    LIKE,
+    LT,
+    NE,
+    NOT,
+    RANGE,
+    SET,
+    ClauseStream,
+    Limit,
+    Offset,
+)
 
 
 class TestParserContract:
@@ -164,3 +190,274 @@ class TestParamTypes:
         value: ParamValue = "test_value"
         assert isinstance(value, str)
 
+
+TYPES_MAP = {
+    "id": int,
+    "name": str,
+    "score": float,
+    "active": bool,
+    "created": datetime.date,
+    "ref": uuid.UUID,
+}
+
+
+class TestParser:
+    """Test class for the reference Parser."""
+
+    def test_parser_implements_contract(self):
+        """Test that Parser satisfies ParserContract."""
+        parser: ParserContract = Parser()
+        assert list(parser("", TYPES_MAP)) == []
+
+    @pytest.mark.parametrize(
+        "query, expected",
+        [
+            ("id=5", ("id", EQ(5))),
+            ("id__eq=5", ("id", EQ(5))),
+            ("id__ne=5", ("id", NE(5))),
+            ("id__lt=5", ("id", LT(5))),
+            ("id__le=5", ("id", LE(5))),
+            ("id__gt=5", ("id", GT(5))),
+            ("id__ge=5", ("id", GE(5))),
+            ("name__like=Jo%25", ("name", LIKE("Jo%", case_sensitive=True))),
+            ("name__ilike=jo%25", ("name", LIKE("jo%"))),
+            ("id__in=1,2,3", ("id", SET(1, 2, 3))),
+            ("id__range=1,10", ("id", RANGE(GE(1), LE(10)))),
+            ("id__range=,10", ("id", RANGE(None, LE(10)))),
+            ("id__range=1,", ("id", RANGE(GE(1), None))),
+            ("name__is=null", ("name", IS(None))),
+            ("active__is=TRUE", ("active", IS(True))),
+            ("id__not_in=1,2", ("id", NOT(SET(1, 2)))),
+            ("name__not_is=null", ("name", NOT(IS(None)))),
+        ],
+    )
+    def test_operators(self, query, expected):
+        """Test every operator suffix."""
+        assert list(Parser()(query, TYPES_MAP)) == [expected]
+
+    def test_type_conversion(self):
+        """Test conversion through the types map."""
+        ref = uuid.uuid4()
+        result = dict(Parser()(f"score=1.5&active=yes&created=2024-01-02&ref={ref}&name=a+b", TYPES_MAP))
+        assert result["score"].value == 1.5
+        assert result["active"].value is True
+        assert result["created"].value == datetime.date(2024, 1, 2)
+        assert result["ref"].value == ref
+        assert result["name"].value == "a b"
+
+    def test_order_limit_offset(self):
+        """Test order, limit and offset parameters."""
+        result = list(Parser()("?order_by=-score,name&limit=10&offset=20", TYPES_MAP))
+        assert result == [("score", DESC(0)), ("name", ASC(1)), ("limit", Limit(10)), ("offset", Offset(20))]
+
+    def test_order_explicit_ascending(self):
+        """Test that a "+" prefix, unquoted to a space, still orders ascending."""
+        assert list(Parser()("order_by=+name,-score", TYPES_MAP)) == [("name", ASC(0)), ("score", DESC(1))]
+        assert list(Parser()({"order_by": "+name"}, TYPES_MAP)) == [("name", ASC(0))]
+
+    def test_mapping_query(self):
+        """Test parsing a mapping of raw parameters."""
+        result = list(Parser()({"id__gt": "1", "name": "x", "limit": "5"}, TYPES_MAP))
+        assert result == [("id", GT(1)), ("name", EQ("x")), ("limit", Limit(5))]
+
+    def test_unknown_parameters_are_skipped(self):
+        """Test that fields missing from the types map are ignored."""
+        assert list(Parser()("password=1&password__gte=2&flag&id=3", TYPES_MAP)) == [("id", EQ(3))]
+
+    @pytest.mark.parametrize(
+        "query",
+        ["id=abc", "active=maybe", "name__is=nothing", "limit=-1", "offset=x", "order_by=secret", "id__gte=5"],
+    )
+    def test_invalid_values(self, query):
+        """Test that invalid values raise ValueError."""
+        with pytest.raises(ValueError):
+            Parser()(query, TYPES_MAP)
+
+    def test_custom_parameter_names(self):
+        """Test configurable separator and control parameter names."""
+        parser = Parser(separator=":", order_param="sort", limit_param="size", offset_param="skip")
+        assert list(parser("id:gt=1&sort=id&size=2&skip=3", TYPES_MAP)) == [
+            ("id", GT(1)),
+            ("id", ASC(0)),
+            ("size", Limit(2)),
+            ("skip", Offset(3)),
+        ]
+
+    def test_tables_cached_by_identity(self):
+        """Test that converter tables are compiled once per types map object."""
+        parser = Parser()
+        assert parser.table(TYPES_MAP) is parser.table(TYPES_MAP)
+        assert parser.table(dict(TYPES_MAP)) is not parser.table(TYPES_MAP)
+
+    def test_tables_cache_is_bounded(self):
+        """Test that the table cache does not grow without limit."""
+        parser = Parser(tables_size=2)
+        maps = [{"id": int} for _ in range(3)]
+        for types_map in maps:
+            parser.table(types_map)
+        assert len(parser._tables) == 2
+
+
+class CountingParser:
+    def __init__(self):
+        self.calls = 0
+        self.parser = Parser()
+
+    def __call__(self, query, types_map):
+        self.calls += 1
+        return self.parser(query, types_map)
+
+
+class TestCachingParser:
+    """Test class for CachingParser."""
+
+    def test_repeated_queries_are_parsed_once(self):
+        """Test that identical query strings hit the cache."""
+        inner = CountingParser()
+        parser: ParserContract = CachingParser(inner)
+        first = parser("id=1&limit=5", TYPES_MAP)
+        second = parser("id=1&limit=5", TYPES_MAP)
+        assert first is second
+        assert first == (("id", EQ(1)), ("limit", Limit(5)))
+        assert inner.calls == 1
+        assert parser.stats.hits == 1
+        assert parser.stats.hit_ratio == 0.5
+
+    def test_mapping_queries(self):
+        """Test that equal mappings share an entry."""
+        inner = CountingParser()
+        parser = CachingParser(inner)
+        parser({"id": "1", "name": "x"}, TYPES_MAP)
+        parser({"id": "1", "name": "x"}, TYPES_MAP)
+        assert inner.calls == 1
+
+    def test_types_map_identity_is_part_of_key(self):
+        """Test that a different types map object is parsed separately."""
+        inner = CountingParser()
+        parser = CachingParser(inner)
+        assert parser("id=1", TYPES_MAP) == (("id", EQ(1)),)
+        assert parser("id=1", {"id": str}) == (("id", EQ("1")),)
+        assert inner.calls == 2
+
+    def test_bounded_by_size(self):
+        """Test that the cache evicts by entry count."""
+        parser = CachingParser(Parser(), maxsize=2)
+        for value in range(3):
+            parser(f"id={value}", TYPES_MAP)
+        assert len(parser) == 2
+        assert parser.stats.evictions == 1
+
+    def test_bounded_by_bytes(self):
+        """Test that the cache accounts for entry sizes and evicts by bytes."""
+        parser = CachingParser(Parser(), maxbytes=2000)
+        parser("id=1", TYPES_MAP)
+        single = parser.nbytes
+        assert single > 0
+        for value in range(20):
+            parser(f"id={value}", TYPES_MAP)
+        assert parser.nbytes <= 2000
+        assert len(parser) < 20
+        assert parser.stats.evictions > 0
+
+    def test_types_maps_released_with_entries(self):
+        """Test that a types map built per request does not outlive its cache entries."""
+
+        class TypesMap(dict):
+            pass
+
+        parser = CachingParser(Parser(tables_size=1), maxsize=2)
+        refs = []
+        for _ in range(100):
+            types_map = TypesMap(id=int)
+            refs.append(weakref.ref(types_map))
+            parser("id=1", types_map)
+        del types_map
+        gc.collect()
+        assert sum(ref() is not None for ref in refs) <= 3
+        parser.clear()
+        gc.collect()
+        assert sum(ref() is not None for ref in refs) <= 1
+
+    def test_errors_are_not_cached(self):
+        """Test that invalid queries raise every time."""
+        inner = CountingParser()
+        parser = CachingParser(inner)
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                parser("id=x", TYPES_MAP)
+        assert inner.calls == 2
+        assert len(parser) == 0
+
+    def test_clear(self):
+        """Test clearing the cache."""
+        parser = CachingParser(Parser())
+        parser("id=1", TYPES_MAP)
+        parser.clear()
+        assert len(parser) == 0
+        assert parser.nbytes == 0
+
+
+class TestBatch:
+    """Test class for Parser.batch."""
+
+    QUERIES = [
+        "id=1&order_by=-score&limit=10",
+        {"name__ilike": "a%", "limit": "10"},
+        "id=1&order_by=-score&limit=20",
+        "",
+    ]
+
+    def test_batch_implements_contract(self):
+        """Test that Parser.batch satisfies BatchParserContract."""
+        batch: BatchParserContract = Parser().batch
+        assert len(batch(self.QUERIES, TYPES_MAP)) == 4
+
+    def test_matches_single_parses(self):
+        """Test that batch results equal individual parses."""
+        parser = Parser()
+        expected = [tuple(parser(query, TYPES_MAP)) for query in self.QUERIES]
+        assert parser.batch(self.QUERIES, TYPES_MAP) == expected
+
+    def test_repeated_parameters_are_shared(self):
+        """Test that identical parameters yield the same clause objects."""
+        result = Parser().batch(self.QUERIES, TYPES_MAP)
+        assert result[0][0] is result[2][0]
+        assert result[0][1] is result[2][1]
+        assert result[0][2] is not result[2][2]
+        assert result[0][2] is result[1][1]
+
+    def test_accepts_iterators(self):
+        """Test that any iterable of queries is accepted."""
+        assert Parser().batch(iter(["id=1", "id=2"]), TYPES_MAP) == [(("id", EQ(1)),), (("id", EQ(2)),)]
+
+    def test_invalid_query_raises(self):
+        """Test that an invalid query fails the batch."""
+        with pytest.raises(ValueError):
+            Parser().batch(["id=1", "id=x"], TYPES_MAP)
+
+    def test_executor_dispatch(self):
+        """Test that large batches are split across an executor in order."""
+        queries = [f"id={index}&order_by=name" for index in range(10)]
+        parser = Parser(order_param="sort")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            result = parser.batch(
+                [query.replace("order_by", "sort") for query in queries], TYPES_MAP, executor, chunksize=3
+            )
+        assert [stream[0][1].value for stream in result] == list(range(10))
+        assert result[0][1] == ("name", ASC(0))
+
+    def test_process_pool_dispatch(self):
+        """Test that batches survive pickling to a process pool."""
+        queries = ["id__in=1,2&name__ilike=a%25&order_by=-id&limit=5", "id__range=1,3"] * 4
+        with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+            result = Parser().batch(queries, TYPES_MAP, executor, chunksize=3)
+        assert result == Parser().batch(queries, TYPES_MAP)
+
+    def test_small_batch_skips_executor(self):
+        """Test that batches up to chunksize are parsed in process."""
+
+        class FailingExecutor(concurrent.futures.Executor):
+            def submit(self, *args, **kwargs):
+                raise AssertionError("executor must not be used")
+
+        assert len(Parser().batch(["id=1"], TYPES_MAP, FailingExecutor(), chunksize=1)) == 1
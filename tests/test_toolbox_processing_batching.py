@@ -0,0 +1,148 @@
+"""
+Tests for the toolbox.processing.batching module.
+"""
+
+import asyncio
+import contextlib
+
+import pytest
+
+from zodchy.codex.cqea import Command, Event
+from zodchy.toolbox.processing import (
+    AsyncBatcher,
+    AsyncPipeline,
+    AsyncUnbatcher,
+    Batch,
+    SyncBatcher,
+    SyncPipeline,
+    SyncUnbatcher,
+)
+
+
+class Item(Event):
+    def __init__(self, value: int):
+        self.value = value
+
+
+class Store(Command):
+    def __init__(self, value: int):
+        self.value = value
+
+
+async def source(*delays: float, closed: list | None = None):
+    try:
+        for index, delay in enumerate(delays):
+            await asyncio.sleep(delay)
+            yield Item(index)
+    finally:
+        if closed is not None:
+            closed.append(True)
+
+
+def values(batch):
+    return [message.value for message in batch]
+
+
+class TestBatch:
+    """Test class for Batch."""
+
+    def test_container(self):
+        """Test that a batch exposes its messages."""
+        batch = Batch(Item(1), Store(2))
+        assert len(batch) == 2
+        assert values(batch) == [1, 2]
+        assert isinstance(batch.messages, tuple)
+
+
+class TestAsyncBatcher:
+    """Test class for AsyncBatcher."""
+
+    async def test_groups_by_size(self):
+        """Test that batches are flushed at max_size and at the end of the stream."""
+        batches = [batch async for batch in AsyncBatcher(max_size=2)(source(0, 0, 0, 0, 0))]
+        assert [values(batch) for batch in batches] == [[0, 1], [2, 3], [4]]
+
+    async def test_flushes_on_latency(self):
+        """Test that a partial batch is flushed once max_latency elapses."""
+        batcher = AsyncBatcher(max_size=10, max_latency=0.02)
+        batches = [batch async for batch in batcher(source(0, 0, 0.1, 0))]
+        assert [values(batch) for batch in batches] == [[0, 1], [2, 3]]
+
+    async def test_timeout_does_not_lose_messages(self):
+        """Test that a pull outliving the timeout is resumed, not cancelled."""
+        batcher = AsyncBatcher(max_size=3, max_latency=0.005)
+        batches = [values(batch) async for batch in batcher(source(0, 0.02, 0.02, 0, 0))]
+        assert [value for batch in batches for value in batch] == [0, 1, 2, 3, 4]
+        assert batches[0] == [0]
+
+    async def test_empty_stream(self):
+        """Test that an empty stream yields no batches."""
+        assert [batch async for batch in AsyncBatcher(max_latency=0.01)(source())] == []
+
+    async def test_consumer_stop_closes_upstream(self):
+        """Test that closing the stage closes upstream and drops the pending pull."""
+        closed = []
+        batcher = AsyncBatcher(max_size=10, max_latency=0.01)
+        async with contextlib.aclosing(batcher(source(0, 10, closed=closed))) as stream:
+            assert values(await anext(stream)) == [0]
+        assert closed == [True]
+
+    async def test_roundtrip_through_pipeline(self):
+        """Test batching and unbatching in a pipeline."""
+        seen = []
+
+        async def persist(stream, **kwargs):
+            async for batch in stream:
+                seen.append(len(batch))
+                yield batch
+
+        pipeline = AsyncPipeline(AsyncBatcher(max_size=2), persist, AsyncUnbatcher())
+        result = [message.value async for message in pipeline(Store(1), Store(2), Store(3))]
+        assert result == [1, 2, 3]
+        assert seen == [2, 1]
+
+
+class TestSyncBatcher:
+    """Test class for SyncBatcher."""
+
+    def test_groups_by_size(self):
+        """Test that batches are flushed at max_size and at the end of the stream."""
+        batches = list(SyncBatcher(max_size=3)(Item(value) for value in range(7)))
+        assert [values(batch) for batch in batches] == [[0, 1, 2], [3, 4, 5], [6]]
+
+    def test_flushes_on_latency(self, monkeypatch):
+        """Test that an old partial batch is flushed when the next message arrives."""
+        now = iter([0.0, 0.5, 2.0, 2.0, 2.1])
+        monkeypatch.setattr("zodchy.toolbox.processing.batching.time.monotonic", lambda: next(now))
+        batches = list(SyncBatcher(max_size=10, max_latency=1.0)(Item(value) for value in range(3)))
+        assert [values(batch) for batch in batches] == [[0, 1], [2]]
+
+    def test_roundtrip_through_pipeline(self):
+        """Test batching and unbatching in a sync pipeline."""
+        pipeline = SyncPipeline(SyncBatcher(max_size=2), SyncUnbatcher())
+        assert [message.value for message in pipeline(Item(1), Item(2), Item(3))] == [1, 2, 3]
+
+
+class TestUnbatchers:
+    """Test class for the unbatching stages."""
+
+    async def test_async_passes_plain_messages(self):
+        """Test that non-batch messages pass through."""
+
+        async def mixed():
+            yield Batch(Item(1), Item(2))
+            yield Item(3)
+
+        assert [message.value async for message in AsyncUnbatcher()(mixed())] == [1, 2, 3]
+
+    def test_sync_passes_plain_messages(self):
+        """Test that non-batch messages pass through."""
+        assert [message.value for message in SyncUnbatcher()([Batch(Item(1)), Item(2)])] == [1, 2]
+
+
+@pytest.mark.parametrize("cls", [AsyncBatcher, SyncBatcher])
+@pytest.mark.parametrize("kwargs", [{"max_size": 0}, {"max_latency": 0}])
+def test_invalid_arguments(cls, kwargs):
+    """Test that invalid limits are rejected."""
+    with pytest.raises(ValueError):
+        cls(**kwargs)
@@ -0,0 +1,218 @@
+"""
+Tests for the toolbox.processing.bridge module.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+
+import pytest
+
+from zodchy.codex.cqea import Event
+from zodchy.toolbox.processing import AsyncPipeline, EventLoopThread, ThreadPoolStage
+
+
+class Item(Event):
+    def __init__(self, value: int):
+        self.value = value
+
+
+async def source(count: int, closed: list | None = None, fail_at: int | None = None):
+    try:
+        for index in range(count):
+            if index == fail_at:
+                raise RuntimeError("upstream")
+            yield Item(index)
+    finally:
+        if closed is not None:
+            closed.append(True)
+
+
+def double(stream, factor=2):
+    for message in stream:
+        yield Item(message.value * factor)
+
+
+def blocking(stream):
+    for message in stream:
+        time.sleep(0.02)
+        yield message
+
+
+def failing(stream):
+    for message in stream:
+        if message.value == 2:
+            raise ValueError("stage")
+        yield message
+
+
+def values(messages):
+    return [message.value for message in messages]
+
+
+class TestThreadPoolStage:
+    """Test class for ThreadPoolStage."""
+
+    async def test_runs_sync_processor(self):
+        """Test that a sync processor transforms an async stream in order."""
+        stage = ThreadPoolStage(double, prefetch=4)
+        assert values([m async for m in stage(source(50))]) == [i * 2 for i in range(50)]
+
+    async def test_forwards_arguments(self):
+        """Test that extra arguments reach the sync processor."""
+        stage = ThreadPoolStage(double)
+        assert values([m async for m in stage(source(3), factor=10)]) == [0, 10, 20]
+
+    async def test_runs_off_loop_thread(self):
+        """Test that the processor runs in a worker thread."""
+        threads = []
+
+        def record(stream):
+            for message in stream:
+                threads.append(threading.current_thread())
+                yield message
+
+        [m async for m in ThreadPoolStage(record)(source(2))]
+        assert threads and all(thread is not threading.current_thread() for thread in threads)
+
+    async def test_does_not_block_loop(self):
+        """Test that the event loop keeps running while a sync stage blocks."""
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        try:
+            [m async for m in ThreadPoolStage(blocking)(source(5))]
+        finally:
+            task.cancel()
+        assert ticks >= 5
+
+    async def test_custom_executor(self):
+        """Test that a supplied executor runs the processor."""
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="bridge") as executor:
+            names = []
+
+            def record(stream):
+                for message in stream:
+                    names.append(threading.current_thread().name)
+                    yield message
+
+            [m async for m in ThreadPoolStage(record, executor=executor)(source(2))]
+        assert all(name.startswith("bridge") for name in names)
+
+    async def test_processor_error(self):
+        """Test that an exception raised by the processor reaches the consumer."""
+        stage = ThreadPoolStage(failing)
+        received = []
+        with pytest.raises(ValueError, match="stage"):
+            async for message in stage(source(5)):
+                received.append(message)
+        assert values(received) == [0, 1]
+
+    async def test_upstream_error(self):
+        """Test that an upstream exception propagates through the stage."""
+        stage = ThreadPoolStage(double)
+        with pytest.raises(RuntimeError, match="upstream"):
+            [m async for m in stage(source(5, fail_at=3))]
+
+    async def test_early_close(self):
+        """Test that stopping early releases the worker and closes upstream."""
+        closed = []
+        stream = ThreadPoolStage(double, prefetch=2)(source(1000, closed))
+        assert (await anext(stream)).value == 0
+        await stream.aclose()
+        assert closed == [True]
+
+    async def test_in_pipeline(self):
+        """Test that the stage composes with async stages."""
+
+        async def increment(stream, **kwargs):
+            async for message in stream:
+                yield Item(message.value + 1)
+
+        pipeline = AsyncPipeline(increment, ThreadPoolStage(double), increment)
+        assert values([m async for m in pipeline(Item(1), Item(2))]) == [5, 7]
+
+    def test_invalid_prefetch(self):
+        """Test that a non-positive prefetch is rejected."""
+        with pytest.raises(ValueError):
+            ThreadPoolStage(double, prefetch=0)
+
+
+class TestEventLoopThread:
+    """Test class for EventLoopThread."""
+
+    def test_iterate(self):
+        """Test that an async stream is consumed from sync code."""
+        with EventLoopThread(prefetch=4) as runner:
+            assert values(runner.iterate(source(20))) == list(range(20))
+
+    def test_reuses_loop(self):
+        """Test that consecutive calls share one event loop."""
+        with EventLoopThread() as runner:
+
+            async def current():
+                return asyncio.get_running_loop()
+
+            assert runner.run(current()) is runner.run(current()) is runner.loop
+
+    def test_wrap_pipeline(self):
+        """Test that an async pipeline is exposed as a sync pipeline."""
+
+        async def triple(stream, factor=3):
+            async for message in stream:
+                yield Item(message.value * factor)
+
+        with EventLoopThread() as runner:
+            pipeline = runner.wrap(AsyncPipeline(triple))
+            assert values(pipeline(Item(1), Item(2))) == [3, 6]
+            assert values(pipeline(Item(3), factor=2)) == [6]
+
+    def test_upstream_error(self):
+        """Test that an exception in the async stream surfaces in sync code."""
+        with EventLoopThread() as runner, pytest.raises(RuntimeError, match="upstream"):
+            list(runner.iterate(source(5, fail_at=1)))
+
+    def test_early_close(self):
+        """Test that abandoning iteration closes the async stream."""
+        closed = []
+        with EventLoopThread(prefetch=2) as runner:
+            iterator = runner.iterate(source(1000, closed))
+            assert next(iterator).value == 0
+            iterator.close()
+            deadline = time.monotonic() + 1
+            while not closed and time.monotonic() < deadline:
+                time.sleep(0.01)
+        assert closed == [True]
+
+    def test_own_thread_rejected(self):
+        """Test that driving the runner from its own loop raises."""
+        with EventLoopThread() as runner:
+
+            async def nested():
+                return runner.run(asyncio.sleep(0))
+
+            with pytest.raises(RuntimeError, match="own loop"):
+                runner.run(nested())
+
+    def test_stop_restarts_lazily(self):
+        """Test that a stopped runner starts a fresh loop on demand."""
+        runner = EventLoopThread()
+        first = runner.loop
+        runner.stop()
+        assert first.is_closed()
+        try:
+            assert runner.loop is not first
+        finally:
+            runner.stop()
+
+    def test_invalid_prefetch(self):
+        """Test that a non-positive prefetch is rejected."""
+        with pytest.raises(ValueError):
+            EventLoopThread(prefetch=0)
@@ -0,0 +1,111 @@
+"""
+Tests for the toolbox.processing.buffer module.
+"""
+
+import asyncio
+
+import pytest
+
+from zodchy.codex.cqea import Event
+from zodchy.toolbox.processing import AsyncPipeline, BufferStage
+
+
+class Tick(Event):
+    def __init__(self, key: str, value: int):
+        self.key = key
+        self.value = value
+
+
+async def burst(count: int, keys: str = "k", closed: list | None = None, fail_at: int | None = None):
+    try:
+        for index in range(count):
+            if index == fail_at:
+                raise RuntimeError("upstream")
+            yield Tick(keys[index % len(keys)], index)
+    finally:
+        if closed is not None:
+            closed.append(True)
+
+
+async def drain_slowly(stream, delay: float = 0.0):
+    # Let the feeder run ahead so the buffer fills before anything is consumed.
+    await asyncio.sleep(0.01)
+    output = []
+    async for message in stream:
+        output.append(message.value)
+        await asyncio.sleep(delay)
+    return output
+
+
+class TestBufferStage:
+    """Test class for BufferStage."""
+
+    async def test_block_keeps_everything(self):
+        """Test that the block policy delivers every message in order."""
+        stage = BufferStage(maxsize=3)
+        assert await drain_slowly(stage(burst(20))) == list(range(20))
+        assert stage.stats.high_water_mark == 3
+        assert stage.stats.blocked > 0
+        assert stage.stats.dropped == 0
+        assert stage.stats.received == stage.stats.emitted == 20
+
+    async def test_drop_newest(self):
+        """Test that drop_newest discards arrivals while full."""
+        stage = BufferStage(maxsize=3, policy="drop_newest")
+        assert await drain_slowly(stage(burst(10))) == [0, 1, 2]
+        assert stage.stats.dropped == 7
+        assert stage.stats.high_water_mark == 3
+
+    async def test_drop_oldest(self):
+        """Test that drop_oldest evicts the oldest buffered message."""
+        stage = BufferStage(maxsize=3, policy="drop_oldest")
+        assert await drain_slowly(stage(burst(10))) == [7, 8, 9]
+        assert stage.stats.dropped == 7
+
+    async def test_coalesce(self):
+        """Test that coalescing keeps the latest message per key in first-seen order."""
+        stage = BufferStage(maxsize=2, policy="coalesce", key=lambda message: message.key)
+        assert await drain_slowly(stage(burst(10, keys="ab"))) == [8, 9]
+        assert stage.stats.coalesced == 8
+        assert stage.stats.high_water_mark == 2
+
+    async def test_coalesce_blocks_new_keys(self):
+        """Test that a new key waits for space instead of dropping."""
+        stage = BufferStage(maxsize=2, policy="coalesce", key=lambda message: message.key)
+        output = await drain_slowly(stage(burst(6, keys="abc")))
+        assert sorted(output)[-3:] == [3, 4, 5]
+        assert stage.stats.dropped == 0
+        assert stage.stats.blocked > 0
+
+    async def test_upstream_error_after_buffered(self):
+        """Test that buffered messages are delivered before the upstream error."""
+        stage = BufferStage(maxsize=10)
+        output = []
+        with pytest.raises(RuntimeError, match="upstream"):
+            async for message in stage(burst(5, fail_at=3)):
+                output.append(message.value)
+        assert output == [0, 1, 2]
+
+    async def test_early_close(self):
+        """Test that closing the stage closes the upstream."""
+        closed = []
+        stream = BufferStage(maxsize=2)(burst(100, closed=closed))
+        await anext(stream)
+        await stream.aclose()
+        assert closed == [True]
+
+    async def test_in_pipeline(self):
+        """Test that the stage composes with a pipeline."""
+        pipeline = AsyncPipeline(BufferStage(maxsize=1))
+        assert [m.value async for m in pipeline(Tick("k", 1), Tick("k", 2))] == [1, 2]
+
+    def test_invalid_arguments(self):
+        """Test that bad configurations are rejected."""
+        with pytest.raises(ValueError):
+            BufferStage(maxsize=0)
+        with pytest.raises(ValueError):
+            BufferStage(policy="spill")
+        with pytest.raises(ValueError):
+            BufferStage(policy="coalesce")
+        with pytest.raises(ValueError):
+            BufferStage(key=lambda message: message)
@@ -0,0 +1,135 @@
+"""
+Tests for the toolbox.processing.dispatch module.
+"""
+
+import pytest
+
+from zodchy.codex.cqea import Command, Error, Event, Message, Query, View
+from zodchy.toolbox.processing import Dispatcher
+
+
+class CreateUser(Command):
+    pass
+
+
+class CreateAdmin(CreateUser):
+    pass
+
+
+class UserCreated(Event):
+    pass
+
+
+class UserView(View):
+    def data(self):
+        return {}
+
+
+class GetUser(Query):
+    def __iter__(self):
+        return iter(())
+
+
+class Failed(Error):
+    pass
+
+
+class External:
+    pass
+
+
+Event.register(External)
+
+
+def name(label):
+    return lambda message, *args, **kwargs: (label, args, kwargs)
+
+
+class TestDispatcher:
+    """Test class for Dispatcher."""
+
+    def test_exact_type(self):
+        """Test that a handler registered on the concrete type is used."""
+        dispatcher = Dispatcher()
+        dispatcher.register(CreateUser, name("create"))
+        assert dispatcher(CreateUser())[0] == "create"
+
+    def test_nearest_ancestor_wins(self):
+        """Test that the most specific registered ancestor handles a message."""
+        dispatcher = Dispatcher()
+        dispatcher.register(Message, name("message"))
+        dispatcher.register(Event, name("event"))
+        dispatcher.register(View, name("view"))
+        dispatcher.register(Command, name("command"))
+        assert dispatcher(UserView())[0] == "view"
+        assert dispatcher(UserCreated())[0] == "event"
+        assert dispatcher(CreateAdmin())[0] == "command"
+        assert dispatcher(GetUser())[0] == "message"
+        assert dispatcher(Failed())[0] == "message"
+
+    def test_registration_order_irrelevant(self):
+        """Test that a base registered after a subclass does not shadow it."""
+        dispatcher = Dispatcher()
+        dispatcher.register(CreateUser, name("user"))
+        dispatcher.register(Command, name("command"))
+        assert dispatcher(CreateAdmin())[0] == "user"
+
+    def test_virtual_subclass(self):
+        """Test that ABC-registered classes are routed despite missing from the MRO."""
+        dispatcher = Dispatcher()
+        dispatcher.register(Event, name("event"))
+        assert dispatcher(External())[0] == "event"
+
+    def test_decorator(self):
+        """Test that register works as a decorator."""
+        dispatcher = Dispatcher()
+
+        @dispatcher.register(Query)
+        def handle(message):
+            return "query"
+
+        assert dispatcher(GetUser()) == "query"
+        assert dispatcher.handlers[Query] is handle
+
+    def test_arguments_forwarded(self):
+        """Test that extra arguments reach the handler."""
+        dispatcher = Dispatcher()
+        dispatcher.register(Event, name("event"))
+        assert dispatcher(UserCreated(), 1, key="value") == ("event", (1,), {"key": "value"})
+
+    def test_default(self):
+        """Test that the default handler catches unrouted messages."""
+        dispatcher = Dispatcher(default=name("default"))
+        dispatcher.register(Command, name("command"))
+        assert dispatcher(UserCreated())[0] == "default"
+
+    def test_missing_handler(self):
+        """Test that an unrouted message without a default raises LookupError."""
+        dispatcher = Dispatcher()
+        dispatcher.register(Command, name("command"))
+        with pytest.raises(LookupError, match="UserCreated"):
+            dispatcher(UserCreated())
+
+    def test_resolve_and_contains(self):
+        """Test that resolve exposes the routing decision."""
+        dispatcher = Dispatcher()
+        handler = name("task")
+        dispatcher.register(Command, handler)
+        assert dispatcher.resolve(CreateAdmin) is handler
+        assert dispatcher.resolve(UserCreated) is None
+        assert CreateUser in dispatcher
+        assert UserCreated not in dispatcher
+
+    def test_register_invalidates_table(self):
+        """Test that registering after dispatch updates cached routes."""
+        dispatcher = Dispatcher()
+        dispatcher.register(Command, name("command"))
+        assert dispatcher(CreateAdmin())[0] == "command"
+        dispatcher.register(CreateAdmin, name("admin"))
+        assert dispatcher(CreateAdmin())[0] == "admin"
+
+    def test_handlers_read_only(self):
+        """Test that the handlers mapping cannot be mutated."""
+        dispatcher = Dispatcher()
+        with pytest.raises(TypeError):
+            dispatcher.handlers[Event] = name("event")
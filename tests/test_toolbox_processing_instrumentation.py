@@ -0,0 +1,195 @@
+"""
+Tests for the toolbox.processing.instrumentation module.
+"""
+
+import pytest
+
+from zodchy.codex.cqea import Event
+from zodchy.toolbox.processing import (
+    AsyncInstrumentedStage,
+    AsyncPipeline,
+    Histogram,
+    StatsCollector,
+    SyncInstrumentedStage,
+    SyncPipeline,
+)
+
+
+class Item(Event):
+    def __init__(self, value: int):
+        self.value = value
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+async def slow_source(clock, count, delay):
+    for index in range(count):
+        clock.now += delay
+        yield Item(index)
+
+
+def slow_sync_source(clock, count, delay):
+    for index in range(count):
+        clock.now += delay
+        yield Item(index)
+
+
+def make_async_worker(clock, cost):
+    async def worker(stream, **kwargs):
+        async for message in stream:
+            clock.now += cost
+            if message.value % 2 == 0:
+                yield message
+
+    return worker
+
+
+def make_sync_worker(clock, cost):
+    def worker(stream, **kwargs):
+        for message in stream:
+            clock.now += cost
+            if message.value % 2 == 0:
+                yield message
+
+    return worker
+
+
+class TestHistogram:
+    """Test class for Histogram."""
+
+    def test_empty(self):
+        """Test that an empty histogram reports zero."""
+        assert Histogram().percentile(99) == 0.0
+
+    def test_percentiles_within_error(self):
+        """Test that percentiles stay within the bucket growth factor."""
+        histogram = Histogram(growth=1.01)
+        for value in range(1, 1001):
+            histogram.add(value / 1000)
+        assert histogram.count == 1000
+        assert histogram.percentile(50) == pytest.approx(0.5, rel=0.011)
+        assert histogram.percentile(95) == pytest.approx(0.95, rel=0.011)
+        assert histogram.percentile(99) == pytest.approx(0.99, rel=0.011)
+        assert histogram.percentile(100) == histogram.max == 1.0
+
+    def test_tiny_values(self):
+        """Test that values below the resolution share the first bucket."""
+        histogram = Histogram(resolution=1e-3)
+        histogram.add(0.0)
+        histogram.add(1e-6)
+        assert histogram.percentile(100) == 1e-6
+
+    def test_invalid_arguments(self):
+        """Test that bad parameters are rejected."""
+        with pytest.raises(ValueError):
+            Histogram(resolution=0)
+        with pytest.raises(ValueError):
+            Histogram(growth=1)
+        with pytest.raises(ValueError):
+            Histogram().percentile(101)
+
+
+class TestStatsCollector:
+    """Test class for StatsCollector."""
+
+    def test_aggregates(self):
+        """Test that records accumulate per stage."""
+        collector = StatsCollector()
+        collector.record("a", 2, 1, 0.5, 1.5)
+        collector.record("a", 1, 0, 0.5, 0.5)
+        stats = collector["a"]
+        assert (stats.received, stats.emitted, stats.waiting, stats.working) == (3, 1, 1.0, 2.0)
+        assert stats.throughput == pytest.approx(1 / 3)
+        assert stats.latency.count == 1
+        assert stats.p50 == stats.p95 == stats.p99 == pytest.approx(1.5, rel=0.05)
+
+    def test_clear(self):
+        """Test that clear drops all stages."""
+        collector = StatsCollector()
+        collector.record("a", 1, 1, 0.0, 0.0)
+        collector.clear()
+        assert dict(collector.stages) == {}
+
+
+class TestAsyncInstrumentedStage:
+    """Test class for AsyncInstrumentedStage."""
+
+    async def test_splits_waiting_and_working(self):
+        """Test that upstream time and stage time are reported separately."""
+        clock = Clock()
+        collector = StatsCollector()
+        stage = AsyncInstrumentedStage(make_async_worker(clock, 2.0), collector, "worker", clock)
+        output = [message.value async for message in stage(slow_source(clock, 5, 1.0))]
+        assert output == [0, 2, 4]
+        stats = collector["worker"]
+        assert (stats.received, stats.emitted) == (5, 3)
+        assert stats.waiting == pytest.approx(5.0)
+        assert stats.working == pytest.approx(10.0)
+        assert stats.p99 <= 4.0 * 1.05
+
+    async def test_default_name(self):
+        """Test that the stage is named after the processor."""
+        stage = AsyncInstrumentedStage(make_async_worker(Clock(), 0), StatsCollector())
+        assert stage.name.endswith("worker")
+
+    async def test_pipeline_collector(self):
+        """Test that a pipeline instruments every stage when given a collector."""
+        clock = Clock()
+        collector = StatsCollector()
+        pipeline = AsyncPipeline(make_async_worker(clock, 1.0), make_async_worker(clock, 1.0), collector=collector)
+        assert [m.value async for m in pipeline(*(Item(i) for i in range(4)))] == [0, 2]
+        first, second = (collector[name] for name in sorted(collector.stages))
+        assert (first.received, first.emitted) == (4, 2)
+        assert (second.received, second.emitted) == (2, 2)
+        assert second.waiting >= first.working
+
+    async def test_pipeline_without_collector(self):
+        """Test that pipelines run processors unwrapped by default."""
+        worker = make_async_worker(Clock(), 0)
+        assert AsyncPipeline(worker)._stages == (worker,)
+
+    async def test_early_close(self):
+        """Test that closing the stage closes the wrapped processor."""
+        closed = []
+
+        async def worker(stream, **kwargs):
+            try:
+                async for message in stream:
+                    yield message
+            finally:
+                closed.append(True)
+
+        stream = AsyncInstrumentedStage(worker, StatsCollector())(slow_source(Clock(), 10, 0))
+        await anext(stream)
+        await stream.aclose()
+        assert closed == [True]
+
+
+class TestSyncInstrumentedStage:
+    """Test class for SyncInstrumentedStage."""
+
+    def test_splits_waiting_and_working(self):
+        """Test that upstream time and stage time are reported separately."""
+        clock = Clock()
+        collector = StatsCollector()
+        stage = SyncInstrumentedStage(make_sync_worker(clock, 3.0), collector, "worker", clock)
+        assert [message.value for message in stage(slow_sync_source(clock, 4, 1.0))] == [0, 2]
+        stats = collector["worker"]
+        assert (stats.received, stats.emitted) == (4, 2)
+        assert stats.waiting == pytest.approx(4.0)
+        assert stats.working == pytest.approx(12.0)
+
+    def test_pipeline_collector(self):
+        """Test that a sync pipeline instruments every stage when given a collector."""
+        collector = StatsCollector()
+        pipeline = SyncPipeline(make_sync_worker(Clock(), 0), collector=collector)
+        assert [m.value for m in pipeline(Item(0), Item(1))] == [0]
+        (stats,) = collector.stages.values()
+        assert (stats.received, stats.emitted) == (2, 1)
+        assert next(iter(collector.stages)).startswith("0:")
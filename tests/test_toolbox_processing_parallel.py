@@ -0,0 +1,155 @@
+"""
+Tests for the toolbox.processing.parallel module.
+"""
+
+import asyncio
+import contextlib
+
+import pytest
+
+from zodchy.codex.cqea import Event
+from zodchy.toolbox.processing import AsyncPipeline, ParallelStage
+
+
+class Item(Event):
+    def __init__(self, value: int):
+        self.value = value
+
+
+class Source:
+    """Async source that records how many messages were pulled and whether it was closed."""
+
+    def __init__(self, count: int):
+        self.count = count
+        self.pulled = 0
+        self.closed = False
+
+    async def stream(self):
+        try:
+            for value in range(self.count):
+                self.pulled += 1
+                yield Item(value)
+        finally:
+            self.closed = True
+
+
+class Tracker:
+    """Processor that sleeps per message and tracks concurrency."""
+
+    def __init__(self, delay=lambda value: 0.001):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.cancelled = 0
+
+    async def __call__(self, stream, **kwargs):
+        async for message in stream:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            try:
+                await asyncio.sleep(self.delay(message.value))
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                raise
+            finally:
+                self.active -= 1
+            yield Item(message.value * kwargs.get("factor", 1))
+
+
+async def collect(stream):
+    return [message.value async for message in stream]
+
+
+class TestParallelStage:
+    """Test class for ParallelStage."""
+
+    async def test_preserves_order(self):
+        """Test that ordered mode yields in input order despite uneven latency."""
+        tracker = Tracker(delay=lambda value: 0.001 * (10 - value))
+        stage = ParallelStage(tracker, workers=4)
+        assert await collect(stage(Source(10).stream())) == list(range(10))
+        assert tracker.peak == 4
+
+    async def test_unordered(self):
+        """Test that unordered mode yields every result as soon as it is ready."""
+        tracker = Tracker(delay=lambda value: 0.001 * (10 - value))
+        result = await collect(ParallelStage(tracker, workers=4, ordered=False)(Source(10).stream()))
+        assert sorted(result) == list(range(10))
+        assert result != list(range(10))
+
+    async def test_kwargs_are_forwarded(self):
+        """Test that stage arguments reach the wrapped processor."""
+        stage = ParallelStage(Tracker(), workers=2)
+        assert await collect(stage(Source(3).stream(), factor=10)) == [0, 10, 20]
+
+    async def test_inside_pipeline(self):
+        """Test the stage as a pipeline processor."""
+        pipeline = AsyncPipeline(ParallelStage(Tracker(), workers=3))
+        assert await collect(pipeline(Item(1), Item(2), factor=2)) == [2, 4]
+
+    async def test_fan_out_and_filtering(self):
+        """Test processors that emit zero or several messages per input."""
+
+        async def fan(stream, **kwargs):
+            async for message in stream:
+                for _ in range(message.value % 3):
+                    yield message
+
+        for ordered in (True, False):
+            result = await collect(ParallelStage(fan, workers=2, ordered=ordered)(Source(6).stream()))
+            assert sorted(result) == [1, 2, 2, 4, 5, 5]
+
+    async def test_backpressure(self):
+        """Test that a slow consumer bounds how far upstream is read."""
+        source = Source(1000)
+        stage = ParallelStage(Tracker(delay=lambda value: 0), workers=2, buffer=4)
+        async with contextlib.aclosing(stage(source.stream())) as stream:
+            await anext(stream)
+            await asyncio.sleep(0.01)
+            assert source.pulled <= 1 + 4 + 2 + 2
+
+    async def test_consumer_stop_cancels_workers_and_upstream(self):
+        """Test that closing the stage cancels in-flight work and closes upstream."""
+        source = Source(1000)
+        tracker = Tracker(delay=lambda value: 0 if value == 0 else 10)
+        for ordered in (True, False):
+            async with contextlib.aclosing(
+                ParallelStage(tracker, workers=3, ordered=ordered)(source.stream())
+            ) as stream:
+                assert (await anext(stream)).value == 0
+                await asyncio.sleep(0.01)
+            assert source.closed
+            assert tracker.active == 0
+        assert tracker.cancelled > 0
+
+    async def test_processor_error(self):
+        """Test that processor errors propagate to the consumer."""
+
+        async def failing(stream, **kwargs):
+            async for message in stream:
+                if message.value == 2:
+                    raise RuntimeError("boom")
+                yield message
+
+        for ordered in (True, False):
+            with pytest.raises(RuntimeError, match="boom"):
+                await collect(ParallelStage(failing, workers=2, ordered=ordered)(Source(5).stream()))
+
+    async def test_upstream_error(self):
+        """Test that upstream errors propagate after preceding results."""
+
+        async def upstream():
+            yield Item(1)
+            raise RuntimeError("upstream")
+
+        received = []
+        with pytest.raises(RuntimeError, match="upstream"):
+            async for message in ParallelStage(Tracker(), workers=2)(upstream()):
+                received.append(message.value)
+        assert received == [1]
+
+    @pytest.mark.parametrize("kwargs", [{"workers": 0}, {"buffer": 0}])
+    def test_invalid_arguments(self, kwargs):
+        """Test that invalid sizes are rejected."""
+        with pytest.raises(ValueError):
+            ParallelStage(Tracker(), **kwargs)
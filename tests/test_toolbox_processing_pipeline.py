@@ -0,0 +1,112 @@
+"""
+Tests for the toolbox.processing.pipeline module.
+"""
+
+from collections.abc import AsyncIterator, Iterator
+
+from zodchy.codex.cqea import Command, Event, Message
+from zodchy.toolbox.processing import (
+    AsyncPipeline,
+    AsyncPipelineContract,
+    SyncPipeline,
+    SyncPipelineContract,
+)
+
+
+class Created(Event):
+    def __init__(self, value: int):
+        self.value = value
+
+
+class Create(Command):
+    def __init__(self, value: int):
+        self.value = value
+
+
+async def handle(stream: AsyncIterator[Message], **kwargs) -> AsyncIterator[Message]:
+    async for message in stream:
+        if isinstance(message, Create):
+            yield Created(message.value * kwargs.get("factor", 1))
+        else:
+            yield message
+
+
+async def drop_odd(stream: AsyncIterator[Message], **kwargs) -> AsyncIterator[Message]:
+    async for message in stream:
+        if message.value % 2 == 0:
+            yield message
+
+
+async def duplicate(stream: AsyncIterator[Message], **kwargs) -> AsyncIterator[Message]:
+    async for message in stream:
+        yield message
+        yield message
+
+
+def sync_handle(stream, **kwargs) -> Iterator[Message]:
+    for message in stream:
+        yield Created(message.value * kwargs.get("factor", 1)) if isinstance(message, Create) else message
+
+
+def sync_drop_odd(stream, **kwargs) -> Iterator[Message]:
+    return (message for message in stream if message.value % 2 == 0)
+
+
+class TestAsyncPipeline:
+    """Test class for AsyncPipeline."""
+
+    async def test_runs_processors_in_order(self):
+        """Test that messages flow through every stage in order."""
+        pipeline: AsyncPipelineContract = AsyncPipeline(handle, drop_odd, duplicate)
+        result = [message.value async for message in pipeline(Create(1), Create(2), Created(4))]
+        assert result == [2, 2, 4, 4]
+
+    async def test_kwargs_are_passed_to_processors(self):
+        """Test that call kwargs reach every processor."""
+        pipeline = AsyncPipeline(handle)
+        result = [message.value async for message in pipeline(Create(2), factor=3)]
+        assert result == [6]
+
+    async def test_empty_pipeline(self):
+        """Test that a pipeline without processors echoes its input."""
+        messages = [Create(1), Create(2)]
+        assert [message async for message in AsyncPipeline()(*messages)] == messages
+
+    async def test_run_over_existing_stream(self):
+        """Test running a pipeline over an upstream async iterator."""
+
+        async def upstream():
+            for value in range(4):
+                yield Created(value)
+
+        pipeline = AsyncPipeline(drop_odd)
+        assert [message.value async for message in pipeline.run(upstream())] == [0, 2]
+        assert pipeline.processors == (drop_odd,)
+
+    async def test_lazy(self):
+        """Test that stages run only as the consumer pulls."""
+        pulled = []
+
+        async def record(stream, **kwargs):
+            async for message in stream:
+                pulled.append(message.value)
+                yield message
+
+        stream = AsyncPipeline(record)(Created(1), Created(2), Created(3))
+        assert pulled == []
+        await anext(stream)
+        assert pulled == [1]
+
+
+class TestSyncPipeline:
+    """Test class for SyncPipeline."""
+
+    def test_runs_processors_in_order(self):
+        """Test that messages flow through every stage in order."""
+        pipeline: SyncPipelineContract = SyncPipeline(sync_handle, sync_drop_odd)
+        assert [message.value for message in pipeline(Create(1), Create(2), factor=2)] == [2, 4]
+
+    def test_empty_pipeline(self):
+        """Test that a pipeline without processors echoes its input."""
+        messages = [Create(1)]
+        assert list(SyncPipeline()(*messages)) == messages
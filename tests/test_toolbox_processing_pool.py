@@ -0,0 +1,130 @@
+"""
+Tests for the toolbox.processing.pool module.
+"""
+
+import concurrent.futures
+import os
+import threading
+
+import pytest
+
+from zodchy.codex.cqea import Event
+from zodchy.toolbox.processing import ProcessPoolStage, SyncPipeline
+
+
+class Item(Event):
+    def __init__(self, value: int):
+        self.value = value
+
+
+class Locked(Event):
+    def __init__(self):
+        self.lock = threading.Lock()
+
+
+def square(stream, *args, **kwargs):
+    for message in stream:
+        yield Item(message.value**2)
+
+
+def scale(stream, factor=1):
+    for message in stream:
+        yield Item(message.value * factor)
+
+
+def chunk_length(stream):
+    chunk = list(stream)
+    for _ in chunk:
+        yield Item(len(chunk))
+
+
+def fail(stream):
+    for message in stream:
+        if message.value == 3:
+            raise RuntimeError("boom")
+        yield message
+
+
+@pytest.fixture(scope="module")
+def executor():
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as pool:
+        yield pool
+
+
+def values(stream):
+    return [message.value for message in stream]
+
+
+class TestProcessPoolStage:
+    """Test class for ProcessPoolStage."""
+
+    def test_preserves_order(self, executor):
+        """Test that results come back in input order across chunks."""
+        stage = ProcessPoolStage(square, executor=executor, chunksize=3)
+        assert values(stage(Item(i) for i in range(20))) == [i**2 for i in range(20)]
+
+    def test_forwards_arguments(self, executor):
+        """Test that extra arguments reach the processor in the worker."""
+        stage = ProcessPoolStage(scale, executor=executor, chunksize=2)
+        assert values(stage(iter([Item(1), Item(2), Item(3)]), factor=10)) == [10, 20, 30]
+
+    def test_chunking(self, executor):
+        """Test that the processor receives messages in chunks of chunksize."""
+        stage = ProcessPoolStage(chunk_length, executor=executor, chunksize=4)
+        assert values(stage(Item(i) for i in range(10))) == [4] * 8 + [2] * 2
+
+    def test_empty_stream(self, executor):
+        """Test that an empty stream yields nothing."""
+        stage = ProcessPoolStage(square, executor=executor)
+        assert list(stage(iter([]))) == []
+
+    def test_small_prefetch(self, executor):
+        """Test that a prefetch window of one still yields everything."""
+        stage = ProcessPoolStage(square, executor=executor, chunksize=1, prefetch=1)
+        assert values(stage(Item(i) for i in range(5))) == [0, 1, 4, 9, 16]
+
+    def test_worker_error_propagates(self, executor):
+        """Test that an exception raised in a worker reaches the consumer."""
+        stage = ProcessPoolStage(fail, executor=executor, chunksize=2)
+        with pytest.raises(RuntimeError, match="boom"):
+            list(stage(Item(i) for i in range(6)))
+
+    def test_unpicklable_message(self, executor):
+        """Test that an unpicklable message is reported by its type."""
+        stage = ProcessPoolStage(square, executor=executor)
+        with pytest.raises(TypeError, match="Locked cannot be pickled"):
+            list(stage(iter([Item(1), Locked()])))
+
+    def test_unpicklable_processor(self):
+        """Test that a processor which cannot be pickled is rejected up front."""
+
+        def local(stream):
+            yield from stream
+
+        with pytest.raises(TypeError, match="cannot be pickled"):
+            ProcessPoolStage(local)
+
+    def test_invalid_arguments(self):
+        """Test that non-positive sizes are rejected."""
+        with pytest.raises(ValueError):
+            ProcessPoolStage(square, chunksize=0)
+        with pytest.raises(ValueError):
+            ProcessPoolStage(square, prefetch=0)
+
+    def test_shared_executor_not_shut_down(self, executor):
+        """Test that a supplied executor is left running."""
+        with ProcessPoolStage(square, executor=executor) as stage:
+            list(stage(iter([Item(1)])))
+        assert executor.submit(os.getpid).result() > 0
+
+    def test_owned_executor(self):
+        """Test that the stage creates and shuts down its own pool."""
+        with ProcessPoolStage(square, max_workers=1) as stage:
+            assert values(stage(Item(i) for i in range(3))) == [0, 1, 4]
+            assert stage._executor is not None
+        assert stage._executor is None
+
+    def test_in_pipeline(self, executor):
+        """Test that the stage composes with a sync pipeline."""
+        pipeline = SyncPipeline(ProcessPoolStage(square, executor=executor, chunksize=2))
+        assert values(pipeline(Item(1), Item(2), Item(3))) == [1, 4, 9]